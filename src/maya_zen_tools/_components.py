@@ -0,0 +1,342 @@
+from __future__ import annotations
+
+from itertools import compress, count
+from typing import Iterable, Iterator
+
+from maya_zen_tools.errors import InvalidSelectionError, TooManyShapesError
+
+# For each possible byte value, the indices of the bits which are set
+_BYTE_BIT_INDICES: tuple[tuple[int, ...], ...] = tuple(
+    tuple(bit_index for bit_index in range(8) if byte & (1 << bit_index))
+    for byte in range(256)
+)
+
+
+def _get_ids_bits(component_ids: Iterable[int]) -> int:
+    """
+    Given component IDs, return an integer bitset with the bit at each
+    component ID's index set.
+    """
+    component_ids = tuple(component_ids)
+    if not component_ids:
+        return 0
+    data: bytearray = bytearray((max(component_ids) >> 3) + 1)
+    component_id: int
+    for component_id in component_ids:
+        data[component_id >> 3] |= 1 << (component_id & 7)
+    return int.from_bytes(data, "little")
+
+
+def _iter_bits_ids(bits: int) -> Iterator[int]:
+    """
+    Given an integer bitset, yield the index of each set bit, in ascending
+    order.
+    """
+    data: bytes = bits.to_bytes((bits.bit_length() + 7) >> 3, "little")
+    byte_index: int
+    byte: int
+    bit_index: int
+    for byte_index, byte in enumerate(data):
+        if byte:
+            for bit_index in _BYTE_BIT_INDICES[byte]:
+                yield (byte_index << 3) + bit_index
+
+
+def parse_component(component: str) -> tuple[str, str, int, int]:
+    """
+    Given a component name, such as "pSphere1.vtx[5]" or "pSphere1.e[5:9]",
+    return the shape, component type, and first and last (inclusive)
+    component IDs.
+    """
+    shape: str
+    component_type: str
+    index: str
+    node_component, bracket, index = component.partition("[")
+    shape, component_type = node_component.rpartition(".")[::2]
+    if not (shape and component_type and bracket and index.endswith("]")):
+        raise InvalidSelectionError(component)
+    start: str
+    end: str
+    start, end = index[:-1].partition(":")[::2]
+    return shape, component_type, int(start), int(end or start)
+
+
+class ComponentSet:
+    """
+    A set of components of a single type, belonging to a single shape, stored
+    as an integer bitset of component IDs.
+
+    Component names are only generated when needed (when passing
+    components to `maya.cmds`, for example), so set operations on large
+    numbers of components are performed on integers rather than on strings.
+
+    Attributes:
+        shape: The shape (or transform) name used as a prefix when
+            formatting component names.
+        component_type: vtx | e | map | f
+        bits: An integer bitset, wherein each set bit's index is the ID of a
+            component in the set.
+    """
+
+    __slots__ = ("bits", "component_type", "shape")
+
+    def __init__(
+        self,
+        shape: str,
+        component_type: str,
+        component_ids: Iterable[int] = (),
+    ) -> None:
+        self.shape: str = shape
+        self.component_type: str = component_type
+        self.bits: int = _get_ids_bits(component_ids)
+
+    @classmethod
+    def from_bits(
+        cls, shape: str, component_type: str, bits: int
+    ) -> ComponentSet:
+        """
+        Create a component set from an integer bitset.
+        """
+        component_set: ComponentSet = cls(shape, component_type)
+        component_set.bits = bits
+        return component_set
+
+    @classmethod
+    def from_mask(
+        cls, shape: str, component_type: str, mask: Iterable[int]
+    ) -> ComponentSet:
+        """
+        Create a component set from a mask with one byte per component ID,
+        wherein each non-zero byte indicates the component is in the set
+        (the inverse of `get_mask`).
+        """
+        return cls(shape, component_type, compress(count(), mask))
+
+    @classmethod
+    def from_components(
+        cls, components: Iterable[str], component_type: str = ""
+    ) -> ComponentSet:
+        """
+        Create a component set from component names, which may be flattened
+        (as in "pSphere1.vtx[5]") or not (as in "pSphere1.vtx[5:9]").
+
+        Parameters:
+            components: Component names, all belonging to the same shape and
+                of the same type.
+            component_type: The component type. This is only needed if
+                `components` might be empty.
+        """
+        shape: str = ""
+        shapes: set[str] = set()
+        component_types: set[str] = set()
+        component_ids: list[int] = []
+        component: str
+        component_shape: str
+        component_type_: str
+        start: int
+        end: int
+        for component in components:
+            component_shape, component_type_, start, end = parse_component(
+                component
+            )
+            if component_shape != shape:
+                shape = component_shape
+                shapes.add(shape)
+            component_types.add(component_type_)
+            component_ids.extend(range(start, end + 1))
+        if len(shapes) > 1:
+            raise TooManyShapesError(tuple(sorted(shapes)))
+        if component_type:
+            component_types.add(component_type)
+        if len(component_types) > 1:
+            raise InvalidSelectionError(tuple(components))
+        return cls(
+            shape,
+            component_types.pop() if component_types else "",
+            component_ids,
+        )
+
+    def _get_other_bits(self, other: ComponentSet | Iterable[int]) -> int:
+        if isinstance(other, ComponentSet):
+            if (
+                other.bits
+                and self.bits
+                and (
+                    other.shape != self.shape
+                    or other.component_type != self.component_type
+                )
+            ):
+                raise ValueError(other)
+            if not self.shape:
+                # An empty set created without a shape adopts the shape and
+                # component type of the first set it is combined with
+                self.shape = other.shape
+                self.component_type = self.component_type or (
+                    other.component_type
+                )
+            return other.bits
+        return _get_ids_bits(other)
+
+    def copy(self) -> ComponentSet:
+        return self.from_bits(self.shape, self.component_type, self.bits)
+
+    def __repr__(self) -> str:
+        return (
+            f"{type(self).__name__}({self.shape!r}, "
+            f"{self.component_type!r}, {list(self)!r})"
+        )
+
+    def __len__(self) -> int:
+        return bin(self.bits).count("1")
+
+    def __bool__(self) -> bool:
+        return bool(self.bits)
+
+    def __iter__(self) -> Iterator[int]:
+        return _iter_bits_ids(self.bits)
+
+    def __contains__(self, component: object) -> bool:
+        if isinstance(component, str):
+            shape: str
+            component_type: str
+            start: int
+            end: int
+            shape, component_type, start, end = parse_component(component)
+            if (
+                shape != self.shape
+                or component_type != self.component_type
+                or start != end
+            ):
+                return False
+            component = start
+        if not isinstance(component, int) or component < 0:
+            return False
+        return bool((self.bits >> component) & 1)
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, ComponentSet):
+            return NotImplemented
+        return self.bits == other.bits and (
+            not self.bits
+            or (
+                self.shape == other.shape
+                and self.component_type == other.component_type
+            )
+        )
+
+    __hash__ = None  # type: ignore
+
+    def __or__(self, other: ComponentSet | Iterable[int]) -> ComponentSet:
+        bits: int = self._get_other_bits(other)
+        return self.from_bits(
+            self.shape, self.component_type, self.bits | bits
+        )
+
+    def __and__(self, other: ComponentSet | Iterable[int]) -> ComponentSet:
+        bits: int = self._get_other_bits(other)
+        return self.from_bits(
+            self.shape, self.component_type, self.bits & bits
+        )
+
+    def __sub__(self, other: ComponentSet | Iterable[int]) -> ComponentSet:
+        bits: int = self._get_other_bits(other)
+        return self.from_bits(
+            self.shape, self.component_type, self.bits & ~bits
+        )
+
+    def __xor__(self, other: ComponentSet | Iterable[int]) -> ComponentSet:
+        bits: int = self._get_other_bits(other)
+        return self.from_bits(
+            self.shape, self.component_type, self.bits ^ bits
+        )
+
+    def isdisjoint(self, other: ComponentSet | Iterable[int]) -> bool:
+        return not (self.bits & self._get_other_bits(other))
+
+    def issubset(self, other: ComponentSet | Iterable[int]) -> bool:
+        return not (self.bits & ~self._get_other_bits(other))
+
+    def add(self, component_id: int) -> None:
+        self.bits |= 1 << component_id
+
+    def discard(self, component_id: int) -> None:
+        self.bits &= ~(1 << component_id)
+
+    def update(self, component_ids: Iterable[int]) -> None:
+        self.bits |= _get_ids_bits(component_ids)
+
+    def pop(self) -> int:
+        """
+        Remove and return the lowest component ID in the set.
+        """
+        if not self.bits:
+            raise KeyError("pop from an empty component set")
+        lowest_bit: int = self.bits & -self.bits
+        self.bits ^= lowest_bit
+        return lowest_bit.bit_length() - 1
+
+    def get_mask(self, length: int = 0) -> bytearray:
+        """
+        Get a mask with one byte per component ID, wherein each byte is 1
+        if the component is in the set, and 0 if not. Testing membership
+        in a mask is faster than testing membership in a large bitset.
+
+        Parameters:
+            length: The minimum length of the mask (typically the number of
+                components of this type in the shape).
+        """
+        mask: bytearray = bytearray(max(length, self.bits.bit_length()))
+        component_id: int
+        for component_id in self:
+            mask[component_id] = 1
+        return mask
+
+    def iter_ranges(self) -> Iterator[tuple[int, int]]:
+        """
+        Yield a tuple containing the first and last (inclusive) component IDs
+        of each contiguous range of component IDs in the set.
+        """
+        start: int = -1
+        end: int = -1
+        component_id: int
+        for component_id in self:
+            if component_id != end + 1:
+                if start >= 0:
+                    yield start, end
+                start = component_id
+            end = component_id
+        if start >= 0:
+            yield start, end
+
+    def get_component(self, component_id: int) -> str:
+        """
+        Get the name of a component in this set's shape, by ID.
+        """
+        return f"{self.shape}.{self.component_type}[{component_id}]"
+
+    def iter_components(self) -> Iterator[str]:
+        """
+        Yield flattened component names, such as "pSphere1.vtx[5]".
+        """
+        return map(self.get_component, self)
+
+    def get_components(self) -> set[str]:
+        """
+        Get a set of flattened component names.
+        """
+        return set(self.iter_components())
+
+    def get_compact_components(self) -> tuple[str, ...]:
+        """
+        Get a compact sequence of component names, wherein contiguous ranges
+        of component IDs are represented as one component name (as in
+        "pSphere1.vtx[5:9]"), suitable for passing to `maya.cmds`.
+        """
+        start: int
+        end: int
+        return tuple(
+            f"{self.shape}.{self.component_type}[{start}:{end}]"
+            if end > start
+            else self.get_component(start)
+            for start, end in self.iter_ranges()
+        )
@@ -0,0 +1,289 @@
+from __future__ import annotations
+
+from array import array
+from typing import Any, Callable, Iterable, Sequence
+
+from maya_zen_tools._topology import (
+    MeshTopology,
+    _build_csr,
+    get_mesh_topology,
+    get_mesh_topology_data,
+)
+
+# The component types which can be converted
+COMPONENT_TYPES: tuple[str, ...] = ("vtx", "e", "f", "map")
+
+
+def _get_csr_row(offsets: Sequence[int], ids: array, row: int) -> array:
+    return ids[offsets[row] : offsets[row + 1]]
+
+
+class ComponentConverter:
+    """
+    Converts between vertex ("vtx"), edge ("e"), face ("f") and UV ("map")
+    IDs of one polygon mesh, using the connectivity arrays of a topology
+    snapshot, with the same semantics as `cmds.polyListComponentConversion`
+    (with or without its `internal` flag).
+
+    Attributes:
+        topology: The topology snapshot.
+        vertex_face_offsets: CSR offsets for `vertex_face_ids`.
+        vertex_face_ids: The IDs of the faces sharing each vertex.
+        vertex_uv_offsets: CSR offsets for `vertex_uv_ids`.
+        vertex_uv_ids: The IDs of the UVs assigned to each vertex.
+        uv_face_offsets: CSR offsets for `uv_face_ids`.
+        uv_face_ids: The IDs of the faces each UV is assigned to.
+    """
+
+    __slots__ = (
+        "topology",
+        "uv_face_ids",
+        "uv_face_offsets",
+        "vertex_face_ids",
+        "vertex_face_offsets",
+        "vertex_uv_ids",
+        "vertex_uv_offsets",
+    )
+
+    def __init__(self, topology: MeshTopology) -> None:
+        self.topology: MeshTopology = topology
+        face_id: int
+        index: int
+        self.vertex_face_offsets: array
+        self.vertex_face_ids: array
+        self.vertex_face_offsets, self.vertex_face_ids = _build_csr(
+            topology.vertex_count,
+            (
+                (topology.face_vertex_ids[index], face_id)
+                for face_id in range(topology.face_count)
+                for index in range(
+                    topology.face_vertex_offsets[face_id],
+                    topology.face_vertex_offsets[face_id + 1],
+                )
+            ),
+        )
+        uv_id: int
+        vertex_id: int
+        self.vertex_uv_offsets: array
+        self.vertex_uv_ids: array
+        self.vertex_uv_offsets, self.vertex_uv_ids = _build_csr(
+            topology.vertex_count,
+            (
+                (vertex_id, uv_id)
+                for uv_id, vertex_id in enumerate(topology.uv_vertex_ids)
+                if vertex_id >= 0
+            ),
+        )
+        self.uv_face_offsets: array
+        self.uv_face_ids: array
+        self.uv_face_offsets, self.uv_face_ids = _build_csr(
+            topology.uv_count,
+            (
+                (topology.face_uv_ids[index], face_id)
+                for face_id in range(topology.face_count)
+                for index in range(
+                    topology.face_vertex_offsets[face_id],
+                    topology.face_vertex_offsets[face_id + 1],
+                )
+                if topology.face_uv_ids[index] >= 0
+            ),
+        )
+
+    @property
+    def size(self) -> int:
+        """
+        The approximate memory footprint of the converter's arrays, in
+        bytes.
+        """
+        return sum(
+            len(values) * values.itemsize
+            for values in (
+                self.vertex_face_offsets,
+                self.vertex_face_ids,
+                self.vertex_uv_offsets,
+                self.vertex_uv_ids,
+                self.uv_face_offsets,
+                self.uv_face_ids,
+            )
+        )
+
+    def get_related_ids_getter(
+        self, from_type: str, to_type: str
+    ) -> Callable[[int], Sequence[int]]:
+        """
+        Get a function which returns the IDs of the components of type
+        `to_type` related to a component of type `from_type`.
+        """
+        topology: MeshTopology = self.topology
+        getters: dict[tuple[str, str], Callable[[int], Sequence[int]]] = {
+            ("vtx", "e"): topology.get_vertex_edge_ids,
+            ("vtx", "f"): lambda vertex_id: _get_csr_row(
+                self.vertex_face_offsets, self.vertex_face_ids, vertex_id
+            ),
+            ("vtx", "map"): lambda vertex_id: _get_csr_row(
+                self.vertex_uv_offsets, self.vertex_uv_ids, vertex_id
+            ),
+            ("e", "vtx"): topology.get_edge_vertex_ids,
+            ("e", "f"): topology.get_edge_face_ids,
+            ("e", "map"): topology.get_edge_uv_ids,
+            ("f", "vtx"): topology.get_face_vertex_ids,
+            ("f", "e"): topology.get_face_edge_ids,
+            ("f", "map"): lambda face_id: array(
+                "i",
+                (
+                    uv_id
+                    for uv_id in topology.get_face_uv_ids(face_id)
+                    if uv_id >= 0
+                ),
+            ),
+            ("map", "vtx"): lambda uv_id: (topology.get_uv_vertex_id(uv_id),),
+            ("map", "e"): topology.get_uv_edge_ids,
+            ("map", "f"): lambda uv_id: _get_csr_row(
+                self.uv_face_offsets, self.uv_face_ids, uv_id
+            ),
+        }
+        try:
+            return getters[from_type, to_type]
+        except KeyError:
+            raise ValueError(from_type, to_type) from None
+
+    def convert(
+        self,
+        component_ids: Iterable[int],
+        from_type: str,
+        to_type: str,
+        *,
+        internal: bool = False,
+    ) -> array:
+        """
+        Convert component IDs of one type to the IDs of related components
+        of another type.
+
+        Parameters:
+            component_ids: The IDs of the components to convert.
+            from_type: The type of the components to convert
+                (vtx | e | f | map).
+            to_type: The type of the components to convert to
+                (vtx | e | f | map).
+            internal: If `True`, only return components all of whose
+                related components (of type `from_type`) are among
+                those converted.
+
+        Returns:
+            An array of sorted, unique component IDs.
+        """
+        if from_type == to_type:
+            return array("i", sorted(set(component_ids)))
+        source_ids: set[int] = set(component_ids)
+        get_related_ids: Callable[[int], Sequence[int]] = (
+            self.get_related_ids_getter(from_type, to_type)
+        )
+        component_id: int
+        target_ids: set[int] = set()
+        for component_id in source_ids:
+            target_ids.update(get_related_ids(component_id))
+        target_ids.discard(-1)
+        if internal:
+            get_source_ids: Callable[[int], Sequence[int]] = (
+                self.get_related_ids_getter(to_type, from_type)
+            )
+            target_id: int
+            target_ids = {
+                target_id
+                for target_id in target_ids
+                if source_ids.issuperset(get_source_ids(target_id))
+            }
+        return array("i", sorted(target_ids))
+
+
+def get_mesh_component_converter(shape: str) -> ComponentConverter:
+    """
+    Get a component converter for a polygon mesh, which is cached until the
+    shape's topology changes.
+    """
+    data: dict[str, Any] = get_mesh_topology_data(shape)
+    converter: ComponentConverter | None = data.get("component_converter")
+    if converter is None:
+        converter = ComponentConverter(get_mesh_topology(shape))
+        data["component_converter"] = converter
+    return converter
+
+
+def convert_component_ids(
+    shape: str,
+    component_ids: Iterable[int],
+    from_type: str,
+    to_type: str,
+    *,
+    internal: bool = False,
+) -> array:
+    """
+    Convert the IDs of components of one type to the IDs of related
+    components of another type.
+
+    Parameters:
+        shape: A polygon mesh shape, or the transform parenting it.
+        component_ids: The IDs of the components to convert.
+        from_type: The type of the components to convert
+            (vtx | e | f | map).
+        to_type: The type of the components to convert to
+            (vtx | e | f | map).
+        internal: If `True`, only return components all of whose related
+            components (of type `from_type`) are among those converted.
+
+    Returns:
+        An array of sorted, unique component IDs.
+    """
+    return get_mesh_component_converter(shape).convert(
+        component_ids, from_type, to_type, internal=internal
+    )
+
+
+def convert_components(
+    components: Iterable[str],
+    to_type: str,
+    *,
+    internal: bool = False,
+) -> tuple[str, ...]:
+    """
+    Convert polygon mesh components (of any one or more shapes and types)
+    to related components of another type, in the manner of
+    `cmds.polyListComponentConversion` followed by `cmds.ls(flatten=True)`.
+
+    Parameters:
+        components: The names of the components to convert.
+        to_type: The type of the components to convert to
+            (vtx | e | f | map).
+        internal: If `True`, only return components all of whose related
+            components are among those converted.
+
+    Returns:
+        A tuple of component names.
+    """
+    shapes_types_ids: dict[tuple[str, str], list[int]] = {}
+    component: str
+    for component in components:
+        shape: str
+        component_type: str
+        component_id: str
+        shape, component_type = component.rpartition(".")[::2]
+        component_type, component_id = component_type.partition("[")[::2]
+        shapes_types_ids.setdefault((shape, component_type), []).append(
+            int(component_id.rstrip("]"))
+        )
+    converted: list[str] = []
+    from_type: str
+    component_ids: list[int]
+    converted_id: int
+    for (shape, from_type), component_ids in shapes_types_ids.items():
+        converted.extend(
+            f"{shape}.{to_type}[{converted_id}]"
+            for converted_id in convert_component_ids(
+                shape,
+                component_ids,
+                from_type,
+                to_type,
+                internal=internal,
+            )
+        )
+    return tuple(dict.fromkeys(converted))
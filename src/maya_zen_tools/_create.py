@@ -1,15 +1,16 @@
 from __future__ import annotations
 
-from typing import Iterable
+from typing import Iterable, Sequence
 
 from maya import cmds  # type: ignore
 
+from maya_zen_tools._nurbs import NurbsCurve, get_polyline_curve
 from maya_zen_tools._traverse import (
-    get_component_id,
-    get_components_shape,
     get_transform_shape,
     iter_edges_uvs,
     iter_edges_vertices,
+    iter_uvs_positions,
+    iter_vertices_positions,
 )
 from maya_zen_tools.errors import CreateNodeError
 
@@ -48,87 +49,6 @@ def create_locator(
     return locator
 
 
-def create_edges_rebuild_curve(edges: Iterable[str]) -> str:
-    """
-    Create a rebuildCurve node from contiguous edges
-    """
-    edges = tuple(edges)
-    vertices: tuple[str, ...] = tuple(iter_edges_vertices(edges))
-    polymesh_shape: str = get_components_shape(edges)
-    point_on_curve_info: str = create_node("pointOnCurveInfo")
-    cmds.setAttr(f"{point_on_curve_info}.parameter", 0)
-    cmds.setAttr(f"{point_on_curve_info}.turnOnPercentage", 1)
-    edge: str
-    curve_from_mesh_edges: str = ""
-    vertex: str
-    reverse_previous: bool = True
-    reverse: bool = False
-    for vertex, edge in zip(vertices[:-1], edges):
-        curve_from_mesh_edge: str = create_node("curveFromMeshEdge")
-        cmds.connectAttr(
-            f"{polymesh_shape}.worldMesh[0]",
-            f"{curve_from_mesh_edge}.inputMesh",
-        )
-        cmds.setAttr(
-            f"{curve_from_mesh_edge}.edgeIndex[0]", get_component_id(edge)
-        )
-        cmds.connectAttr(
-            f"{curve_from_mesh_edge}.outputCurve",
-            f"{point_on_curve_info}.inputCurve",
-            # Force the connection (replace the pre-existing connection)
-            force=True,
-        )
-        # Determine if we need to reverse the curve
-        vertex_point_position: tuple[float, float, float] = tuple(
-            cmds.pointPosition(vertex)
-        )
-        curve_start_point_position: tuple[float, float, float] = cmds.getAttr(
-            f"{point_on_curve_info}.position"
-        )[0]
-        reverse = vertex_point_position != curve_start_point_position
-        if not curve_from_mesh_edges:
-            # This is the first curve, no need to attach anything
-            curve_from_mesh_edges = curve_from_mesh_edge
-            # There was no attach node in this iteration, so we carry
-            # over reversal to the next iteration
-            reverse_previous = reverse
-            continue
-        # Attach the edge curve to the pre-existing curve
-        attach_curve: str = create_node("attachCurve")
-        # Set the attach curve node state to "waiting"
-        cmds.setAttr(f"{attach_curve}.nodeState", 8)
-        cmds.connectAttr(
-            f"{curve_from_mesh_edges}.outputCurve",
-            f"{attach_curve}.inputCurve1",
-        )
-        cmds.connectAttr(
-            f"{curve_from_mesh_edge}.outputCurve",
-            f"{attach_curve}.inputCurve2",
-        )
-        # Set the attach curve node state to "active"
-        cmds.setAttr(f"{attach_curve}.nodeState", 0)
-        # Reverse the curve and/or previous curve so that the start of the
-        # curve aligns with `vertex`
-        if reverse_previous:
-            cmds.setAttr(f"{attach_curve}.reverse1", 1)
-        if reverse:
-            cmds.setAttr(f"{attach_curve}.reverse2", 1)
-        reverse_previous = False
-        curve_from_mesh_edges = attach_curve
-    rebuild_curve: str = create_node("rebuildCurve")
-    cmds.connectAttr(
-        f"{curve_from_mesh_edges}.outputCurve", f"{rebuild_curve}.inputCurve"
-    )
-    cmds.setAttr(f"{rebuild_curve}.keepControlPoints", 1)
-    cmds.setAttr(f"{rebuild_curve}.degree", 1)
-    cmds.setAttr(f"{rebuild_curve}.rebuildType", 0)
-    cmds.setAttr(f"{rebuild_curve}.spans", len(edges))
-    cmds.setAttr(f"{rebuild_curve}.endKnots", 1)
-    # Make the range 0 -> # spans
-    cmds.setAttr(f"{rebuild_curve}.keepRange", 2)
-    return rebuild_curve
-
-
 def create_uv_edges_rebuild_curve(
     edges: Iterable[str],
 ) -> tuple[str, str, str]:
@@ -138,6 +58,85 @@ def create_uv_edges_rebuild_curve(
     return create_uvs_rebuild_curve(iter_edges_uvs(edges))
 
 
+def create_curve(
+    curve: NurbsCurve,
+    *,
+    name: str | None = None,
+) -> tuple[str, str]:
+    """
+    Create a curve from curve data computed in Python, using a single
+    command, and return the curve transform and shape.
+
+    Parameters:
+        curve: The curve data. Points with fewer than 3 coordinates
+            (such as UV positions) are padded with zeros.
+        name: The name of the curve transform.
+    """
+    point: tuple[float, ...]
+    curve_transform: str = cmds.curve(
+        degree=curve.degree,
+        point=tuple((*point, 0.0, 0.0)[:3] for point in curve.points),
+        # Maya omits the first and last knots of a NURBS knot vector
+        knot=curve.knots[1:-1],
+        **({"name": name} if name is not None else {}),
+    )
+    return curve_transform, get_transform_shape(curve_transform)
+
+
+def create_edit_point_curve(
+    positions: Iterable[Sequence[float]],
+    *,
+    close: bool = False,
+    name: str | None = None,
+) -> tuple[str, str]:
+    """
+    Create a cubic "edit point" (EP) curve passing through the given
+    positions, using a single command, and return the curve transform and
+    shape.
+
+    Parameters:
+        positions: The edit point positions. Positions with fewer than 3
+            coordinates (such as UV positions) are padded with zeros.
+        close: If `True`, the curve is closed by adding a span from the
+            last edit point back to the first, without history.
+        name: The name of the curve transform.
+    """
+    position: Sequence[float]
+    curve_transform: str = cmds.curve(
+        degree=3,
+        editPoint=tuple((*position, 0.0, 0.0)[:3] for position in positions),
+        **({"name": name} if name is not None else {}),
+    )
+    if close:
+        cmds.closeCurve(
+            curve_transform,
+            constructionHistory=False,
+            replaceOriginal=True,
+            preserveShape=1,
+        )
+    return curve_transform, get_transform_shape(curve_transform)
+
+
+def create_edges_curve(
+    edges: Iterable[str], *, name: str | None = None
+) -> tuple[str, str]:
+    """
+    Create a degree 1 curve passing through the vertices of contiguous
+    edges, in order, with a parameter range of 0 to the number of edges,
+    and return the curve transform and shape.
+
+    Parameters:
+        edges: Contiguous edges, in order.
+        name: The name of the curve transform.
+    """
+    return create_curve(
+        get_polyline_curve(
+            tuple(iter_vertices_positions(iter_edges_vertices(tuple(edges))))
+        ),
+        name=name,
+    )
+
+
 def create_uvs_rebuild_curve(
     uvs: Iterable[str],
 ) -> tuple[str, str, str]:
@@ -146,7 +145,9 @@ def create_uvs_rebuild_curve(
     """
     uvs = tuple(uvs)
     curve_transform: str = cmds.curve(
-        editPoint=tuple((*cmds.polyEditUV(uv, query=True), 0.0) for uv in uvs),
+        editPoint=tuple(
+            (*position, 0.0) for position in iter_uvs_positions(uvs)
+        ),
         degree=1,
     )
     curve_shape: str = get_transform_shape(curve_transform)
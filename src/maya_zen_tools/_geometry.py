@@ -0,0 +1,311 @@
+"""
+Batched geometry kernels operating on flat, contiguous arrays of
+coordinates (as returned by `get_mesh_vertex_positions` and
+`get_mesh_uv_positions`), vectorized using NumPy when it is available.
+"""
+
+from __future__ import annotations
+
+from array import array
+from itertools import accumulate, chain
+from math import dist, fsum
+from typing import Any, Iterable, Sequence
+
+try:
+    import numpy  # type: ignore
+except ImportError:
+    numpy = None
+
+
+def _get_points(
+    positions: Sequence[float], dimensions: int, ids: Sequence[int]
+) -> Any:
+    """
+    Gather the coordinates of the points with the given IDs into a NumPy
+    array with one row per point.
+    """
+    return numpy.asarray(positions).reshape(-1, dimensions)[
+        numpy.asarray(ids, dtype=numpy.intp)
+    ]
+
+
+def _iter_points(
+    positions: Sequence[float], dimensions: int, ids: Iterable[int]
+) -> Iterable[Sequence[float]]:
+    """
+    Yield the coordinates of the points with the given IDs.
+    """
+    point_id: int
+    for point_id in ids:
+        yield positions[point_id * dimensions : (point_id + 1) * dimensions]
+
+
+def get_distances(
+    positions: Sequence[float],
+    dimensions: int,
+    ids: Sequence[int],
+    other_ids: Sequence[int],
+) -> Sequence[float]:
+    """
+    Get the distance between each pair of points `ids[n]` and
+    `other_ids[n]`.
+
+    Parameters:
+        positions: A flat sequence of point coordinates.
+        dimensions: The number of coordinates per point.
+        ids: The IDs of the points to measure from.
+        other_ids: The IDs of the points to measure to.
+    """
+    if numpy is None:
+        return array(
+            "d",
+            map(
+                dist,
+                _iter_points(positions, dimensions, ids),
+                _iter_points(positions, dimensions, other_ids),
+            ),
+        )
+    return numpy.linalg.norm(
+        _get_points(positions, dimensions, ids)
+        - _get_points(positions, dimensions, other_ids),
+        axis=1,
+    )
+
+
+def get_point_distances(
+    positions: Sequence[float],
+    dimensions: int,
+    ids: Sequence[int],
+    point: Sequence[float],
+) -> Sequence[float]:
+    """
+    Get the distance from each of the points with the given IDs to
+    another point.
+
+    Parameters:
+        positions: A flat sequence of point coordinates.
+        dimensions: The number of coordinates per point.
+        ids: The IDs of the points to measure from.
+        point: The coordinates of the point to measure to.
+    """
+    if numpy is None:
+        position: Sequence[float]
+        return array(
+            "d",
+            (
+                dist(position, point)
+                for position in _iter_points(positions, dimensions, ids)
+            ),
+        )
+    return numpy.linalg.norm(
+        _get_points(positions, dimensions, ids)
+        - numpy.asarray(point, dtype=numpy.float64),
+        axis=1,
+    )
+
+
+def get_projections(
+    positions: Sequence[float],
+    dimensions: int,
+    ids: Sequence[int],
+    start_point: Sequence[float],
+    end_point: Sequence[float],
+) -> Sequence[float]:
+    """
+    Get the parameter at which each of the points with the given IDs
+    projects onto the line through a start and end point, where 0 is the
+    start point and 1 is the end point.
+
+    Parameters:
+        positions: A flat sequence of point coordinates.
+        dimensions: The number of coordinates per point.
+        ids: The IDs of the points to project.
+        start_point: The coordinates of the start of the line.
+        end_point: The coordinates of the end of the line.
+    """
+    if numpy is None:
+        a: float
+        b: float
+        direction: tuple[float, ...] = tuple(
+            b - a for a, b in zip(start_point, end_point)
+        )
+        length_squared: float = fsum(a * a for a in direction)
+        position: Sequence[float]
+        return array(
+            "d",
+            (
+                (
+                    fsum(
+                        (b - a) * c
+                        for a, b, c in zip(start_point, position, direction)
+                    )
+                    / length_squared
+                    if length_squared
+                    else 0.0
+                )
+                for position in _iter_points(positions, dimensions, ids)
+            ),
+        )
+    start: Any = numpy.asarray(start_point, dtype=numpy.float64)
+    line: Any = numpy.asarray(end_point, dtype=numpy.float64) - start
+    length_squared = float(line @ line)
+    if not length_squared:
+        return numpy.zeros(len(ids))
+    return (
+        (_get_points(positions, dimensions, ids) - start) @ line
+    ) / length_squared
+
+
+def get_least_deviant_id(
+    positions: Sequence[float],
+    dimensions: int,
+    ids: Sequence[int],
+    start_point: Sequence[float],
+    end_point: Sequence[float],
+) -> int:
+    """
+    Get the ID of the point which deviates least from the line connecting
+    a start and end point, measured as the length of the path from the
+    start point, through the point, to the end point. When more than one
+    point deviates equally, the first is returned.
+
+    Parameters:
+        positions: A flat sequence of point coordinates.
+        dimensions: The number of coordinates per point.
+        ids: One or more candidate point IDs.
+        start_point: The coordinates of the start of the line.
+        end_point: The coordinates of the end of the line.
+    """
+    deviations: Sequence[float]
+    if numpy is None:
+        deviations = tuple(
+            map(
+                float.__add__,
+                get_point_distances(positions, dimensions, ids, start_point),
+                get_point_distances(positions, dimensions, ids, end_point),
+            )
+        )
+        return ids[deviations.index(min(deviations))]
+    deviations = get_point_distances(
+        positions, dimensions, ids, start_point
+    ) + get_point_distances(positions, dimensions, ids, end_point)
+    return ids[int(numpy.argmin(deviations))]
+
+
+def get_polyline_length(*points: Sequence[float]) -> float:
+    """
+    Get the total length of the line segments connecting two or more
+    points, in order.
+    """
+    return fsum(map(dist, points, points[1:]))
+
+
+def get_polyline_lengths(
+    positions: Sequence[float], dimensions: int, ids: Sequence[int]
+) -> Sequence[float]:
+    """
+    Get the length of each segment of a polyline passing through the
+    points with the given IDs, in order.
+
+    Parameters:
+        positions: A flat sequence of point coordinates.
+        dimensions: The number of coordinates per point.
+        ids: The IDs of the points the polyline passes through.
+    """
+    return get_distances(positions, dimensions, ids[:-1], ids[1:])
+
+
+def get_path_parameters(
+    edge_lengths: Sequence[float], edge_counts: Sequence[int], spans: float
+) -> Sequence[float]:
+    """
+    Given the edge lengths of any number of paths, get a parameter for each
+    point of each path (from 0 at the start of the path to `spans` at the
+    end), proportional to the distance traversed along the path.
+
+    Parameters:
+        edge_lengths: The edge lengths of all paths, concatenated in order.
+        edge_counts: The number of edges in each path.
+        spans: The parameter at the end of each path.
+
+    Returns:
+        A flat sequence of parameters, with `edge_count + 1` parameters per
+        path.
+    """
+    if numpy is None:
+        parameters: array = array("d")
+        start: int = 0
+        edge_count: int
+        for edge_count in edge_counts:
+            traversed_lengths: tuple[float, ...] = tuple(
+                accumulate(
+                    chain((0.0,), edge_lengths[start : start + edge_count])
+                )
+            )
+            traversed_length: float
+            parameters.extend(
+                spans * (traversed_length / traversed_lengths[-1])
+                for traversed_length in traversed_lengths
+            )
+            start += edge_count
+        return parameters
+    counts: Any = numpy.asarray(edge_counts, dtype=numpy.intp)
+    # The cumulative length traversed, with 0 prepended, such that the
+    # length traversed to reach point `n` of path `m` is found at index
+    # `n + starts[m]`
+    traversed: Any = numpy.concatenate(
+        (
+            (0.0,),
+            numpy.cumsum(numpy.asarray(edge_lengths, dtype=numpy.float64)),
+        )
+    )
+    starts: Any = numpy.concatenate(((0,), numpy.cumsum(counts)[:-1]))
+    path_ids: Any = numpy.repeat(numpy.arange(len(counts)), counts + 1)
+    indices: Any = numpy.arange(len(path_ids)) - path_ids
+    path_starts: Any = traversed[starts][path_ids]
+    return (
+        spans
+        * (traversed[indices] - path_starts)
+        / (traversed[starts + counts][path_ids] - path_starts)
+    )
+
+
+def transform_points(
+    points: Iterable[Sequence[float]], matrix: Sequence[float]
+) -> list[tuple[float, float, float]]:
+    """
+    Transform 3d points by a 4x4 matrix (in Maya's row-major, row-vector
+    convention, as returned by `cmds.getAttr` for matrix attributes), in
+    one multiplication.
+
+    Parameters:
+        points: (x, y, z) coordinates.
+        matrix: The 16 values of the transformation matrix.
+    """
+    if numpy is None:
+        x: float
+        y: float
+        z: float
+        return [
+            (
+                x * matrix[0] + y * matrix[4] + z * matrix[8] + matrix[12],
+                x * matrix[1] + y * matrix[5] + z * matrix[9] + matrix[13],
+                x * matrix[2] + y * matrix[6] + z * matrix[10] + matrix[14],
+            )
+            for x, y, z in points
+        ]
+    homogeneous: Any = numpy.ones((0, 4))
+    coordinates: Any = numpy.asarray(tuple(points), dtype=numpy.float64)
+    if len(coordinates):
+        homogeneous = numpy.hstack(
+            (coordinates[:, :3], numpy.ones((len(coordinates), 1)))
+        )
+    return list(
+        map(
+            tuple,
+            (
+                homogeneous
+                @ numpy.asarray(matrix, dtype=numpy.float64).reshape(4, 4)
+            )[:, :3].tolist(),
+        )
+    )
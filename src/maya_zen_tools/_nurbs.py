@@ -0,0 +1,156 @@
+"""
+NURBS curve and surface evaluation.
+
+Curves and surfaces held by Maya attributes can be sampled in bulk using
+OpenMaya function sets, and curve data can be computed in Python to create
+a curve with a single command.
+"""
+
+from __future__ import annotations
+
+from typing import Iterable, Sequence
+
+from maya import cmds  # type: ignore
+from maya.api import OpenMaya  # type: ignore
+
+from maya_zen_tools._geometry import transform_points
+
+
+def get_curve_function_set(curve_attribute: str) -> OpenMaya.MFnNurbsCurve:
+    """
+    Get an `OpenMaya.MFnNurbsCurve` function set for the curve data held by
+    a curve attribute (such as `rebuildCurve.outputCurve`), evaluating the
+    attribute once.
+    """
+    selection_list: OpenMaya.MSelectionList = OpenMaya.MSelectionList()
+    selection_list.add(curve_attribute)
+    return OpenMaya.MFnNurbsCurve(selection_list.getPlug(0).asMObject())
+
+
+def get_curve_points(
+    curve_attribute: str,
+    parameters: Iterable[float],
+    matrix_attribute: str = "",
+) -> list[tuple[float, float, float]]:
+    """
+    Evaluate a curve attribute at any number of parameters, using a single
+    function set rather than re-evaluating a `pointOnCurveInfo` node for
+    each parameter.
+
+    Parameters:
+        curve_attribute: An attribute holding curve data.
+        parameters: The curve parameters at which to get points.
+        matrix_attribute: If provided, a matrix attribute (such as
+            `curveShape.worldMatrix[0]`) by which all points are
+            transformed, in the manner of a `pointMatrixMult` node.
+
+    Returns:
+        An (x, y, z) tuple for each parameter.
+    """
+    curve: OpenMaya.MFnNurbsCurve = get_curve_function_set(curve_attribute)
+    start: float
+    end: float
+    start, end = curve.knotDomain
+    parameter: float
+    point: OpenMaya.MPoint
+    points: list[tuple[float, float, float]] = [
+        (point.x, point.y, point.z)
+        for point in (
+            curve.getPointAtParam(
+                # Parameters are clamped to the curve's domain to absorb
+                # floating-point error at the curve ends
+                min(max(parameter, start), end),
+                OpenMaya.MSpace.kObject,
+            )
+            for parameter in parameters
+        )
+    ]
+    if matrix_attribute:
+        matrix: Sequence[float] = cmds.getAttr(matrix_attribute)
+        points = transform_points(points, matrix)
+    return points
+
+
+def get_surface_points(
+    surface_attribute: str,
+    parameters: Iterable[tuple[float, float]],
+) -> list[tuple[float, float, float]]:
+    """
+    Evaluate a surface attribute (such as `rebuildSurface.outputSurface`)
+    at any number of (u, v) parameters, using a single function set rather
+    than re-evaluating a `pointOnSurfaceInfo` node for each parameter.
+
+    Returns:
+        An (x, y, z) tuple for each parameter.
+    """
+    selection_list: OpenMaya.MSelectionList = OpenMaya.MSelectionList()
+    selection_list.add(surface_attribute)
+    surface: OpenMaya.MFnNurbsSurface = OpenMaya.MFnNurbsSurface(
+        selection_list.getPlug(0).asMObject()
+    )
+    u_start: float
+    u_end: float
+    v_start: float
+    v_end: float
+    u_start, u_end = surface.knotDomainInU
+    v_start, v_end = surface.knotDomainInV
+    u: float
+    v: float
+    point: OpenMaya.MPoint
+    return [
+        (point.x, point.y, point.z)
+        for point in (
+            surface.getPointAtParam(
+                min(max(u, u_start), u_end),
+                min(max(v, v_start), v_end),
+                OpenMaya.MSpace.kObject,
+            )
+            for u, v in parameters
+        )
+    ]
+
+
+class NurbsCurve:
+    """
+    A non-rational B-spline curve.
+
+    Attributes:
+        degree: The degree of the curve.
+        knots: The full knot vector, having `len(points) + degree + 1`
+            knots.
+        points: The control points (of any dimension).
+    """
+
+    __slots__ = ("degree", "knots", "points")
+
+    def __init__(
+        self,
+        degree: int,
+        knots: Sequence[float],
+        points: Sequence[Sequence[float]],
+    ) -> None:
+        self.degree: int = degree
+        self.knots: tuple[float, ...] = tuple(knots)
+        self.points: tuple[tuple[float, ...], ...] = tuple(map(tuple, points))
+        if len(self.knots) != len(self.points) + degree + 1:
+            raise ValueError(degree, self.knots, self.points)
+
+
+def _get_uniform_knots(degree: int, spans: int) -> tuple[float, ...]:
+    """
+    Get a clamped, uniform knot vector with a range of 0 to `spans`.
+    """
+    return (
+        (0.0,) * (degree + 1)
+        + tuple(map(float, range(1, spans)))
+        + (float(spans),) * (degree + 1)
+    )
+
+
+def get_polyline_curve(points: Sequence[Sequence[float]]) -> NurbsCurve:
+    """
+    Get a degree 1 curve with a control point at each of the given points,
+    and a parameter range of 0 to `len(points) - 1` (matching a curve
+    rebuilt with `keepControlPoints` and `keepRange=2`).
+    """
+    return NurbsCurve(1, _get_uniform_knots(1, len(points) - 1), points)
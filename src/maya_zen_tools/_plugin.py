@@ -0,0 +1,312 @@
+"""
+This module is both a Maya plug-in (providing commands which need to be
+undoable, but which are implemented using OpenMaya), and the interface
+used by the rest of ZenTools to invoke those commands.
+
+Since command arguments are parsed from strings, large amounts of data are
+not passed as arguments. Instead, the interface functions stage the data in
+this module (as imported from the `maya_zen_tools` package), and the
+command retrieves it when executed.
+"""
+
+from __future__ import annotations
+
+from array import array
+from importlib import import_module
+from itertools import chain
+from pathlib import Path
+from typing import Any, Iterable, Sequence
+
+from maya import cmds  # type: ignore
+from maya.api import OpenMaya  # type: ignore
+
+# Informs Maya that this plug-in uses the Python API 2.0
+maya_useNewAPI: bool = True  # noqa: N816
+
+PLUGIN_PATH: str = str(Path(__file__).absolute())
+SET_POSITIONS_COMMAND: str = "zenToolsSetPositions"
+
+# The arguments for the next execution of the set-positions command:
+# (shape, component type, component IDs, flat coordinates, world space)
+_set_positions_arguments: (
+    tuple[str, str, Sequence[int], Sequence[float], bool] | None
+) = None
+
+
+def _get_dag_path(shape: str) -> OpenMaya.MDagPath:
+    selection_list: OpenMaya.MSelectionList = OpenMaya.MSelectionList()
+    selection_list.add(shape)
+    dag_path: OpenMaya.MDagPath = selection_list.getDagPath(0)
+    dag_path.extendToShape()
+    return dag_path
+
+
+class SetPositionsCommand(OpenMaya.MPxCommand):
+    """
+    Set the positions of any number of a polygon mesh's vertices (or UVs)
+    in one undoable operation, using `MFnMesh.setPoints` (or
+    `MFnMesh.setUVs`).
+    """
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.dag_path: OpenMaya.MDagPath | None = None
+        self.component_type: str = "vtx"
+        self.component_ids: Sequence[int] = ()
+        self.coordinates: Sequence[float] = ()
+        self.space: int = OpenMaya.MSpace.kWorld
+        self.previous: Any = None
+
+    @staticmethod
+    def creator() -> SetPositionsCommand:
+        return SetPositionsCommand()
+
+    def isUndoable(self) -> bool:  # noqa: N802
+        return True
+
+    def doIt(self, args: OpenMaya.MArgList) -> None:  # noqa: N802
+        # Retrieve the staged arguments from the package's instance of this
+        # module, which may not be the instance Maya loaded as a plug-in
+        _plugin: Any = import_module("maya_zen_tools._plugin")
+        arguments: (
+            tuple[str, str, Sequence[int], Sequence[float], bool] | None
+        ) = _plugin._set_positions_arguments
+        _plugin._set_positions_arguments = None
+        if arguments is None:
+            raise RuntimeError(SET_POSITIONS_COMMAND)
+        shape: str
+        world_space: bool
+        (
+            shape,
+            self.component_type,
+            self.component_ids,
+            self.coordinates,
+            world_space,
+        ) = arguments
+        self.dag_path = _get_dag_path(shape)
+        self.space = (
+            OpenMaya.MSpace.kWorld if world_space else OpenMaya.MSpace.kObject
+        )
+        mesh: OpenMaya.MFnMesh = OpenMaya.MFnMesh(self.dag_path)
+        # Retain the original positions for undo
+        self.previous = (
+            mesh.getUVs()
+            if self.component_type == "map"
+            else mesh.getPoints(self.space)
+        )
+        self.redoIt()
+
+    def redoIt(self) -> None:  # noqa: N802
+        mesh: OpenMaya.MFnMesh = OpenMaya.MFnMesh(self.dag_path)
+        index: int
+        component_id: int
+        if self.component_type == "map":
+            us: OpenMaya.MFloatArray
+            vs: OpenMaya.MFloatArray
+            us, vs = mesh.getUVs()
+            for index, component_id in enumerate(self.component_ids):
+                us[component_id] = self.coordinates[index * 2]
+                vs[component_id] = self.coordinates[index * 2 + 1]
+            mesh.setUVs(us, vs)
+        else:
+            points: OpenMaya.MPointArray = mesh.getPoints(self.space)
+            for index, component_id in enumerate(self.component_ids):
+                points[component_id] = OpenMaya.MPoint(
+                    *self.coordinates[index * 3 : index * 3 + 3]
+                )
+            mesh.setPoints(points, self.space)
+        mesh.updateSurface()
+
+    def undoIt(self) -> None:  # noqa: N802
+        mesh: OpenMaya.MFnMesh = OpenMaya.MFnMesh(self.dag_path)
+        if self.component_type == "map":
+            mesh.setUVs(*self.previous)
+        else:
+            mesh.setPoints(self.previous, self.space)
+        mesh.updateSurface()
+
+
+def initializePlugin(plugin: OpenMaya.MObject) -> None:  # noqa: N802
+    OpenMaya.MFnPlugin(plugin, "ZenTools").registerCommand(
+        SET_POSITIONS_COMMAND, SetPositionsCommand.creator
+    )
+
+
+def uninitializePlugin(plugin: OpenMaya.MObject) -> None:  # noqa: N802
+    OpenMaya.MFnPlugin(plugin).deregisterCommand(SET_POSITIONS_COMMAND)
+
+
+def load_plugin() -> None:
+    """
+    Load this module as a Maya plug-in, if it is not already loaded.
+    """
+    if not cmds.pluginInfo(PLUGIN_PATH, query=True, loaded=True):
+        cmds.loadPlugin(PLUGIN_PATH, quiet=True)
+
+
+def _has_history(shape: str) -> bool:
+    """
+    Determine if a polygon mesh shape has construction history (in which
+    case its geometry is regenerated from the history, and positions must
+    be set using commands which add tweaks).
+    """
+    return bool(
+        cmds.listConnections(
+            f"{_get_dag_path(shape).fullPathName()}.inMesh",
+            source=True,
+            destination=False,
+        )
+    )
+
+
+def _group_components_positions(
+    components_positions: Iterable[tuple[str, Sequence[float]]],
+) -> dict[str, tuple[list[int], list[Sequence[float]]]]:
+    """
+    Group component positions by shape, as (component IDs, positions).
+    """
+    shapes_components_positions: dict[
+        str, tuple[list[int], list[Sequence[float]]]
+    ] = {}
+    component: str
+    position: Sequence[float]
+    for component, position in components_positions:
+        shape: str
+        component_id: str
+        shape, component_id = component.rpartition(".")[::2]
+        if shape not in shapes_components_positions:
+            shapes_components_positions[shape] = ([], [])
+        shapes_components_positions[shape][0].append(
+            int(component_id.rpartition("[")[-1].rpartition("]")[0])
+        )
+        shapes_components_positions[shape][1].append(position)
+    return shapes_components_positions
+
+
+def set_vertex_positions(
+    shape: str,
+    vertex_ids: Sequence[int],
+    positions: Sequence[Sequence[float]],
+    *,
+    world_space: bool = True,
+) -> None:
+    """
+    Move any number of a polygon mesh's vertices in one undoable
+    operation.
+
+    Parameters:
+        shape: A polygon mesh shape, or the transform parenting it.
+        vertex_ids: The IDs of the vertices to move.
+        positions: The (x, y, z) position for each vertex.
+        world_space: If `True`, positions are in world space, otherwise
+            they are in object space.
+    """
+    global _set_positions_arguments
+    if not vertex_ids:
+        return
+    if _has_history(shape):
+        vertex_id: int
+        position: Sequence[float]
+        for vertex_id, position in zip(vertex_ids, positions):
+            cmds.move(
+                *position,
+                f"{shape}.vtx[{vertex_id}]",
+                absolute=True,
+                worldSpace=world_space,
+                objectSpace=not world_space,
+            )
+        return
+    load_plugin()
+    _set_positions_arguments = (
+        shape,
+        "vtx",
+        tuple(vertex_ids),
+        array("d", chain.from_iterable(positions)),
+        world_space,
+    )
+    getattr(cmds, SET_POSITIONS_COMMAND)()
+
+
+def set_uv_positions(
+    shape: str,
+    uv_ids: Sequence[int],
+    positions: Sequence[Sequence[float]],
+) -> None:
+    """
+    Move any number of a polygon mesh's UVs (in the current UV set) in one
+    undoable operation.
+
+    Parameters:
+        shape: A polygon mesh shape, or the transform parenting it.
+        uv_ids: The IDs of the UVs to move.
+        positions: The (u, v) position for each UV.
+    """
+    global _set_positions_arguments
+    if not uv_ids:
+        return
+    if _has_history(shape):
+        uv_id: int
+        position: Sequence[float]
+        for uv_id, position in zip(uv_ids, positions):
+            cmds.polyEditUV(
+                f"{shape}.map[{uv_id}]",
+                uValue=position[0],
+                vValue=position[1],
+                relative=False,
+            )
+        return
+    load_plugin()
+    _set_positions_arguments = (
+        shape,
+        "map",
+        tuple(uv_ids),
+        array(
+            "d", chain.from_iterable(position[:2] for position in positions)
+        ),
+        False,
+    )
+    getattr(cmds, SET_POSITIONS_COMMAND)()
+
+
+def set_vertices_positions(
+    vertices_positions: Iterable[tuple[str, Sequence[float]]],
+    *,
+    world_space: bool = True,
+) -> None:
+    """
+    Move any number of vertices, on any number of shapes, using one
+    undoable operation per shape.
+
+    Parameters:
+        vertices_positions: (vertex, (x, y, z)) pairs.
+        world_space: If `True`, positions are in world space, otherwise
+            they are in object space.
+    """
+    shape: str
+    vertex_ids: list[int]
+    positions: list[Sequence[float]]
+    for shape, (vertex_ids, positions) in _group_components_positions(
+        vertices_positions
+    ).items():
+        set_vertex_positions(
+            shape, vertex_ids, positions, world_space=world_space
+        )
+
+
+def set_uvs_positions(
+    uvs_positions: Iterable[tuple[str, Sequence[float]]],
+) -> None:
+    """
+    Move any number of UVs, on any number of shapes, using one undoable
+    operation per shape.
+
+    Parameters:
+        uvs_positions: (UV, (u, v)) pairs.
+    """
+    shape: str
+    uv_ids: list[int]
+    positions: list[Sequence[float]]
+    for shape, (uv_ids, positions) in _group_components_positions(
+        uvs_positions
+    ).items():
+        set_uv_positions(shape, uv_ids, positions)
@@ -0,0 +1,1276 @@
+from __future__ import annotations
+
+import contextlib
+from array import array
+from collections import OrderedDict
+from copy import copy
+from functools import partial
+from itertools import chain, count
+from typing import Any, Iterable, Iterator, Sequence
+from zlib import crc32
+
+from maya.api import OpenMaya  # type: ignore
+
+from maya_zen_tools import options
+from maya_zen_tools._geometry import get_distances
+
+try:
+    import numpy  # type: ignore
+except ImportError:
+    numpy = None
+
+# The default maximum size, in bytes, of all topology snapshots retained in
+# the topology cache
+DEFAULT_TOPOLOGY_CACHE_CAPACITY: int = 256 * 1024 * 1024
+
+# Version numbers for topology cache entries, which are never reused
+_topology_versions: Iterator[int] = count()
+
+
+def _build_csr(
+    row_count: int, rows_values: Iterable[tuple[int, int]]
+) -> tuple[array, array]:
+    """
+    Build compressed sparse row (CSR) offset and value arrays from
+    `(row, value)` pairs, discarding duplicate values within a row, and
+    retaining the order in which values were first encountered.
+
+    Parameters:
+        row_count: The number of rows.
+        rows_values: An iterable of `(row, value)` tuples.
+
+    Returns:
+        A tuple containing an array of `row_count + 1` offsets, and an
+        array of values, such that the values for row `n` are
+        `values[offsets[n]:offsets[n + 1]]`.
+    """
+    # Dictionaries (with no values) are used as insertion-ordered sets
+    rows: list[dict[int, None]] = [{} for _ in range(row_count)]
+    row: int
+    value: int
+    for row, value in rows_values:
+        rows[row][value] = None
+    row_values: dict[int, None]
+    offsets: array = array("i", (0,)) * (row_count + 1)
+    offset: int = 0
+    index: int
+    for index, row_values in enumerate(rows):
+        offset += len(row_values)
+        offsets[index + 1] = offset
+    values: array = array("i")
+    for row_values in rows:
+        values.extend(row_values)
+    return offsets, values
+
+
+def get_mesh_function_set(shape: str) -> OpenMaya.MFnMesh:
+    """
+    Get an `OpenMaya.MFnMesh` function set for a polygon mesh shape (or the
+    transform parenting the shape).
+    """
+    selection_list: OpenMaya.MSelectionList = OpenMaya.MSelectionList()
+    selection_list.add(shape)
+    dag_path: OpenMaya.MDagPath = selection_list.getDagPath(0)
+    dag_path.extendToShape()
+    return OpenMaya.MFnMesh(dag_path)
+
+
+class MeshTopology:
+    """
+    A snapshot of a polygon mesh's connectivity, read in bulk using OpenMaya
+    and stored as compact integer arrays. One-to-many relationships are
+    stored in compressed sparse row (CSR) form: the IDs related to item `n`
+    are `ids[offsets[n]:offsets[n + 1]]`.
+
+    Attributes:
+        shape: The name of the shape (or transform) the snapshot was taken
+            from, which is used as the prefix when formatting component names.
+        vertex_count: The number of vertices in the mesh.
+        edge_count: The number of edges in the mesh.
+        face_count: The number of faces in the mesh.
+        uv_count: The number of UVs in the mesh's current UV set.
+        edge_vertex_ids: Two vertex IDs for each edge, such that the vertices
+            for edge `n` are `edge_vertex_ids[2 * n:2 * n + 2]`.
+        vertex_edge_offsets: CSR offsets for `vertex_edge_ids`.
+        vertex_edge_ids: The IDs of the edges connected to each vertex.
+        face_vertex_offsets: CSR offsets for `face_vertex_ids`, `face_uv_ids`
+            and `face_edge_ids`.
+        face_vertex_ids: The IDs of each face's vertices, in winding order.
+        face_uv_ids: The ID of the UV assigned to each face-vertex, or -1
+            where a face has no UVs assigned.
+        face_edge_ids: The ID of the edge connecting each face-vertex to the
+            next face-vertex (in winding order) on the same face.
+        uv_vertex_ids: The ID of the vertex each UV is assigned to, or -1
+            for UVs which are not assigned to a face.
+        uv_uv_offsets: CSR offsets for `uv_uv_ids`.
+        uv_uv_ids: The IDs of the UVs sharing both an edge *and* a face with
+            each UV.
+        uv_edge_offsets: CSR offsets for `uv_edge_ids`.
+        uv_edge_ids: The IDs of the edges connected to each UV.
+        edge_uv_offsets: CSR offsets for `edge_uv_ids`.
+        edge_uv_ids: The IDs of the UVs on each edge (two for edges which are
+            not on a UV seam, four for edges which are).
+        edge_face_offsets: CSR offsets for `edge_face_ids`.
+        edge_face_ids: The IDs of the faces on each edge (one for edges on
+            a mesh border, two for manifold edges, and more for
+            non-manifold edges).
+    """
+
+    __slots__ = (
+        "edge_count",
+        "edge_face_ids",
+        "edge_face_offsets",
+        "edge_uv_ids",
+        "edge_uv_offsets",
+        "edge_vertex_ids",
+        "face_count",
+        "face_edge_ids",
+        "face_uv_ids",
+        "face_vertex_ids",
+        "face_vertex_offsets",
+        "shape",
+        "uv_count",
+        "uv_edge_ids",
+        "uv_edge_offsets",
+        "uv_uv_ids",
+        "uv_uv_offsets",
+        "uv_vertex_ids",
+        "vertex_count",
+        "vertex_edge_ids",
+        "vertex_edge_offsets",
+    )
+
+    def __init__(
+        self,
+        shape: str,
+        vertex_count: int,
+        edge_vertex_ids: Sequence[int],
+        face_vertex_counts: Sequence[int],
+        face_vertex_ids: Sequence[int],
+        uv_count: int = 0,
+        face_uv_counts: Sequence[int] = (),
+        face_uv_ids: Sequence[int] = (),
+    ) -> None:
+        """
+        Parameters:
+            shape: The shape name, used when formatting component names.
+            vertex_count: The number of vertices in the mesh.
+            edge_vertex_ids: Two vertex IDs for each edge.
+            face_vertex_counts: The number of vertices on each face.
+            face_vertex_ids: The vertex IDs of all faces, concatenated.
+            uv_count: The number of UVs in the UV set.
+            face_uv_counts: The number of UVs assigned to each face (either
+                0, or the same as the face's vertex count).
+            face_uv_ids: The UV IDs assigned to all faces, concatenated.
+        """
+        self.shape: str = shape
+        self.vertex_count: int = vertex_count
+        self.edge_vertex_ids: array = array("i", edge_vertex_ids)
+        self.edge_count: int = len(self.edge_vertex_ids) // 2
+        self.face_count: int = len(face_vertex_counts)
+        self.uv_count: int = uv_count
+        self.face_vertex_ids: array = array("i", face_vertex_ids)
+        self.face_vertex_offsets: array = array("i", (0,)) * (
+            self.face_count + 1
+        )
+        offset: int = 0
+        face_id: int
+        face_vertex_count: int
+        for face_id, face_vertex_count in enumerate(face_vertex_counts):
+            offset += face_vertex_count
+            self.face_vertex_offsets[face_id + 1] = offset
+        # Vertex -> edges
+        edge_id: int
+        self.vertex_edge_offsets: array
+        self.vertex_edge_ids: array
+        self.vertex_edge_offsets, self.vertex_edge_ids = _build_csr(
+            vertex_count,
+            (
+                (self.edge_vertex_ids[index], index >> 1)
+                for index in range(len(self.edge_vertex_ids))
+            ),
+        )
+        # Face-vertex -> edge (the edge leading to the next face-vertex)
+        self.face_edge_ids: array = array("i", (-1,)) * len(
+            self.face_vertex_ids
+        )
+        start: int
+        stop: int
+        index: int
+        for face_id in range(self.face_count):
+            start = self.face_vertex_offsets[face_id]
+            stop = self.face_vertex_offsets[face_id + 1]
+            for index in range(start, stop):
+                self.face_edge_ids[index] = self.get_vertices_edge_id(
+                    self.face_vertex_ids[index],
+                    self.face_vertex_ids[
+                        index + 1 if index + 1 < stop else start
+                    ],
+                )
+        # Edge -> faces
+        self.edge_face_offsets: array
+        self.edge_face_ids: array
+        self.edge_face_offsets, self.edge_face_ids = _build_csr(
+            self.edge_count,
+            (
+                (self.face_edge_ids[index], face_id)
+                for face_id in range(self.face_count)
+                for index in range(
+                    self.face_vertex_offsets[face_id],
+                    self.face_vertex_offsets[face_id + 1],
+                )
+                if self.face_edge_ids[index] >= 0
+            ),
+        )
+        # Face-vertex -> UV
+        self.face_uv_ids: array = array("i", (-1,)) * len(self.face_vertex_ids)
+        uv_offset: int = 0
+        face_uv_count: int
+        for face_id, face_uv_count in enumerate(face_uv_counts):
+            if face_uv_count:
+                start = self.face_vertex_offsets[face_id]
+                self.face_uv_ids[start : start + face_uv_count] = array(
+                    "i", face_uv_ids[uv_offset : uv_offset + face_uv_count]
+                )
+                uv_offset += face_uv_count
+        # UV -> vertex, UV -> UVs, UV -> edges, and edge -> UVs
+        self.uv_vertex_ids: array = array("i", (-1,)) * uv_count
+        uv_uv_pairs: list[tuple[int, int]] = []
+        uv_edge_pairs: list[tuple[int, int]] = []
+        edge_uv_pairs: list[tuple[int, int]] = []
+        uv_id: int
+        next_uv_id: int
+        for face_id in range(self.face_count):
+            start = self.face_vertex_offsets[face_id]
+            stop = self.face_vertex_offsets[face_id + 1]
+            for index in range(start, stop):
+                uv_id = self.face_uv_ids[index]
+                if uv_id < 0:
+                    # This face has no UVs
+                    break
+                next_uv_id = self.face_uv_ids[
+                    index + 1 if index + 1 < stop else start
+                ]
+                edge_id = self.face_edge_ids[index]
+                self.uv_vertex_ids[uv_id] = self.face_vertex_ids[index]
+                uv_uv_pairs.append((uv_id, next_uv_id))
+                uv_uv_pairs.append((next_uv_id, uv_id))
+                uv_edge_pairs.append((uv_id, edge_id))
+                uv_edge_pairs.append((next_uv_id, edge_id))
+                edge_uv_pairs.append((edge_id, uv_id))
+                edge_uv_pairs.append((edge_id, next_uv_id))
+        self.uv_uv_offsets: array
+        self.uv_uv_ids: array
+        self.uv_uv_offsets, self.uv_uv_ids = _build_csr(uv_count, uv_uv_pairs)
+        self.uv_edge_offsets: array
+        self.uv_edge_ids: array
+        self.uv_edge_offsets, self.uv_edge_ids = _build_csr(
+            uv_count, uv_edge_pairs
+        )
+        self.edge_uv_offsets: array
+        self.edge_uv_ids: array
+        self.edge_uv_offsets, self.edge_uv_ids = _build_csr(
+            self.edge_count, edge_uv_pairs
+        )
+
+    @classmethod
+    def from_shape(
+        cls, shape: str, mesh: OpenMaya.MFnMesh | None = None
+    ) -> MeshTopology:
+        """
+        Read the connectivity of a polygon mesh shape, in bulk, using
+        OpenMaya.
+
+        Parameters:
+            shape: A polygon mesh shape, or the transform parenting it.
+            mesh: A function set for the shape, if one has already been
+                retrieved.
+        """
+        if mesh is None:
+            mesh = get_mesh_function_set(shape)
+        face_vertex_counts: OpenMaya.MIntArray
+        face_vertex_ids: OpenMaya.MIntArray
+        face_vertex_counts, face_vertex_ids = mesh.getVertices()
+        face_uv_counts: OpenMaya.MIntArray
+        face_uv_ids: OpenMaya.MIntArray
+        face_uv_counts, face_uv_ids = mesh.getAssignedUVs()
+        # Edge vertices are read in a single pass of an edge iterator
+        edge_vertex_ids: array = array("i", (0,)) * (mesh.numEdges * 2)
+        iterator: OpenMaya.MItMeshEdge = OpenMaya.MItMeshEdge(mesh.dagPath())
+        index: int
+        while not iterator.isDone():
+            index = iterator.index() << 1
+            edge_vertex_ids[index] = iterator.vertexId(0)
+            edge_vertex_ids[index + 1] = iterator.vertexId(1)
+            iterator.next()
+        return cls(
+            shape,
+            mesh.numVertices,
+            edge_vertex_ids,
+            face_vertex_counts,
+            face_vertex_ids,
+            uv_count=mesh.numUVs(),
+            face_uv_counts=face_uv_counts,
+            face_uv_ids=face_uv_ids,
+        )
+
+    @property
+    def size(self) -> int:
+        """
+        The approximate memory footprint of the snapshot's arrays, in bytes.
+        """
+        name: str
+        value: Any
+        size: int = 0
+        for name in self.__slots__:
+            value = getattr(self, name)
+            if isinstance(value, array):
+                size += len(value) * value.itemsize
+        return size
+
+    def with_shape(self, shape: str) -> MeshTopology:
+        """
+        Return a copy of this snapshot which shares the same arrays, but
+        formats component names using a different shape (or transform) name.
+        """
+        if shape == self.shape:
+            return self
+        topology: MeshTopology = copy(self)
+        topology.shape = shape
+        return topology
+
+    def get_edge_vertex_ids(self, edge_id: int) -> tuple[int, int]:
+        """
+        Get the IDs of the two vertices connected by an edge.
+        """
+        index: int = edge_id << 1
+        return self.edge_vertex_ids[index], self.edge_vertex_ids[index + 1]
+
+    def get_vertex_edge_ids(self, vertex_id: int) -> array:
+        """
+        Get the IDs of the edges connected to a vertex.
+        """
+        return self.vertex_edge_ids[
+            self.vertex_edge_offsets[vertex_id] : self.vertex_edge_offsets[
+                vertex_id + 1
+            ]
+        ]
+
+    def iter_vertex_vertex_ids(self, vertex_id: int) -> Iterable[int]:
+        """
+        Yield the IDs of all vertices connected to a vertex by an edge.
+        """
+        edge_id: int
+        index: int
+        for edge_id in self.get_vertex_edge_ids(vertex_id):
+            index = edge_id << 1
+            yield (
+                self.edge_vertex_ids[index + 1]
+                if self.edge_vertex_ids[index] == vertex_id
+                else self.edge_vertex_ids[index]
+            )
+
+    def get_vertices_edge_id(
+        self, vertex_id: int, other_vertex_id: int
+    ) -> int:
+        """
+        Get the ID of the edge connecting two vertices, or -1 if the vertices
+        are not connected by an edge.
+        """
+        edge_id: int
+        for edge_id in self.get_vertex_edge_ids(vertex_id):
+            if other_vertex_id in self.get_edge_vertex_ids(edge_id):
+                return edge_id
+        return -1
+
+    def get_face_vertex_ids(self, face_id: int) -> array:
+        """
+        Get the IDs of a face's vertices, in winding order.
+        """
+        return self.face_vertex_ids[
+            self.face_vertex_offsets[face_id] : self.face_vertex_offsets[
+                face_id + 1
+            ]
+        ]
+
+    def get_face_uv_ids(self, face_id: int) -> array:
+        """
+        Get the IDs of a face's UVs, in winding order (IDs will be -1 if no
+        UVs are assigned to the face).
+        """
+        return self.face_uv_ids[
+            self.face_vertex_offsets[face_id] : self.face_vertex_offsets[
+                face_id + 1
+            ]
+        ]
+
+    def get_face_edge_ids(self, face_id: int) -> array:
+        """
+        Get the IDs of a face's edges, in winding order.
+        """
+        return self.face_edge_ids[
+            self.face_vertex_offsets[face_id] : self.face_vertex_offsets[
+                face_id + 1
+            ]
+        ]
+
+    def get_edge_face_ids(self, edge_id: int) -> array:
+        """
+        Get the IDs of the faces on an edge.
+        """
+        return self.edge_face_ids[
+            self.edge_face_offsets[edge_id] : self.edge_face_offsets[
+                edge_id + 1
+            ]
+        ]
+
+    def get_uv_vertex_id(self, uv_id: int) -> int:
+        """
+        Get the ID of the vertex a UV is assigned to.
+        """
+        return self.uv_vertex_ids[uv_id]
+
+    def get_uv_uv_ids(self, uv_id: int) -> array:
+        """
+        Get the IDs of all UVs sharing both an edge and a face with a UV.
+        """
+        return self.uv_uv_ids[
+            self.uv_uv_offsets[uv_id] : self.uv_uv_offsets[uv_id + 1]
+        ]
+
+    def get_uv_edge_ids(self, uv_id: int) -> array:
+        """
+        Get the IDs of the edges connected to a UV.
+        """
+        return self.uv_edge_ids[
+            self.uv_edge_offsets[uv_id] : self.uv_edge_offsets[uv_id + 1]
+        ]
+
+    def get_edge_uv_ids(self, edge_id: int) -> array:
+        """
+        Get the IDs of the UVs on an edge.
+        """
+        return self.edge_uv_ids[
+            self.edge_uv_offsets[edge_id] : self.edge_uv_offsets[edge_id + 1]
+        ]
+
+
+def _build_chains(
+    count: int, adjacent_ids: Sequence[Sequence[int]]
+) -> tuple[array, array, list[array], bytearray]:
+    """
+    Organize items into chains (or closed loops), given the (up to two)
+    items adjacent to each item.
+
+    Parameters:
+        count: The number of items.
+        adjacent_ids: The IDs of the items adjacent to each item. Adjacency
+            must be symmetric, and no item may have more than two adjacent
+            items.
+
+    Returns:
+        A tuple containing:
+        -   An array with the chain ID of each item.
+        -   An array with the position of each item within its chain.
+        -   A list of arrays, one per chain, containing item IDs in order.
+        -   A byte array with a 1 for each chain which is a closed loop, and
+            a 0 for each chain which is not.
+    """
+    chain_ids: array = array("i", (-1,)) * count
+    positions: array = array("i", (-1,)) * count
+    chains: list[array] = []
+    closed: bytearray = bytearray()
+    item_id: int
+    start_id: int
+    previous_id: int
+    next_id: int
+    chain_items: array
+    is_closed: bool
+    for item_id in range(count):
+        if chain_ids[item_id] >= 0:
+            continue
+        # Walk backward to find the start of the chain, or to return to
+        # this item (in which case the chain is a closed loop)
+        start_id, previous_id, is_closed = item_id, -1, False
+        while True:
+            next_id = next(
+                (
+                    adjacent_id
+                    for adjacent_id in adjacent_ids[start_id]
+                    if adjacent_id != previous_id
+                ),
+                -1,
+            )
+            if next_id < 0:
+                break
+            if next_id == item_id:
+                is_closed = True
+                break
+            previous_id, start_id = start_id, next_id
+        if is_closed:
+            start_id = item_id
+        # Walk forward, from the start, recording positions
+        chain_items = array("i")
+        previous_id, next_id = -1, start_id
+        while next_id >= 0 and chain_ids[next_id] < 0:
+            chain_ids[next_id] = len(chains)
+            positions[next_id] = len(chain_items)
+            chain_items.append(next_id)
+            previous_id, next_id = (
+                next_id,
+                next(
+                    (
+                        adjacent_id
+                        for adjacent_id in adjacent_ids[next_id]
+                        if adjacent_id != previous_id
+                    ),
+                    -1,
+                ),
+            )
+        chains.append(chain_items)
+        closed.append(is_closed)
+    return chain_ids, positions, chains, closed
+
+
+class EdgeIndex:
+    """
+    An index mapping each edge of a polygon mesh to the edge ring and edge
+    loop it belongs to, and its position within each.
+
+    Edge rings pass through opposite edges of quadrilateral faces, and edge
+    loops pass through vertices shared by exactly four edges (or, along
+    borders, three edges, two of which are border edges).
+
+    Attributes:
+        ring_ids: The ring ID of each edge.
+        ring_positions: The position of each edge within its ring.
+        rings: The edge IDs of each ring, in order.
+        closed_rings: A 1 for each ring which is closed, otherwise a 0.
+        loop_ids: The loop ID of each edge.
+        loop_positions: The position of each edge within its loop.
+        loops: The edge IDs of each loop, in order.
+        closed_loops: A 1 for each loop which is closed, otherwise a 0.
+    """
+
+    __slots__ = (
+        "closed_loops",
+        "closed_rings",
+        "loop_ids",
+        "loop_positions",
+        "loops",
+        "ring_ids",
+        "ring_positions",
+        "rings",
+    )
+
+    def __init__(self, topology: MeshTopology) -> None:
+        edge_count: int = topology.edge_count
+        face_id: int
+        edge_id: int
+        # Edge -> opposite edges on adjacent quads
+        ring_adjacent_ids: list[list[int]] = [[] for _ in range(edge_count)]
+        face_edge_ids: array
+        index: int
+        for face_id in range(topology.face_count):
+            face_edge_ids = topology.get_face_edge_ids(face_id)
+            if len(face_edge_ids) != 4 or -1 in face_edge_ids:
+                continue
+            for index, edge_id in enumerate(face_edge_ids):
+                if face_edge_ids[index - 2] not in ring_adjacent_ids[edge_id]:
+                    ring_adjacent_ids[edge_id].append(face_edge_ids[index - 2])
+        # Edge -> edges continuing the loop through each vertex
+        loop_adjacent_ids: list[list[int]] = [[] for _ in range(edge_count)]
+        vertex_id: int
+        for edge_id in range(edge_count):
+            for vertex_id in topology.get_edge_vertex_ids(edge_id):
+                next_edge_id: int = self._get_loop_edge_id(
+                    topology, edge_id, vertex_id
+                )
+                if next_edge_id >= 0 and (
+                    self._get_loop_edge_id(topology, next_edge_id, vertex_id)
+                    == edge_id
+                ):
+                    loop_adjacent_ids[edge_id].append(next_edge_id)
+        self.ring_ids: array
+        self.ring_positions: array
+        self.rings: list[array]
+        self.closed_rings: bytearray
+        self.ring_ids, self.ring_positions, self.rings, self.closed_rings = (
+            _build_chains(edge_count, self._get_symmetric(ring_adjacent_ids))
+        )
+        self.loop_ids: array
+        self.loop_positions: array
+        self.loops: list[array]
+        self.closed_loops: bytearray
+        self.loop_ids, self.loop_positions, self.loops, self.closed_loops = (
+            _build_chains(edge_count, loop_adjacent_ids)
+        )
+
+    @staticmethod
+    def _get_symmetric(
+        adjacent_ids: list[list[int]],
+    ) -> list[list[int]]:
+        """
+        Discard adjacency for items with more than two adjacent items (as
+        can occur on non-manifold geometry), and adjacency which is not
+        reciprocated.
+        """
+        item_adjacent_ids: list[int]
+        adjacent_ids = [
+            (item_adjacent_ids if len(item_adjacent_ids) <= 2 else [])
+            for item_adjacent_ids in adjacent_ids
+        ]
+        item_id: int
+        adjacent_id: int
+        return [
+            [
+                adjacent_id
+                for adjacent_id in item_adjacent_ids
+                if item_id in adjacent_ids[adjacent_id]
+            ]
+            for item_id, item_adjacent_ids in enumerate(adjacent_ids)
+        ]
+
+    @staticmethod
+    def _get_loop_edge_id(
+        topology: MeshTopology,
+        edge_id: int,
+        vertex_id: int,
+    ) -> int:
+        """
+        Get the ID of the edge continuing an edge loop through a vertex,
+        or -1 if the loop does not continue.
+        """
+        vertex_edge_ids: array = topology.get_vertex_edge_ids(vertex_id)
+        face_ids: set[int] = set(topology.get_edge_face_ids(edge_id))
+        other_edge_id: int
+        candidate_edge_ids: list[int]
+        if len(vertex_edge_ids) == 4:
+            # The loop continues through the edge sharing no face with
+            # this edge
+            candidate_edge_ids = [
+                other_edge_id
+                for other_edge_id in vertex_edge_ids
+                if other_edge_id != edge_id
+                and not face_ids.intersection(
+                    topology.get_edge_face_ids(other_edge_id)
+                )
+            ]
+        elif len(vertex_edge_ids) == 3 and len(face_ids) == 1:
+            # Border loops continue through the other border edge
+            candidate_edge_ids = [
+                other_edge_id
+                for other_edge_id in vertex_edge_ids
+                if other_edge_id != edge_id
+                and len(topology.get_edge_face_ids(other_edge_id)) == 1
+            ]
+        else:
+            return -1
+        return candidate_edge_ids[0] if len(candidate_edge_ids) == 1 else -1
+
+    @property
+    def size(self) -> int:
+        """
+        The approximate memory footprint of the index's arrays, in bytes.
+        """
+        values: array
+        return (
+            sum(
+                len(values) * values.itemsize
+                for values in (
+                    self.ring_ids,
+                    self.ring_positions,
+                    self.loop_ids,
+                    self.loop_positions,
+                    *self.rings,
+                    *self.loops,
+                )
+            )
+            + len(self.closed_rings)
+            + len(self.closed_loops)
+        )
+
+    @staticmethod
+    def _get_path(
+        chain_ids: array,
+        positions: array,
+        chains: list[array],
+        closed: bytearray,
+        edge_id: int,
+        other_edge_id: int,
+    ) -> tuple[int, ...] | None:
+        chain_id: int = chain_ids[edge_id]
+        if chain_id != chain_ids[other_edge_id]:
+            return None
+        chain_edge_ids: array = chains[chain_id]
+        start: int = positions[edge_id]
+        stop: int = positions[other_edge_id]
+        length: int = len(chain_edge_ids)
+        if closed[chain_id] and abs(stop - start) * 2 > length:
+            # On closed chains, the path wrapping past the ends is shorter
+            step: int = 1 if stop < start else -1
+            return tuple(
+                chain_edge_ids[position % length]
+                for position in range(
+                    start, stop + (length * step) + step, step
+                )
+            )
+        if start <= stop:
+            return tuple(chain_edge_ids[start : stop + 1])
+        return tuple(reversed(chain_edge_ids[stop : start + 1]))
+
+    def get_ring_path(
+        self, edge_id: int, other_edge_id: int
+    ) -> tuple[int, ...] | None:
+        """
+        Get the IDs of the edges along the (shortest) path between two
+        edges on the same ring, from the first edge to the other, or `None`
+        if the edges are not on the same ring.
+        """
+        return self._get_path(
+            self.ring_ids,
+            self.ring_positions,
+            self.rings,
+            self.closed_rings,
+            edge_id,
+            other_edge_id,
+        )
+
+    def get_loop_path(
+        self, edge_id: int, other_edge_id: int
+    ) -> tuple[int, ...] | None:
+        """
+        Get the IDs of the edges along the (shortest) path between two
+        edges on the same loop, from the first edge to the other, or `None`
+        if the edges are not on the same loop.
+        """
+        return self._get_path(
+            self.loop_ids,
+            self.loop_positions,
+            self.loops,
+            self.closed_loops,
+            edge_id,
+            other_edge_id,
+        )
+
+
+def _get_uv_shell_ids(topology: MeshTopology) -> array:  # noqa: C901
+    """
+    Label each UV with the ID of the UV shell it belongs to, by joining the
+    UVs of each face in a disjoint-set forest.
+
+    Returns:
+        An array containing a shell ID for each UV. Shells are numbered
+        consecutively, from 0, in order of their lowest UV ID. UVs which are
+        not assigned to a face have a shell ID of -1.
+    """
+    parents: array = array("i", range(topology.uv_count))
+
+    def find(uv_id: int) -> int:
+        while parents[uv_id] != uv_id:
+            # Path halving
+            parents[uv_id] = parents[parents[uv_id]]
+            uv_id = parents[uv_id]
+        return uv_id
+
+    face_id: int
+    uv_id: int
+    root: int
+    face_root: int
+    for face_id in range(topology.face_count):
+        face_root = -1
+        for uv_id in topology.get_face_uv_ids(face_id):
+            if uv_id < 0:
+                # This face has no UVs
+                break
+            root = find(uv_id)
+            if face_root < 0:
+                face_root = root
+            elif root != face_root:
+                # Always keep the lower root, so that each root is the
+                # lowest UV ID in its shell
+                if root < face_root:
+                    root, face_root = face_root, root
+                parents[root] = face_root
+    shell_ids: array = array("i", (-1,)) * topology.uv_count
+    shell_count: int = 0
+    for uv_id in range(topology.uv_count):
+        if topology.uv_vertex_ids[uv_id] < 0:
+            continue
+        root = find(uv_id)
+        if root == uv_id:
+            shell_ids[uv_id] = shell_count
+            shell_count += 1
+        else:
+            shell_ids[uv_id] = shell_ids[root]
+    return shell_ids
+
+
+def get_topology_hash(
+    mesh: OpenMaya.MFnMesh,
+) -> tuple[int, int, int, int, str, int]:
+    """
+    Get a hash of a mesh's topology, used to verify that a cached topology
+    snapshot is still current.
+
+    UVs can be sewn, cut or switched to another UV set without changing
+    the number of vertices, edges, faces or UVs, so the hash also includes
+    the name of the current UV set and a checksum of the UV IDs assigned
+    to each face.
+    """
+    face_uv_counts: OpenMaya.MIntArray
+    face_uv_ids: OpenMaya.MIntArray
+    face_uv_counts, face_uv_ids = mesh.getAssignedUVs()
+    return (
+        mesh.numVertices,
+        mesh.numEdges,
+        mesh.numPolygons,
+        mesh.numUVs(),
+        mesh.currentUVSetName(),
+        crc32(
+            array("i", face_uv_ids).tobytes(),
+            crc32(array("i", face_uv_counts).tobytes()),
+        ),
+    )
+
+
+class _TopologyCacheEntry:
+    """
+    A cached topology snapshot, along with data derived from it.
+
+    Attributes:
+        topology: The topology snapshot.
+        topology_hash: The topology hash at the time the snapshot was taken.
+        version: A number identifying this snapshot, which is never reused
+            by another snapshot.
+        callback_ids: The IDs of OpenMaya callbacks which invalidate this
+            entry.
+        data: Data derived from the topology snapshot (indices, etc.), keyed
+            by name, which are discarded along with the snapshot.
+        geometry: Positions read from the shape, keyed by name, which are
+            discarded whenever the shape is marked dirty.
+    """
+
+    __slots__ = (
+        "callback_ids",
+        "data",
+        "geometry",
+        "topology",
+        "topology_hash",
+        "version",
+    )
+
+    def __init__(
+        self,
+        topology: MeshTopology,
+        topology_hash: tuple[int, int, int, int, str, int],
+        callback_ids: Sequence[int] = (),
+    ) -> None:
+        self.topology: MeshTopology = topology
+        self.topology_hash: tuple[int, int, int, int, str, int] = topology_hash
+        self.version: int = next(_topology_versions)
+        self.callback_ids: tuple[int, ...] = tuple(callback_ids)
+        self.data: dict[str, Any] = {}
+        self.geometry: dict[str, Any] = {}
+
+    @property
+    def size(self) -> int:
+        """
+        The approximate memory footprint of the entry's arrays, in bytes.
+        """
+        value: Any
+        return self.topology.size + sum(
+            len(value) * value.itemsize
+            if isinstance(value, array)
+            # NumPy arrays
+            else getattr(value, "nbytes", None) or getattr(value, "size", 0)
+            for value in chain(self.data.values(), self.geometry.values())
+        )
+
+
+class _TopologyCache:
+    """
+    A process-wide, least-recently-used cache of topology snapshots,
+    keyed by shape DAG path.
+    """
+
+    def __init__(self) -> None:
+        self._entries: OrderedDict[str, _TopologyCacheEntry] = OrderedDict()
+        self._capacity: int | None = None
+        self.hits: int = 0
+        self.misses: int = 0
+        self.evictions: int = 0
+
+    @property
+    def capacity(self) -> int:
+        """
+        The maximum combined size, in bytes, of all cached snapshots.
+        """
+        if self._capacity is None:
+            self._capacity = int(
+                options.get_tool_option(  # type: ignore
+                    "topology_cache",
+                    "capacity",
+                    DEFAULT_TOPOLOGY_CACHE_CAPACITY,
+                )
+            )
+        return self._capacity
+
+    @capacity.setter
+    def capacity(self, value: int) -> None:
+        self._capacity = value
+        self._evict()
+
+    @property
+    def size(self) -> int:
+        """
+        The combined size, in bytes, of all cached snapshots.
+        """
+        entry: _TopologyCacheEntry
+        return sum(entry.size for entry in self._entries.values())
+
+    def get_entry(self, shape: str) -> _TopologyCacheEntry:
+        """
+        Get the cache entry for a shape, taking a new topology snapshot
+        if the shape is not cached, or if its topology has changed.
+        """
+        mesh: OpenMaya.MFnMesh = get_mesh_function_set(shape)
+        key: str = mesh.fullPathName()
+        topology_hash: tuple[int, int, int, int, str, int] = get_topology_hash(
+            mesh
+        )
+        entry: _TopologyCacheEntry | None = self._entries.get(key)
+        if entry is not None and entry.topology_hash == topology_hash:
+            self.hits += 1
+            self._entries.move_to_end(key)
+            return entry
+        self.misses += 1
+        if entry is not None:
+            self.discard(key)
+        entry = _TopologyCacheEntry(
+            MeshTopology.from_shape(shape, mesh),
+            topology_hash,
+            self._add_callbacks(key, mesh.object()),
+        )
+        self._entries[key] = entry
+        self._evict(keep=key)
+        return entry
+
+    def _add_callbacks(self, key: str, node: OpenMaya.MObject) -> list[int]:
+        """
+        Register callbacks which will discard a cached snapshot when the
+        shape's topology changes, or when the shape is renamed or deleted.
+        """
+        callback_ids: list[int] = []
+        with contextlib.suppress(RuntimeError):
+            callback_ids.append(
+                OpenMaya.MPolyMessage.addPolyTopologyChangedCallback(
+                    node, partial(self._discard_callback, key)
+                )
+            )
+            callback_ids.append(
+                OpenMaya.MNodeMessage.addNodePreRemovalCallback(
+                    node, partial(self._discard_callback, key)
+                )
+            )
+            callback_ids.append(
+                OpenMaya.MNodeMessage.addNameChangedCallback(
+                    node, partial(self._discard_callback, key)
+                )
+            )
+            callback_ids.append(
+                OpenMaya.MNodeMessage.addNodeDirtyCallback(
+                    node, partial(self._clear_geometry_callback, key)
+                )
+            )
+        return callback_ids
+
+    def _discard_callback(self, key: str, *args: Any) -> None:
+        self.discard(key)
+
+    def _clear_geometry_callback(
+        self,
+        key: str,
+        *args: Any,
+    ) -> None:
+        entry: _TopologyCacheEntry | None = self._entries.get(key)
+        if entry is not None:
+            entry.geometry.clear()
+
+    def discard(self, key: str) -> None:
+        """
+        Discard the cache entry for a shape DAG path (if one exists), and
+        remove its callbacks.
+        """
+        entry: _TopologyCacheEntry | None = self._entries.pop(key, None)
+        if entry is None:
+            return
+        callback_id: int
+        for callback_id in entry.callback_ids:
+            with contextlib.suppress(RuntimeError):
+                OpenMaya.MMessage.removeCallback(callback_id)
+
+    def clear(self) -> None:
+        """
+        Discard all cache entries.
+        """
+        key: str
+        for key in tuple(self._entries.keys()):
+            self.discard(key)
+
+    def _evict(self, keep: str = "") -> None:
+        """
+        Discard the least-recently-used entries until the cache is no larger
+        than its capacity (the entry for `keep` is never evicted).
+        """
+        size: int = self.size
+        key: str
+        for key in tuple(self._entries.keys()):
+            if size <= self.capacity:
+                break
+            if key == keep:
+                continue
+            size -= self._entries[key].size
+            self.discard(key)
+            self.evictions += 1
+
+
+_topology_cache: _TopologyCache = _TopologyCache()
+
+
+def get_mesh_topology(shape: str) -> MeshTopology:
+    """
+    Get a topology snapshot for a polygon mesh shape, from the topology cache
+    if the shape's topology has not changed since it was last retrieved.
+
+    Parameters:
+        shape: A polygon mesh shape, or the transform parenting it. This name
+            will be used when formatting component names.
+    """
+    return _topology_cache.get_entry(shape).topology.with_shape(shape)
+
+
+def get_mesh_topology_data(shape: str) -> dict[str, Any]:
+    """
+    Get a dictionary in which data derived from a shape's topology can be
+    stored, and which will be discarded when the topology changes.
+    """
+    return _topology_cache.get_entry(shape).data
+
+
+def get_mesh_topology_version(shape: str) -> tuple[str, int]:
+    """
+    Get a key identifying a shape's current topology snapshot: the shape's
+    full DAG path, and a version number which changes whenever a new
+    snapshot is taken. The key is shared by copies of the snapshot
+    returned for other names of the same shape, and is never reused for
+    another snapshot.
+    """
+    return (
+        get_mesh_function_set(shape).fullPathName(),
+        _topology_cache.get_entry(shape).version,
+    )
+
+
+def get_mesh_edge_index(shape: str) -> EdgeIndex:
+    """
+    Get an index of the edge rings and edge loops of a polygon mesh, from
+    the topology cache if the shape's topology has not changed since the
+    index was built.
+    """
+    entry: _TopologyCacheEntry = _topology_cache.get_entry(shape)
+    edge_index: EdgeIndex | None = entry.data.get("edge_index")
+    if edge_index is None:
+        edge_index = EdgeIndex(entry.topology)
+        entry.data["edge_index"] = edge_index
+    return edge_index
+
+
+def get_mesh_uv_shell_ids(shape: str) -> array:
+    """
+    Get the ID of the UV shell each of a polygon mesh's UVs belongs to (or
+    -1 for UVs which are not assigned to a face), from the topology cache
+    if the shape's topology has not changed since the shells were labeled.
+    Two UVs are on the same shell if, and only if, their shell IDs are
+    equal.
+    """
+    entry: _TopologyCacheEntry = _topology_cache.get_entry(shape)
+    shell_ids: array | None = entry.data.get("uv_shell_ids")
+    if shell_ids is None:
+        shell_ids = _get_uv_shell_ids(entry.topology)
+        entry.data["uv_shell_ids"] = shell_ids
+    return shell_ids
+
+
+def _get_positions(values: Iterable[float]) -> Sequence[float]:
+    """
+    Store coordinates in a contiguous array of doubles, viewed as a NumPy
+    array if NumPy is available.
+    """
+    positions: array = array("d", values)
+    if numpy is None:
+        return positions
+    return numpy.frombuffer(positions, dtype=numpy.float64)
+
+
+def get_mesh_vertex_positions(
+    shape: str, *, world_space: bool = True
+) -> Sequence[float]:
+    """
+    Get the positions of all of a polygon mesh's vertices, read in one call,
+    as a flat, contiguous array of floats (3 per vertex). This will be a
+    NumPy array if NumPy is available, otherwise an `array.array`.
+    Positions are cached until the shape is next marked dirty (or, for
+    world-space positions, until the shape's world matrix changes).
+
+    Parameters:
+        shape: A polygon mesh shape, or the transform parenting it.
+        world_space: If `True`, positions are in world space, otherwise
+            they are in object space.
+    """
+    entry: _TopologyCacheEntry = _topology_cache.get_entry(shape)
+    mesh: OpenMaya.MFnMesh = get_mesh_function_set(shape)
+    key: str = "object_vertex_positions"
+    if world_space:
+        key = "world_vertex_positions"
+        # Moving a parent transform does not mark the shape dirty, so the
+        # world matrix is checked on each read
+        world_matrix: tuple[float, ...] = tuple(
+            mesh.dagPath().inclusiveMatrix()
+        )
+        if entry.geometry.get("world_matrix") != world_matrix:
+            entry.geometry.pop(key, None)
+            entry.geometry.pop("world_edge_lengths", None)
+            entry.geometry["world_matrix"] = world_matrix
+    positions: Sequence[float] | None = entry.geometry.get(key)
+    if positions is None:
+        point: OpenMaya.MPoint
+        positions = _get_positions(
+            chain.from_iterable(
+                (point.x, point.y, point.z)
+                for point in mesh.getPoints(
+                    OpenMaya.MSpace.kWorld
+                    if world_space
+                    else OpenMaya.MSpace.kObject
+                )
+            )
+        )
+        entry.geometry[key] = positions
+    return positions
+
+
+def get_mesh_uv_positions(shape: str) -> Sequence[float]:
+    """
+    Get the positions of all of a polygon mesh's UVs (in the current UV
+    set), read in one call, as a flat, contiguous array of floats (2 per
+    UV). This will be a NumPy array if NumPy is available, otherwise an
+    `array.array`. Positions are cached until the shape is next marked
+    dirty.
+    """
+    entry: _TopologyCacheEntry = _topology_cache.get_entry(shape)
+    positions: Sequence[float] | None = entry.geometry.get("uv_positions")
+    if positions is None:
+        us: Sequence[float]
+        vs: Sequence[float]
+        us, vs = get_mesh_function_set(shape).getUVs()
+        positions = _get_positions(chain.from_iterable(zip(us, vs)))
+        entry.geometry["uv_positions"] = positions
+    return positions
+
+
+def get_mesh_edge_lengths(
+    shape: str, *, world_space: bool = True
+) -> Sequence[float]:
+    """
+    Get the length of every edge of a polygon mesh, computed in one pass
+    from the mesh's bulk vertex positions, such that the length of edge `n`
+    is `edge_lengths[n]`. Lengths are cached along with the positions
+    they are computed from.
+
+    Parameters:
+        shape: A polygon mesh shape, or the transform parenting it.
+        world_space: If `True`, lengths are measured in world space,
+            otherwise they are measured in object space.
+    """
+    positions: Sequence[float] = get_mesh_vertex_positions(
+        shape, world_space=world_space
+    )
+    entry: _TopologyCacheEntry = _topology_cache.get_entry(shape)
+    key: str = "world_edge_lengths" if world_space else "object_edge_lengths"
+    edge_lengths: Sequence[float] | None = entry.geometry.get(key)
+    if edge_lengths is None:
+        edge_vertex_ids: array = entry.topology.edge_vertex_ids
+        edge_lengths = get_distances(
+            positions, 3, edge_vertex_ids[0::2], edge_vertex_ids[1::2]
+        )
+        entry.geometry[key] = edge_lengths
+    return edge_lengths
+
+
+def get_mesh_uv_edge_lengths(shape: str) -> Sequence[float]:
+    """
+    Get the UV-space length of every UV edge of a polygon mesh (in the
+    current UV set), computed in one pass from the mesh's bulk UV
+    positions. Lengths are aligned with `MeshTopology.uv_uv_ids`, such that
+    the length of the UV edge between UV `n` and UV `uv_uv_ids[index]` is
+    `uv_edge_lengths[index]`. Lengths are cached along with the positions
+    they are computed from.
+    """
+    positions: Sequence[float] = get_mesh_uv_positions(shape)
+    entry: _TopologyCacheEntry = _topology_cache.get_entry(shape)
+    uv_edge_lengths: Sequence[float] | None = entry.geometry.get(
+        "uv_edge_lengths"
+    )
+    if uv_edge_lengths is None:
+        topology: MeshTopology = entry.topology
+        uv_id: int
+        uv_edge_lengths = get_distances(
+            positions,
+            2,
+            array(
+                "i",
+                chain.from_iterable(
+                    (uv_id,)
+                    * (
+                        topology.uv_uv_offsets[uv_id + 1]
+                        - topology.uv_uv_offsets[uv_id]
+                    )
+                    for uv_id in range(topology.uv_count)
+                ),
+            ),
+            topology.uv_uv_ids,
+        )
+        entry.geometry["uv_edge_lengths"] = uv_edge_lengths
+    return uv_edge_lengths
+
+
+def set_topology_cache_capacity(capacity: int) -> None:
+    """
+    Set the maximum combined size, in bytes, of all topology snapshots
+    retained in the topology cache, evicting least-recently-used snapshots
+    as needed.
+    """
+    options.set_tool_option("topology_cache", "capacity", capacity)
+    _topology_cache.capacity = capacity
+
+
+def clear_topology_cache() -> None:
+    """
+    Discard all cached topology snapshots.
+    """
+    _topology_cache.clear()
+
+
+def get_topology_cache_statistics() -> dict[str, int]:
+    """
+    Get counts of topology cache hits, misses and evictions, along with the
+    current number of cached snapshots and their combined size (in bytes).
+    """
+    return {
+        "hits": _topology_cache.hits,
+        "misses": _topology_cache.misses,
+        "evictions": _topology_cache.evictions,
+        "entries": len(_topology_cache._entries),
+        "size": _topology_cache.size,
+        "capacity": _topology_cache.capacity,
+    }
@@ -1,13 +1,37 @@
 from __future__ import annotations
 
-from collections import deque
-from functools import cache
+from array import array
+from collections import Counter, deque
+from contextlib import contextmanager
+from functools import cache, partial
+from heapq import heappop, heappush
 from itertools import chain, islice
-from math import sqrt
-from typing import Iterable, Sequence
+from math import dist, inf
+from typing import Callable, Iterable, Iterator, Sequence
 
 from maya import cmds  # type: ignore
 
+from maya_zen_tools import options
+from maya_zen_tools._components import ComponentSet
+from maya_zen_tools._conversion import convert_component_ids
+from maya_zen_tools._geometry import (
+    get_least_deviant_id,
+    get_path_parameters,
+    get_polyline_length,
+)
+from maya_zen_tools._topology import (
+    EdgeIndex,
+    MeshTopology,
+    get_mesh_edge_index,
+    get_mesh_edge_lengths,
+    get_mesh_topology,
+    get_mesh_topology_version,
+    get_mesh_uv_edge_lengths,
+    get_mesh_uv_positions,
+    get_mesh_uv_shell_ids,
+    get_mesh_vertex_positions,
+)
+from maya_zen_tools._ui import check_progress
 from maya_zen_tools.errors import (
     InvalidSelectionError,
     NonContiguousMeshSelectionError,
@@ -15,128 +39,335 @@ from maya_zen_tools.errors import (
     TooManyShapesError,
 )
 
+# Breadth-first searches retained for re-use, keyed by shape DAG path,
+# topology snapshot version, component type and origin component ID, while
+# within a `breadth_first_search_cache` context
+_breadth_first_searches: (
+    dict[tuple[str, int, str, int], _BreadthFirstSearch] | None
+) = None
+
 
-def add_shared_vertex_edges(edges: set[str]) -> set[str]:
+def _get_components_ids(components: Iterable[str]) -> set[int]:
     """
-    Given one or more edges, return these edges, plus all edges
-    sharing a vertex with the input edges.
+    Given component names, return a set of their integer IDs.
     """
-    return set(
-        cmds.ls(
-            *cmds.polyListComponentConversion(
-                *cmds.polyListComponentConversion(
-                    *edges, fromEdge=True, toVertex=True
-                ),
-                fromVertex=True,
-                toEdge=True,
-            ),
-            flatten=True,
-        )
-    )
+    return set(map(get_component_id, components))
 
 
-def add_shared_uv_edges(edges: set[str]) -> set[str]:
+def _get_components(
+    shape: str, component_type: str, component_ids: Iterable[int]
+) -> set[str]:
     """
-    Given one or more edges, return these edges, plus all edges
-    sharing a UV with the input edges.
+    Given a shape, component type (vtx | e | map | f) and component IDs,
+    return a set of component names.
     """
-    return set(
-        cmds.ls(
-            *cmds.polyListComponentConversion(
-                *cmds.polyListComponentConversion(
-                    *edges, fromEdge=True, toUV=True
-                ),
-                fromUV=True,
-                toEdge=True,
-            ),
-            flatten=True,
-        )
+    component_id: int
+    return {
+        f"{shape}.{component_type}[{component_id}]"
+        for component_id in component_ids
+    }
+
+
+def _get_components_sequence(
+    shape: str, component_type: str, component_ids: Iterable[int]
+) -> tuple[str, ...]:
+    """
+    Given a shape, component type (vtx | e | map | f) and component IDs,
+    return a tuple of component names, in the same order as the IDs.
+    """
+    component_id: int
+    return tuple(
+        f"{shape}.{component_type}[{component_id}]"
+        for component_id in component_ids
     )
 
 
-def get_shared_vertex_edges(edges: set[str]) -> set[str]:
+def _get_topology(
+    components: Iterable[str], topology: MeshTopology | None = None
+) -> MeshTopology:
+    """
+    Return the provided topology snapshot or, if none was provided, the
+    cached topology snapshot for the shape the components belong to.
+    """
+    if topology is not None:
+        return topology
+    return get_mesh_topology(get_components_shape(components))
+
+
+def add_shared_vertex_edges(
+    edges: set[str], topology: MeshTopology | None = None
+) -> set[str]:
+    """
+    Given one or more edges, return these edges, plus all edges
+    sharing a vertex with the input edges.
+
+    Parameters:
+        edges: One or more edges.
+        topology: A topology snapshot of the shape the edges belong to. If
+            not provided, the cached snapshot for the shape will be used.
+    """
+    if not edges:
+        return set()
+    topology = _get_topology(edges, topology)
+    edge_ids: set[int] = _get_components_ids(edges)
+    edge_id: int
+    vertex_id: int
+    for edge_id in tuple(edge_ids):
+        for vertex_id in topology.get_edge_vertex_ids(edge_id):
+            edge_ids.update(topology.get_vertex_edge_ids(vertex_id))
+    return _get_components(topology.shape, "e", edge_ids)
+
+
+def add_shared_uv_edges(
+    edges: set[str], topology: MeshTopology | None = None
+) -> set[str]:
+    """
+    Given one or more edges, return these edges, plus all edges
+    sharing a UV with the input edges.
+
+    Parameters:
+        edges: One or more edges.
+        topology: A topology snapshot of the shape the edges belong to. If
+            not provided, the cached snapshot for the shape will be used.
+    """
+    if not edges:
+        return set()
+    topology = _get_topology(edges, topology)
+    edge_ids: set[int] = _get_components_ids(edges)
+    edge_id: int
+    uv_id: int
+    for edge_id in tuple(edge_ids):
+        for uv_id in topology.get_edge_uv_ids(edge_id):
+            edge_ids.update(topology.get_uv_edge_ids(uv_id))
+    return _get_components(topology.shape, "e", edge_ids)
+
+
+def get_shared_vertex_edges(
+    edges: set[str], topology: MeshTopology | None = None
+) -> set[str]:
     """
     Given one or more edges, return all edges
     sharing a vertex with the input edges.
     """
-    return add_shared_vertex_edges(edges) - edges
+    return add_shared_vertex_edges(edges, topology) - edges
 
 
-def get_shared_uv_edges(edges: set[str]) -> set[str]:
+def get_shared_uv_edges(
+    edges: set[str], topology: MeshTopology | None = None
+) -> set[str]:
     """
     Given one or more edges, return all edges
     sharing a UV with the input edges.
     """
-    return add_shared_uv_edges(edges) - edges
+    return add_shared_uv_edges(edges, topology) - edges
 
 
-def add_shared_edge_vertices(vertices: set[str]) -> set[str]:
+def add_shared_edge_vertices(
+    vertices: set[str], topology: MeshTopology | None = None
+) -> set[str]:
     """
     Given one or more vertices, return these vertices, plus all vertices
     connected by an edge.
+
+    Parameters:
+        vertices: One or more vertices.
+        topology: A topology snapshot of the shape the vertices belong to. If
+            not provided, the cached snapshot for the shape will be used.
     """
-    return set(
-        cmds.ls(
-            *cmds.polyListComponentConversion(
-                *cmds.polyListComponentConversion(
-                    *vertices, fromVertex=True, toEdge=True
-                ),
-                fromEdge=True,
-                toVertex=True,
-            ),
-            flatten=True,
-        )
-    )
+    if not vertices:
+        return set()
+    topology = _get_topology(vertices, topology)
+    vertex_ids: set[int] = _get_components_ids(vertices)
+    vertex_id: int
+    for vertex_id in tuple(vertex_ids):
+        vertex_ids.update(topology.iter_vertex_vertex_ids(vertex_id))
+    return _get_components(topology.shape, "vtx", vertex_ids)
 
 
-def add_shared_face_edge_uvs(uvs: set[str]) -> set[str]:
+def add_shared_face_edge_uvs(
+    uvs: set[str], topology: MeshTopology | None = None
+) -> set[str]:
     """
     Given one or more UVs, return these UVs, plus all UVs
     connected by an edge *and* a face.
+
+    Parameters:
+        uvs: One or more UVs.
+        topology: A topology snapshot of the shape the UVs belong to. If
+            not provided, the cached snapshot for the shape will be used.
     """
-    return set(
-        cmds.ls(
-            *cmds.polyListComponentConversion(
-                *cmds.polyListComponentConversion(
-                    *uvs, fromUV=True, toEdge=True
-                ),
-                fromEdge=True,
-                toUV=True,
-            ),
-            flatten=True,
-        )
-    ) & set(
-        cmds.ls(
-            *cmds.polyListComponentConversion(
-                *cmds.polyListComponentConversion(
-                    *uvs, fromUV=True, toFace=True
-                ),
-                toFace=True,
-                toUV=True,
-            ),
-            flatten=True,
-        )
-    )
+    if not uvs:
+        return set()
+    topology = _get_topology(uvs, topology)
+    uv_ids: set[int] = _get_components_ids(uvs)
+    uv_id: int
+    for uv_id in tuple(uv_ids):
+        uv_ids.update(topology.get_uv_uv_ids(uv_id))
+    return _get_components(topology.shape, "map", uv_ids)
 
 
-def get_shared_edge_vertices(vertices: set[str]) -> set[str]:
+def get_shared_edge_vertices(
+    vertices: set[str], topology: MeshTopology | None = None
+) -> set[str]:
     """
     Given one or more vertices, return all vertices connected to the
     input vertices by an edge.
     """
-    return add_shared_edge_vertices(vertices) - vertices
+    return add_shared_edge_vertices(vertices, topology) - vertices
 
 
-def get_shared_face_edge_uvs(uvs: set[str]) -> set[str]:
+def get_shared_face_edge_uvs(
+    uvs: set[str], topology: MeshTopology | None = None
+) -> set[str]:
     """
     Given one or more UVs, return all UVs connected to the
     input UVs by an edge *and* a face.
     """
-    return add_shared_face_edge_uvs(uvs) - uvs
+    return add_shared_face_edge_uvs(uvs, topology) - uvs
+
+
+class _BreadthFirstSearch:
+    """
+    A resumable breadth-first search from an origin component, which
+    expands only its frontier, and only as far as is needed to find the
+    distances requested.
+    """
+
+    __slots__ = ("distances", "frontier", "get_adjacent_ids")
+
+    def __init__(
+        self,
+        origin_id: int,
+        get_adjacent_ids: Callable[[int], Iterable[int]],
+    ) -> None:
+        self.get_adjacent_ids: Callable[[int], Iterable[int]] = (
+            get_adjacent_ids
+        )
+        self.distances: dict[int, int] = {origin_id: 0}
+        self.frontier: list[int] = [origin_id]
+
+    def get_distances(self, component_ids: Iterable[int]) -> dict[int, int]:
+        """
+        Get the number of edges between the origin and each of the given
+        components. Components which cannot be reached from the origin are
+        omitted.
+        """
+        distances: dict[int, int] = self.distances
+        unfound_ids: set[int] = set(component_ids) - distances.keys()
+        next_frontier: list[int]
+        component_id: int
+        adjacent_id: int
+        distance: int
+        while unfound_ids and self.frontier:
+            # Progress is checked between layers, so that a cancelled search
+            # can still be resumed
+            check_progress(len(self.frontier))
+            next_frontier = []
+            distance = distances[self.frontier[0]] + 1
+            for component_id in self.frontier:
+                for adjacent_id in self.get_adjacent_ids(component_id):
+                    if adjacent_id not in distances:
+                        distances[adjacent_id] = distance
+                        next_frontier.append(adjacent_id)
+                        unfound_ids.discard(adjacent_id)
+            self.frontier = next_frontier
+        return {
+            component_id: distances[component_id]
+            for component_id in component_ids
+            if component_id in distances
+        }
+
+
+@contextmanager
+def breadth_first_search_cache() -> Iterator[None]:
+    """
+    Within this context, breadth-first searches performed by
+    `get_hop_distances` are retained and resumed for subsequent requests
+    from the same origin.
+    """
+    global _breadth_first_searches
+    if _breadth_first_searches is not None:
+        # An enclosing context is already caching searches
+        yield
+        return
+    _breadth_first_searches = {}
+    try:
+        yield
+    finally:
+        _breadth_first_searches = None
+
+
+def get_hop_distances(
+    origin: str,
+    components: Iterable[str],
+    topology: MeshTopology | None = None,
+) -> dict[str, int]:
+    """
+    Get the number of edges which must be traversed to reach each of the
+    given vertices or UVs from an origin vertex or UV.
+
+    Parameters:
+        origin: The vertex or UV from which to measure distances.
+        components: Vertices or UVs (of the same type as the origin) to
+            which distances should be measured.
+        topology: A topology snapshot of the shape the components belong
+            to. If not provided, the cached snapshot for the shape will be
+            used.
+
+    Returns:
+        A dictionary mapping each component to its distance from the
+        origin. Components which cannot be reached are omitted.
+    """
+    topology = _get_topology((origin,), topology)
+    component_type: str = origin.rpartition(".")[-1].partition("[")[0]
+    origin_id: int = get_component_id(origin)
+    key: tuple[str, int, str, int] = (
+        *get_mesh_topology_version(topology.shape),
+        component_type,
+        origin_id,
+    )
+    search: _BreadthFirstSearch | None = (
+        None
+        if _breadth_first_searches is None
+        else _breadth_first_searches.get(key)
+    )
+    if search is None:
+        search = _BreadthFirstSearch(
+            origin_id,
+            topology.iter_vertex_vertex_ids
+            if component_type == "vtx"
+            else topology.get_uv_uv_ids,
+        )
+        if _breadth_first_searches is not None:
+            _breadth_first_searches[key] = search
+    component_ids: dict[str, int] = {
+        component: get_component_id(component) for component in components
+    }
+    search_ids: Iterable[int] = component_ids.values()
+    if component_type == "map":
+        # UVs on other shells cannot be reached, so we exclude them rather
+        # than searching the origin's entire shell to find that out
+        shell_ids: array = get_mesh_uv_shell_ids(topology.shape)
+        origin_shell_id: int = shell_ids[origin_id]
+        search_ids = [
+            component_id
+            for component_id in search_ids
+            if shell_ids[component_id] == origin_shell_id
+        ]
+    distances: dict[int, int] = search.get_distances(search_ids)
+    component: str
+    component_id: int
+    return {
+        component: distances[component_id]
+        for component, component_id in component_ids.items()
+        if component_id in distances
+    }
 
 
 def iter_sort_vertices_by_distance(
-    origin_vertex: str, other_vertices: set[str]
+    origin_vertex: str,
+    other_vertices: set[str],
+    topology: MeshTopology | None = None,
 ) -> Iterable[str]:
     """
     Given an origin vertex and a set of other vertices, yield the other
@@ -145,32 +376,28 @@ def iter_sort_vertices_by_distance(
     Parameters:
         origin_vertex: The vertex to use as an origin for sorting.
         other_vertices: The vertices to be sorted.
+        topology: A topology snapshot of the shape the vertices belong to.
     """
-    vertices: set[str] = {origin_vertex}
-    bordering_vertices: set[str]
-    matched_vertices: set[str]
     unsorted_vertices: set[str] = set(other_vertices) - {origin_vertex}
-    while unsorted_vertices:
-        bordering_vertices = get_shared_edge_vertices(vertices)
-        if not bordering_vertices:
-            # If there are no bordering vertices, any remaining vertices
-            # must belong to a part of the mesh which cannot be reached
-            # by edge traversal, and is therefore disconnected
-            raise NonContiguousMeshSelectionError(
-                origin_vertex, other_vertices
-            )
-        matched_vertices = bordering_vertices & unsorted_vertices
-        if matched_vertices:
-            yield from matched_vertices
-            unsorted_vertices -= matched_vertices
-            if not unsorted_vertices:
-                return
-        # Add the bordering vertices to our traversal selection
-        vertices |= bordering_vertices
+    distances: dict[str, int] = get_hop_distances(
+        origin_vertex, unsorted_vertices, topology
+    )
+    if len(distances) < len(unsorted_vertices):
+        # Any vertices which could not be reached must belong to a part of
+        # the mesh which cannot be reached by edge traversal, and is
+        # therefore disconnected
+        raise NonContiguousMeshSelectionError(origin_vertex, other_vertices)
+    vertex: str
+    yield from sorted(
+        distances,
+        key=lambda vertex: (distances[vertex], get_component_id(vertex)),
+    )
 
 
 def iter_sort_uvs_by_distance(
-    origin_uv: str, other_uvs: set[str]
+    origin_uv: str,
+    other_uvs: set[str],
+    topology: MeshTopology | None = None,
 ) -> Iterable[str]:
     """
     Given an origin UV and a set of other UVs, yield the other
@@ -179,25 +406,21 @@ def iter_sort_uvs_by_distance(
     Parameters:
         origin_uv: The vertex to use as an origin for sorting.
         other_uvs: The vertices to be sorted.
+        topology: A topology snapshot of the shape the UVs belong to.
     """
-    uvs: set[str] = {origin_uv}
-    bordering_uvs: set[str]
-    matched_uvs: set[str]
-    while other_uvs:
-        bordering_uvs = get_shared_face_edge_uvs(uvs)
-        if not bordering_uvs:
-            # If there are no bordering UVs, any remaining UVs
-            # must belong to a part of the mesh which cannot be reached
-            # by edge traversal, and is therefore disconnected
-            raise NonContiguousMeshSelectionError({origin_uv} | other_uvs)
-        matched_uvs = bordering_uvs & other_uvs
-        if matched_uvs:
-            yield from matched_uvs
-            other_uvs -= matched_uvs
-            if not other_uvs:
-                return
-        # Add the bordering UVs to our traversal selection
-        uvs |= bordering_uvs
+    unsorted_uvs: set[str] = set(other_uvs) - {origin_uv}
+    distances: dict[str, int] = get_hop_distances(
+        origin_uv, unsorted_uvs, topology
+    )
+    if len(distances) < len(unsorted_uvs):
+        # Any UVs which could not be reached must belong to a part of
+        # the mesh which cannot be reached by edge traversal, and is
+        # therefore disconnected
+        raise NonContiguousMeshSelectionError({origin_uv} | other_uvs)
+    uv: str
+    yield from sorted(
+        distances, key=lambda uv: (distances[uv], get_component_id(uv))
+    )
 
 
 def find_end_vertex(vertices: Iterable[str], origin_vertex: str = "") -> str:
@@ -236,6 +459,99 @@ def find_end_uv(uvs: Iterable[str], origin_uv: str = "") -> str:
     return deque(iter_sort_uvs_by_distance(origin_uv, other_uvs), maxlen=1)[-1]
 
 
+def _get_chain(
+    component_ids: Iterable[int],
+    get_adjacent_ids: Callable[[int], Iterable[int]],
+) -> list[int] | None:
+    """
+    Order the IDs of components forming a single open chain or closed loop,
+    from one end to the other, by walking adjacency between the components.
+
+    Parameters:
+        component_ids: The IDs of the components to order.
+        get_adjacent_ids: A function which returns the IDs of components
+            adjacent to the component with the given ID.
+
+    Returns:
+        A list of component IDs, or `None` if the components branch, or do
+        not form a single contiguous chain or loop.
+    """
+    component_ids = set(component_ids)
+    if not component_ids:
+        return []
+    component_id: int
+    adjacent_id: int
+    adjacent_ids: dict[int, tuple[int, ...]] = {}
+    for component_id in component_ids:
+        adjacent_ids[component_id] = tuple(
+            dict.fromkeys(
+                adjacent_id
+                for adjacent_id in get_adjacent_ids(component_id)
+                if adjacent_id in component_ids and adjacent_id != component_id
+            )
+        )
+        if len(adjacent_ids[component_id]) > 2:
+            # The chain branches
+            return None
+    end_ids: list[int] = [
+        component_id
+        for component_id, component_adjacent_ids in adjacent_ids.items()
+        if len(component_adjacent_ids) < 2
+    ]
+    if len(end_ids) not in (0, 2) and len(component_ids) > 1:
+        return None
+    # A closed loop has no ends, so any component can start the chain
+    component_id = min(end_ids or component_ids)
+    chain_ids: list[int] = [component_id]
+    previous_id: int = -1
+    next_ids: list[int]
+    while len(chain_ids) < len(component_ids):
+        next_ids = [
+            adjacent_id
+            for adjacent_id in adjacent_ids[component_id]
+            if adjacent_id != previous_id
+        ]
+        if (not next_ids) or next_ids[0] == chain_ids[0]:
+            # The remaining components are disconnected from this chain
+            return None
+        previous_id, component_id = component_id, next_ids[0]
+        chain_ids.append(component_id)
+    return chain_ids
+
+
+def _iter_sorted_contiguous_components(
+    components: Iterable[str],
+    get_adjacent_ids: Callable[[MeshTopology, int], Iterable[int]],
+) -> Iterable[str]:
+    """
+    Yield contiguous components in order from one end to the other, or
+    raise an error if the components do not form a single chain or loop.
+    """
+    components = tuple(components)
+    if not components:
+        return
+    topology: MeshTopology = _get_topology(components)
+    component_type: str = components[0].rpartition(".")[-1].partition("[")[0]
+    component_ids: list[int] | None = _get_chain(
+        map(get_component_id, components),
+        partial(get_adjacent_ids, topology),
+    )
+    if component_ids is None:
+        raise NonLinearSelectionError(components)
+    yield from _get_components_sequence(
+        topology.shape, component_type, component_ids
+    )
+
+
+def _iter_edge_edge_ids(topology: MeshTopology, edge_id: int) -> Iterable[int]:
+    """
+    Yield the IDs of all edges sharing a vertex with an edge.
+    """
+    vertex_id: int
+    for vertex_id in topology.get_edge_vertex_ids(edge_id):
+        yield from topology.get_vertex_edge_ids(vertex_id)
+
+
 def iter_sorted_contiguous_vertices(vertices: Iterable[str]) -> Iterable[str]:
     """
     Given a set of vertices along an edge loop, yield the vertices in
@@ -248,14 +564,9 @@ def iter_sorted_contiguous_vertices(vertices: Iterable[str]) -> Iterable[str]:
     Parameters:
         vertices: A sequence of vertices along an edge loop.
     """
-    vertices = set(vertices)
-    vertex: str = find_end_vertex(vertices)
-    vertices.remove(vertex)
-    yield vertex
-    while vertices:
-        vertex = (get_shared_edge_vertices({vertex}) & vertices).pop()
-        vertices.remove(vertex)
-        yield vertex
+    yield from _iter_sorted_contiguous_components(
+        vertices, MeshTopology.iter_vertex_vertex_ids
+    )
 
 
 def iter_sorted_contiguous_edges(edges: Iterable[str]) -> Iterable[str]:
@@ -267,22 +578,7 @@ def iter_sorted_contiguous_edges(edges: Iterable[str]) -> Iterable[str]:
     Parameters:
         edges: Two or more contiguous edges
     """
-    edges = set(edges)
-    edge: str
-    for edge in iter_vertices_edges(
-        iter_sorted_contiguous_vertices(
-            cmds.ls(
-                *cmds.polyListComponentConversion(
-                    *edges, fromEdge=True, toVertex=True
-                ),
-                flatten=True,
-            )
-        )
-    ):
-        yield edge
-        edges.remove(edge)
-    # If the edges formed a closed loop, there will be one more remaining
-    yield from edges
+    yield from _iter_sorted_contiguous_components(edges, _iter_edge_edge_ids)
 
 
 def iter_sorted_contiguous_uvs(uvs: Iterable[str]) -> Iterable[str]:
@@ -297,14 +593,9 @@ def iter_sorted_contiguous_uvs(uvs: Iterable[str]) -> Iterable[str]:
     Parameters:
         uvs: A sequence of UVs along an edge loop.
     """
-    uvs = set(uvs)
-    uv: str = find_end_vertex(uvs)
-    uvs.remove(uv)
-    yield uv
-    while uvs:
-        uv = (get_shared_face_edge_uvs({uv}) & uvs).pop()
-        uvs.remove(uv)
-        yield uv
+    yield from _iter_sorted_contiguous_components(
+        uvs, MeshTopology.get_uv_uv_ids
+    )
 
 
 def iter_sorted_vertices(vertices: Iterable[str]) -> Iterable[str]:
@@ -346,6 +637,76 @@ def get_component_id(component: str) -> int:
     return int(component.rpartition("[")[-1].rpartition("]")[0])
 
 
+def _iter_components_positions(
+    components: Iterable[str],
+    get_positions: Callable[[str], Sequence[float]],
+    dimensions: int,
+) -> Iterator[tuple[float, ...]]:
+    """
+    Yield the coordinates of each component, read from the bulk positions
+    of the shape each component belongs to.
+    """
+    shape: str = ""
+    positions: Sequence[float] = ()
+    component: str
+    component_shape: str
+    index: int
+    for component in components:
+        component_shape = component.rpartition(".")[0]
+        if component_shape != shape:
+            shape = component_shape
+            positions = get_positions(shape)
+        index = get_component_id(component) * dimensions
+        yield tuple(positions[index : index + dimensions])
+
+
+def iter_vertices_positions(
+    vertices: Iterable[str], *, world_space: bool = True
+) -> Iterator[tuple[float, float, float]]:
+    """
+    Yield the position of each vertex, read from the bulk vertex positions
+    of its shape rather than by querying each vertex.
+
+    Parameters:
+        vertices: One or more vertices.
+        world_space: If `True`, yield world-space positions, otherwise
+            yield object-space positions.
+    """
+    return _iter_components_positions(  # type: ignore
+        vertices,
+        partial(get_mesh_vertex_positions, world_space=world_space),
+        3,
+    )
+
+
+def iter_uvs_positions(uvs: Iterable[str]) -> Iterator[tuple[float, float]]:
+    """
+    Yield the position of each UV, read from the bulk UV positions of its
+    shape rather than by querying each UV.
+    """
+    return _iter_components_positions(  # type: ignore
+        uvs, get_mesh_uv_positions, 2
+    )
+
+
+def get_vertex_position(
+    vertex: str, *, world_space: bool = True
+) -> tuple[float, float, float]:
+    """
+    Get the position of a vertex, read from the bulk vertex positions of
+    its shape.
+    """
+    return next(iter_vertices_positions((vertex,), world_space=world_space))
+
+
+def get_uv_position(uv: str) -> tuple[float, float]:
+    """
+    Get the position of a UV, read from the bulk UV positions of its
+    shape.
+    """
+    return next(iter_uvs_positions((uv,)))
+
+
 def get_component_shape(component: str) -> str | None:
     """
     If `selection` is a polygon component, return the shape,
@@ -420,20 +781,20 @@ def iter_selected_components(
             yield selected
 
 
-def get_uvs_shared_edge(*uvs: str) -> str:
+def get_uvs_shared_edge(
+    *uvs: str, topology: MeshTopology | None = None
+) -> str:
     """
     Get the edge shared by two or more UVs
     """
+    topology = _get_topology(uvs, topology)
     uv: str
     shared_edges: set | None = None
     for uv in uvs:
-        uv_edges: set[str] = set(
-            cmds.ls(
-                *cmds.polyListComponentConversion(
-                    uv, fromUV=True, toEdge=True
-                ),
-                flatten=True,
-            )
+        uv_edges: set[str] = _get_components(
+            topology.shape,
+            "e",
+            topology.get_uv_edge_ids(get_component_id(uv)),
         )
         if shared_edges is None:
             shared_edges = uv_edges
@@ -444,62 +805,65 @@ def get_uvs_shared_edge(*uvs: str) -> str:
     return shared_edges.pop()
 
 
-def iter_uvs_edges(uvs: Iterable[str]) -> Iterable[str]:
+def iter_uvs_edges(
+    uvs: Iterable[str], topology: MeshTopology | None = None
+) -> Iterable[str]:
     """
     Yield the edges between a series of ordered UVs, in the same
     order as the UVs
     """
-    uvs = iter(uvs)
-    try:
-        start_uv: str = next(uvs)
-    except StopIteration:
+    uvs = tuple(uvs)
+    if not uvs:
         return
+    topology = _get_topology(uvs, topology)
+    start_uv: str = uvs[0]
     end_uv: str
-    for end_uv in uvs:
-        yield get_uvs_shared_edge(start_uv, end_uv)
+    for end_uv in uvs[1:]:
+        yield get_uvs_shared_edge(start_uv, end_uv, topology=topology)
         start_uv = end_uv
 
 
-def iter_vertices_edges(vertices: Iterable[str]) -> Iterable[str]:
+def iter_vertices_edges(
+    vertices: Iterable[str], topology: MeshTopology | None = None
+) -> Iterable[str]:
     """
     Yield the edges between a series of ordered vertices, in the same
     order as the vertices
     """
-    vertices = iter(vertices)
-    try:
-        start_vertex: str = next(vertices)
-    except StopIteration:
+    vertices = tuple(vertices)
+    if not vertices:
         return
+    topology = _get_topology(vertices, topology)
+    start_vertex: str = vertices[0]
     end_vertex: str
-    for end_vertex in vertices:
-        yield from cmds.polyListComponentConversion(
-            start_vertex,
-            end_vertex,
-            fromVertex=True,
-            toEdge=True,
-            internal=True,
+    edge_id: int
+    for end_vertex in vertices[1:]:
+        edge_id = topology.get_vertices_edge_id(
+            get_component_id(start_vertex), get_component_id(end_vertex)
         )
+        if edge_id >= 0:
+            yield f"{topology.shape}.e[{edge_id}]"
         start_vertex = end_vertex
 
 
-def iter_edges_vertices(edges: Iterable[str]) -> Iterable[str]:
+def iter_edges_vertices(
+    edges: Iterable[str], topology: MeshTopology | None = None
+) -> Iterable[str]:
     """
     Yield the vertices between a series of ordered edges, in the same
     order as the edges
     """
-    edges = iter(edges)
+    edges = tuple(edges)
+    if not edges:
+        return
+    topology = _get_topology(edges, topology)
     previous_vertices: set[str] | None = None
     edge: str
     for edge in edges:
-        vertices: set[str] = set(
-            cmds.ls(
-                *cmds.polyListComponentConversion(
-                    edge,
-                    fromEdge=True,
-                    toVertex=True,
-                ),
-                flatten=True,
-            )
+        vertices: set[str] = _get_components(
+            topology.shape,
+            "vtx",
+            topology.get_edge_vertex_ids(get_component_id(edge)),
         )
         if previous_vertices is not None:
             yield from previous_vertices - vertices
@@ -510,24 +874,24 @@ def iter_edges_vertices(edges: Iterable[str]) -> Iterable[str]:
     yield from (previous_vertices or ())
 
 
-def iter_edges_uvs(edges: Iterable[str]) -> Iterable[str]:
+def iter_edges_uvs(
+    edges: Iterable[str], topology: MeshTopology | None = None
+) -> Iterable[str]:
     """
     Yield the UVs between a series of ordered edges, in the same
     order as the edges
     """
-    edges = iter(edges)
+    edges = tuple(edges)
+    if not edges:
+        return
+    topology = _get_topology(edges, topology)
     previous_uvs: set[str] | None = None
     edge: str
     for edge in edges:
-        uvs: set[str] = set(
-            cmds.ls(
-                *cmds.polyListComponentConversion(
-                    edge,
-                    fromEdge=True,
-                    toUV=True,
-                ),
-                flatten=True,
-            )
+        uvs: set[str] = _get_components(
+            topology.shape,
+            "map",
+            topology.get_edge_uv_ids(get_component_id(edge)),
         )
         if previous_uvs is not None:
             yield from previous_uvs - uvs
@@ -546,14 +910,7 @@ def get_distance_between(
     """
     Get the (total) distance between two or more 3d or 2d coordinates
     """
-    a: float
-    b: float
-    distance: float = sqrt(
-        sum(abs(a - b) ** 2 for a, b in zip(position_a, position_b))
-    )
-    if args:
-        return distance + get_distance_between(position_b, *args)
-    return distance
+    return get_polyline_length(position_a, position_b, *args)
 
 
 def get_least_deviant_midpoint_vertex(
@@ -565,19 +922,16 @@ def get_least_deviant_midpoint_vertex(
     Get the vertex with coordinates which deviate least from the line
     connecting a start and end point position.
     """
-    least_deviant_vertex: str = ""
-    least_deviant_length: float = 0.0
-    vertex: str
-    for vertex in midpoint_vertices:
-        length: float = get_distance_between(
-            start_point_position,
-            cmds.pointPosition(vertex),
-            end_point_position,
-        )
-        if (not least_deviant_vertex) or (length < least_deviant_length):
-            least_deviant_length = length
-            least_deviant_vertex = vertex
-    return least_deviant_vertex
+    midpoint_vertices = tuple(midpoint_vertices)
+    shape: str = get_components_shape(midpoint_vertices)
+    component_id: int = get_least_deviant_id(
+        get_mesh_vertex_positions(shape),
+        3,
+        tuple(map(get_component_id, midpoint_vertices)),
+        start_point_position,
+        end_point_position,
+    )
+    return f"{shape}.vtx[{component_id}]"
 
 
 def get_least_deviant_midpoint_uv(
@@ -589,196 +943,397 @@ def get_least_deviant_midpoint_uv(
     Get the UV with coordinates which deviate least from the line
     connecting a start and end point positions.
     """
-    least_deviant_uv: str = ""
-    least_deviant_length: float = 0.0
-    uv: str
-    for uv in midpoint_uvs:
-        length: float = get_distance_between(
-            start_point_position,
-            tuple(cmds.polyEditUV(uv, query=True)),
-            end_point_position,
-        )
-        if (not least_deviant_uv) or (length < least_deviant_length):
-            least_deviant_length = length
-            least_deviant_uv = uv
-    return least_deviant_uv
+    midpoint_uvs = tuple(midpoint_uvs)
+    shape: str = get_components_shape(midpoint_uvs)
+    component_id: int = get_least_deviant_id(
+        get_mesh_uv_positions(shape),
+        2,
+        tuple(map(get_component_id, midpoint_uvs)),
+        start_point_position,
+        end_point_position,
+    )
+    return f"{shape}.map[{component_id}]"
+
+
+def _get_shortest_path_layers(  # noqa: C901
+    start_id: int,
+    end_id: int,
+    get_adjacent_ids: Callable[[int], Iterable[int]],
+) -> list[set[int]] | None:
+    """
+    Perform a bidirectional breadth-first search between two components,
+    and return a list of sets, wherein each set contains the IDs of every
+    component at that index along *any* of the paths connected by the fewest
+    possible number of edges.
+
+    Frontiers are expanded alternately (whichever is smaller) from either
+    end, one level at a time, until they meet, so only the neighborhood of
+    the path is explored.
+
+    Parameters:
+        start_id: The ID of the component at the start of the path.
+        end_id: The ID of the component at the end of the path.
+        get_adjacent_ids: A function which returns the IDs of components
+            adjacent to the component with the given ID.
+
+    Returns:
+        A list of component ID sets, or `None` if the start and end
+        components are not connected.
+    """
+    if start_id == end_id:
+        return [{start_id}]
+    start_distances: dict[int, int] = {start_id: 0}
+    end_distances: dict[int, int] = {end_id: 0}
+    start_frontier: list[int] = [start_id]
+    end_frontier: list[int] = [end_id]
+    meeting_ids: list[int] = []
+    frontier: list[int]
+    distances: dict[int, int]
+    other_distances: dict[int, int]
+    next_frontier: list[int]
+    component_id: int
+    adjacent_id: int
+    distance: int
+    expand_start: bool
+    while not meeting_ids:
+        if not (start_frontier and end_frontier):
+            return None
+        expand_start = len(start_frontier) <= len(end_frontier)
+        if expand_start:
+            frontier, distances, other_distances = (
+                start_frontier,
+                start_distances,
+                end_distances,
+            )
+        else:
+            frontier, distances, other_distances = (
+                end_frontier,
+                end_distances,
+                start_distances,
+            )
+        check_progress(len(frontier))
+        next_frontier = []
+        distance = distances[frontier[0]] + 1
+        for component_id in frontier:
+            for adjacent_id in get_adjacent_ids(component_id):
+                if adjacent_id in distances:
+                    continue
+                distances[adjacent_id] = distance
+                next_frontier.append(adjacent_id)
+                if adjacent_id in other_distances:
+                    meeting_ids.append(adjacent_id)
+        if expand_start:
+            start_frontier = next_frontier
+        else:
+            end_frontier = next_frontier
+    # Only components with the shortest combined distance are on a
+    # shortest path (all meeting components share the same distance from
+    # the side just expanded)
+    path_length: int = min(
+        start_distances[component_id] + end_distances[component_id]
+        for component_id in meeting_ids
+    )
+    meeting_layer: set[int] = {
+        component_id
+        for component_id in meeting_ids
+        if start_distances[component_id] + end_distances[component_id]
+        == path_length
+    }
+    meeting_index: int = start_distances[next(iter(meeting_layer))]
+    layers: list[set[int]] = [set() for _ in range(path_length + 1)]
+    layers[meeting_index] = meeting_layer
+    index: int
+    # Walk back toward the start, retaining only components one step
+    # closer to the start than a component in the subsequent layer
+    for index in range(meeting_index - 1, -1, -1):
+        layers[index] = {
+            adjacent_id
+            for component_id in layers[index + 1]
+            for adjacent_id in get_adjacent_ids(component_id)
+            if start_distances.get(adjacent_id) == index
+        }
+    # Walk forward toward the end, retaining only components one step
+    # closer to the end than a component in the preceding layer
+    for index in range(meeting_index + 1, path_length + 1):
+        layers[index] = {
+            adjacent_id
+            for component_id in layers[index - 1]
+            for adjacent_id in get_adjacent_ids(component_id)
+            if end_distances.get(adjacent_id) == path_length - index
+        }
+    return layers
+
+
+def _get_geometric_shortest_path(
+    start_id: int,
+    end_id: int,
+    get_adjacent_ids: Callable[[int], Iterable[int]],
+    positions: Sequence[float],
+    dimensions: int = 3,
+) -> list[int] | None:
+    """
+    Perform an A* search between two components, and return the IDs of the
+    components along the path with the shortest total edge length.
+
+    Parameters:
+        start_id: The ID of the component at the start of the path.
+        end_id: The ID of the component at the end of the path.
+        get_adjacent_ids: A function which returns the IDs of components
+            adjacent to the component with the given ID.
+        positions: A flat sequence of component coordinates.
+        dimensions: The number of coordinates per component.
+
+    Returns:
+        A list of component IDs, or `None` if the start and end
+        components are not connected.
+    """
+
+    def get_position(component_id: int) -> Sequence[float]:
+        index: int = component_id * dimensions
+        return positions[index : index + dimensions]
+
+    end_position: Sequence[float] = get_position(end_id)
+    # Since no path can be shorter than a straight line, the distance to the
+    # end component is used as the search heuristic
+    queue: list[tuple[float, float, int]] = [
+        (dist(get_position(start_id), end_position), 0.0, start_id)
+    ]
+    lengths: dict[int, float] = {start_id: 0.0}
+    previous_ids: dict[int, int] = {}
+    length: float
+    component_id: int
+    component_position: Sequence[float]
+    adjacent_id: int
+    adjacent_position: Sequence[float]
+    adjacent_length: float
+    while queue:
+        check_progress()
+        length, component_id = heappop(queue)[1:]
+        if component_id == end_id:
+            path: list[int] = [end_id]
+            while component_id != start_id:
+                component_id = previous_ids[component_id]
+                path.append(component_id)
+            path.reverse()
+            return path
+        if length > lengths[component_id]:
+            # This is a stale queue entry
+            continue
+        component_position = get_position(component_id)
+        for adjacent_id in get_adjacent_ids(component_id):
+            adjacent_position = get_position(adjacent_id)
+            adjacent_length = length + dist(
+                component_position, adjacent_position
+            )
+            if adjacent_length < lengths.get(adjacent_id, inf):
+                lengths[adjacent_id] = adjacent_length
+                previous_ids[adjacent_id] = component_id
+                heappush(
+                    queue,
+                    (
+                        adjacent_length
+                        + dist(adjacent_position, end_position),
+                        adjacent_length,
+                        adjacent_id,
+                    ),
+                )
+    return None
 
 
 def iter_shortest_vertex_path(
-    start_vertex: str, end_vertex: str
+    start_vertex: str,
+    end_vertex: str,
+    topology: MeshTopology | None = None,
+    path_type: str = options.PathType.TOPOLOGICAL,
 ) -> Iterable[str]:
     """
-    Get a the vertex path connected by the fewest possible number of edges by
-    intersecting expanding rings of vertices from either end.
+    Get a the vertex path connected by the fewest possible number of edges,
+    using a bidirectional breadth-first search, or the path with the shortest
+    total edge length, using an A* search.
 
     Parameters:
         start_vertex: The vertex at the start of the path.
         end_vertex: The vertex at the end of the path.
+        topology: A topology snapshot of the shape the vertices belong to. If
+            not provided, the cached snapshot for the shape will be used.
+        path_type:
+            TOPOLOGICAL: Find the path traversing the fewest edges.
+            GEOMETRIC: Find the path with the shortest total edge length.
     """
 
     @cache
     def get_start_point_position() -> tuple[float, float, float]:
-        return tuple(cmds.pointPosition(start_vertex))
+        return get_vertex_position(start_vertex)
 
     @cache
     def get_end_point_position() -> tuple[float, float, float]:
-        return tuple(cmds.pointPosition(end_vertex))
+        return get_vertex_position(end_vertex)
 
-    start_vertex_rings: list[set[str]] = [{start_vertex}]
-    end_vertex_rings: list[set[str]] = [{end_vertex}]
     # Getting the component shape is done early
     # in order to raise an error if the vertices are not on the same shape,
-    # but is also used when raising an error, and for use with the polySelect
-    # command
+    # but is also used when raising an error
     shape: str = get_components_shape((start_vertex, end_vertex))
-    vertices: set[str] = {start_vertex}
-    expanded_vertices: set[str]
-    ring_vertices: set[str]
-    # Get a set of rings grown from the start vertex
-    while end_vertex not in vertices:
-        expanded_vertices = add_shared_edge_vertices(vertices)
-        ring_vertices = expanded_vertices - vertices
-        if not ring_vertices:
-            # If we can't expand any further, and still haven't reached
-            # the end vertex, it's not a contiguous mesh
+    if topology is None:
+        topology = get_mesh_topology(shape)
+    if path_type == options.PathType.GEOMETRIC:
+        vertex_ids: list[int] | None = _get_geometric_shortest_path(
+            get_component_id(start_vertex),
+            get_component_id(end_vertex),
+            topology.iter_vertex_vertex_ids,
+            get_mesh_vertex_positions(shape),
+        )
+        if vertex_ids is None:
             raise NonContiguousMeshSelectionError(shape)
-        start_vertex_rings.append(ring_vertices)
-        vertices = expanded_vertices
-    vertices = {end_vertex}
-    # Get a set of rings grown from the end vertex
-    while start_vertex not in vertices:
-        # Stop when we've reached the start vertex
-        if start_vertex in vertices:
-            break
-        expanded_vertices = add_shared_edge_vertices(vertices)
-        ring_vertices = expanded_vertices - vertices
-        end_vertex_rings.append(ring_vertices)
-        vertices = expanded_vertices
-    # We should now have two sets of vertex rings of equal length
-    start_vertex_ring: set[str]
-    end_vertex_ring: set[str]
-    vertex: str = ""
-    for start_vertex_ring, end_vertex_ring in zip(
-        start_vertex_rings, reversed(end_vertex_rings)
-    ):
-        ring_intersection: set[str] = start_vertex_ring & end_vertex_ring
-        # There will typically be only one intersecting vertex, however
+        yield from _get_components_sequence(shape, "vtx", vertex_ids)
+        return
+    start_vertex_id: int = get_component_id(start_vertex)
+    end_vertex_id: int = get_component_id(end_vertex)
+    layers: list[set[int]] | None = _get_shortest_path_layers(
+        start_vertex_id,
+        end_vertex_id,
+        topology.iter_vertex_vertex_ids,
+    )
+    if layers is None:
+        # If the search can't expand any further, and still hasn't reached
+        # the end vertex, it's not a contiguous mesh
+        raise NonContiguousMeshSelectionError(shape)
+    layer: set[int]
+    vertex_id: int = -1
+    for layer in layers:
+        # There will typically be only one vertex in a layer, however
         # when there is more than one shortest (having the least edges)
         # path between the vertices, we need to make sure that the path
         # we choose is contiguous. When multiple contiguous options for
         # traversal exist, we choose the one which is most nearly aligned
         # with the vector between the start and end vertices.
-        if vertex and len(ring_intersection) > 1:
+        if vertex_id >= 0 and len(layer) > 1:
             # Intersect with only the vertices adjacent to the previously
             # yielded vertex
-            ring_intersection &= add_shared_edge_vertices({vertex})
-        if len(ring_intersection) > 1:
-            vertex = get_least_deviant_midpoint_vertex(
+            layer &= {vertex_id, *topology.iter_vertex_vertex_ids(vertex_id)}
+        if len(layer) > 1:
+            vertex_id = get_least_deviant_id(
+                get_mesh_vertex_positions(shape),
+                3,
+                sorted(layer),
                 get_start_point_position(),
                 get_end_point_position(),
-                ring_intersection,
             )
         else:
-            vertex = ring_intersection.pop()
-        yield vertex
+            vertex_id = layer.pop()
+        yield f"{shape}.vtx[{vertex_id}]"
 
 
-def iter_shortest_uv_path(start_uv: str, end_uv: str) -> Iterable[str]:
+def iter_shortest_uv_path(
+    start_uv: str,
+    end_uv: str,
+    topology: MeshTopology | None = None,
+    path_type: str = options.PathType.TOPOLOGICAL,
+) -> Iterable[str]:
     """
-    Get a the UV path connected by the fewest possible number of edges by
-    intersecting expanding rings of UVs from either end.
+    Get a the UV path connected by the fewest possible number of edges,
+    using a bidirectional breadth-first search, or the path with the shortest
+    total edge length, using an A* search.
 
     Parameters:
         start_uv: The UV at the start of the path.
         end_uv: The UV at the end of the path.
+        topology: A topology snapshot of the shape the UVs belong to. If
+            not provided, the cached snapshot for the shape will be used.
+        path_type:
+            TOPOLOGICAL: Find the path traversing the fewest edges.
+            GEOMETRIC: Find the path with the shortest total edge length.
     """
 
     @cache
     def get_start_point_position() -> tuple[float, float]:
-        return tuple(cmds.polyEditUV(start_uv, query=True))
+        return get_uv_position(start_uv)
 
     @cache
     def get_end_point_position() -> tuple[float, float]:
-        return tuple(cmds.polyEditUV(end_uv, query=True))
+        return get_uv_position(end_uv)
 
-    start_uv_rings: list[set[str]] = [{start_uv}]
-    end_uv_rings: list[set[str]] = [{end_uv}]
     # Getting the component shape is done early
     # in order to raise an error if the UVs are not on the same shape,
-    # but is also used when raising an error, and for use with the polySelect
-    # command
+    # but is also used when raising an error
     shape: str = get_components_shape((start_uv, end_uv))
-    uvs: set[str] = {start_uv}
-    expanded_uvs: set[str]
-    ring_uvs: set[str]
-    # Get a set of rings grown from the start UV
-    while end_uv not in uvs:
-        expanded_uvs = add_shared_face_edge_uvs(uvs)
-        ring_uvs = expanded_uvs - uvs
-        if not ring_uvs:
-            # If we can't expand any further, and still haven't reached
-            # the end UV, it's not a contiguous mesh
+    if topology is None:
+        topology = get_mesh_topology(shape)
+    if path_type == options.PathType.GEOMETRIC:
+        uv_ids: list[int] | None = _get_geometric_shortest_path(
+            get_component_id(start_uv),
+            get_component_id(end_uv),
+            topology.get_uv_uv_ids,
+            get_mesh_uv_positions(shape),
+            dimensions=2,
+        )
+        if uv_ids is None:
             raise NonContiguousMeshSelectionError(shape)
-        start_uv_rings.append(ring_uvs)
-        uvs = expanded_uvs
-    uvs = {end_uv}
-    # Get a set of rings grown from the end UV
-    while start_uv not in uvs:
-        # Stop when we've reached the start UV
-        if start_uv in uvs:
-            break
-        expanded_uvs = add_shared_face_edge_uvs(uvs)
-        ring_uvs = expanded_uvs - uvs
-        end_uv_rings.append(ring_uvs)
-        uvs = expanded_uvs
-    # We should now have two sets of UV rings of equal length
-    start_uv_ring: set[str]
-    end_uv_ring: set[str]
-    uv: str = ""
-    for start_uv_ring, end_uv_ring in zip(
-        start_uv_rings, reversed(end_uv_rings)
-    ):
-        ring_intersection: set[str] = start_uv_ring & end_uv_ring
-        # There will typically be only one intersecting UV, however
+        yield from _get_components_sequence(shape, "map", uv_ids)
+        return
+    start_uv_id: int = get_component_id(start_uv)
+    end_uv_id: int = get_component_id(end_uv)
+    layers: list[set[int]] | None = _get_shortest_path_layers(
+        start_uv_id,
+        end_uv_id,
+        topology.get_uv_uv_ids,
+    )
+    if layers is None:
+        # If the search can't expand any further, and still hasn't reached
+        # the end UV, it's not a contiguous mesh
+        raise NonContiguousMeshSelectionError(shape)
+    layer: set[int]
+    uv_id: int = -1
+    for layer in layers:
+        # There will typically be only one UV in a layer, however
         # when there is more than one shortest (having the least edges)
         # path between the UVs, we need to make sure that the path
         # we choose is contiguous. When multiple contiguous options for
         # traversal exist, we choose the one which is most nearly aligned
         # with the vector between the start and end UVs.
-        if uv and len(ring_intersection) > 1:
+        if uv_id >= 0 and len(layer) > 1:
             # Intersect with only the UVs adjacent to the previously
             # yielded UV
-            ring_intersection &= add_shared_face_edge_uvs({uv})
-        if len(ring_intersection) > 1:
-            uv = get_least_deviant_midpoint_uv(
+            layer &= {uv_id, *topology.get_uv_uv_ids(uv_id)}
+        if len(layer) > 1:
+            uv_id = get_least_deviant_id(
+                get_mesh_uv_positions(shape),
+                2,
+                sorted(layer),
                 get_start_point_position(),
                 get_end_point_position(),
-                ring_intersection,
             )
         else:
-            uv = ring_intersection.pop()
-        yield uv
+            uv_id = layer.pop()
+        yield f"{shape}.map[{uv_id}]"
 
 
-def iter_shortest_vertices_path(vertices: Iterable[str]) -> Iterable[str]:
+def iter_shortest_vertices_path(
+    vertices: Iterable[str],
+    path_type: str = options.PathType.TOPOLOGICAL,
+) -> Iterable[str]:
     """
     Given two or more vertices, yield the vertices forming the shortest
     path between them.
 
     Parameters:
         vertices: Two or more vertices.
+        path_type:
+            TOPOLOGICAL: Find the path traversing the fewest edges.
+            GEOMETRIC: Find the path with the shortest total edge length.
     """
-    vertices = iter(vertices)
-    try:
-        start_vertex: str = next(vertices)
-    except StopIteration:
+    vertices = tuple(vertices)
+    if not vertices:
         return
+    topology: MeshTopology = get_mesh_topology(get_components_shape(vertices))
+    start_vertex: str = vertices[0]
     is_first: bool = True
     end_vertex: str
-    for end_vertex in vertices:
+    for end_vertex in vertices[1:]:
         segment_vertices: Iterable[str] = iter_shortest_vertex_path(
             start_vertex,
             end_vertex,
+            topology,
+            path_type,
         )
         yield from (
             segment_vertices
@@ -790,25 +1345,33 @@ def iter_shortest_vertices_path(vertices: Iterable[str]) -> Iterable[str]:
         is_first = False
 
 
-def iter_shortest_uvs_path(uvs: Iterable[str]) -> Iterable[str]:
+def iter_shortest_uvs_path(
+    uvs: Iterable[str],
+    path_type: str = options.PathType.TOPOLOGICAL,
+) -> Iterable[str]:
     """
     Given two or more UVs, yield the UVs forming the shortest
     path between them.
 
     Parameters:
         uvs: Two or more UVs.
+        path_type:
+            TOPOLOGICAL: Find the path traversing the fewest edges.
+            GEOMETRIC: Find the path with the shortest total edge length.
     """
-    uvs = iter(uvs)
-    try:
-        start_uv: str = next(uvs)
-    except StopIteration:
+    uvs = tuple(uvs)
+    if not uvs:
         return
+    topology: MeshTopology = get_mesh_topology(get_components_shape(uvs))
+    start_uv: str = uvs[0]
     is_first: bool = True
     end_uv: str
-    for end_uv in uvs:
+    for end_uv in uvs[1:]:
         segment_uvs: Iterable[str] = iter_shortest_uv_path(
             start_uv,
             end_uv,
+            topology,
+            path_type,
         )
         yield from (
             segment_uvs
@@ -820,6 +1383,148 @@ def iter_shortest_uvs_path(uvs: Iterable[str]) -> Iterable[str]:
         is_first = False
 
 
+def _get_vertices_paths_edge_lengths(
+    paths: Sequence[Sequence[str]],
+) -> list[float]:
+    """
+    Get the length of each edge between consecutive vertices of any number
+    of vertex paths on one mesh, concatenated in order.
+    """
+    shape: str = get_components_shape(chain.from_iterable(paths))
+    topology: MeshTopology = get_mesh_topology(shape)
+    edge_lengths: Sequence[float] = get_mesh_edge_lengths(shape)
+    path: Sequence[str]
+    path_edge_lengths: list[float] = []
+    for path in paths:
+        vertex_ids: tuple[int, ...] = tuple(map(get_component_id, path))
+        vertex_id: int
+        next_vertex_id: int
+        edge_id: int
+        for vertex_id, next_vertex_id in zip(vertex_ids, vertex_ids[1:]):
+            edge_id = topology.get_vertices_edge_id(vertex_id, next_vertex_id)
+            if edge_id == -1:
+                raise InvalidSelectionError(path)
+            if not edge_lengths[edge_id]:
+                raise ValueError(f"{shape}.e[{edge_id}]")
+            path_edge_lengths.append(edge_lengths[edge_id])
+    return path_edge_lengths
+
+
+def _get_uvs_paths_edge_lengths(
+    paths: Sequence[Sequence[str]],
+) -> list[float]:
+    """
+    Get the UV-space length of each edge between consecutive UVs of any
+    number of UV paths on one mesh, concatenated in order.
+    """
+    shape: str = get_components_shape(chain.from_iterable(paths))
+    topology: MeshTopology = get_mesh_topology(shape)
+    uv_edge_lengths: Sequence[float] = get_mesh_uv_edge_lengths(shape)
+    path: Sequence[str]
+    path_edge_lengths: list[float] = []
+    for path in paths:
+        uv_ids: tuple[int, ...] = tuple(map(get_component_id, path))
+        uv_id: int
+        next_uv_id: int
+        index: int
+        for uv_id, next_uv_id in zip(uv_ids, uv_ids[1:]):
+            try:
+                index = topology.uv_uv_offsets[uv_id] + tuple(
+                    topology.get_uv_uv_ids(uv_id)
+                ).index(next_uv_id)
+            except ValueError as error:
+                raise InvalidSelectionError(path) from error
+            if not uv_edge_lengths[index]:
+                raise ValueError(
+                    f"{shape}.map[{uv_id}]", f"{shape}.map[{next_uv_id}]"
+                )
+            path_edge_lengths.append(uv_edge_lengths[index])
+    return path_edge_lengths
+
+
+def _get_paths_uniform_positions(
+    paths: Sequence[Sequence[str]], spans: int
+) -> list[float]:
+    """
+    Get a number from 0 to `spans` for each component of each path,
+    concatenated in order, spaced uniformly along each path.
+    """
+    path: Sequence[str]
+    index: int
+    return [
+        (index / (len(path) - 1)) * spans
+        for path in paths
+        for index in range(len(path))
+    ]
+
+
+def get_vertices_paths_positions(
+    paths: Iterable[Sequence[str]],
+    spans: int = 1,
+    *,
+    proportional: bool = False,
+) -> Sequence[float]:
+    """
+    Given any number of paths of two or more adjacent vertices (on one mesh),
+    get a number from 0 to `spans` for each vertex of each path indicating
+    where on a curve or surface the vertex should be positioned, computing
+    the positions for all paths at once.
+
+    Parameters:
+        paths: Two or more adjacent vertices per path.
+        spans: The number at which the last vertex of each path should be
+            positioned.
+        proportional: If `True`, positions are proportional to the distance
+            traversed along each path, otherwise they are uniform.
+
+    Returns:
+        A flat sequence of positions, for each vertex of each path, in
+        order.
+    """
+    paths = tuple(paths)
+    if not proportional:
+        return _get_paths_uniform_positions(paths, spans)
+    path: Sequence[str]
+    return get_path_parameters(
+        _get_vertices_paths_edge_lengths(paths),
+        [len(path) - 1 for path in paths],
+        spans,
+    )
+
+
+def get_uvs_paths_positions(
+    paths: Iterable[Sequence[str]],
+    spans: int = 1,
+    *,
+    proportional: bool = False,
+) -> Sequence[float]:
+    """
+    Given any number of paths of two or more adjacent UVs (on one mesh), get
+    a number from 0 to `spans` for each UV of each path indicating where on
+    a curve or surface the UV should be positioned, computing the positions
+    for all paths at once. Proportions are based on UV-space edge lengths.
+
+    Parameters:
+        paths: Two or more adjacent UVs per path.
+        spans: The number at which the last UV of each path should be
+            positioned.
+        proportional: If `True`, positions are proportional to the distance
+            traversed along each path, otherwise they are uniform.
+
+    Returns:
+        A flat sequence of positions, for each UV of each path, in order.
+    """
+    paths = tuple(paths)
+    if not proportional:
+        return _get_paths_uniform_positions(paths, spans)
+    path: Sequence[str]
+    return get_path_parameters(
+        _get_uvs_paths_edge_lengths(paths),
+        [len(path) - 1 for path in paths],
+        spans,
+    )
+
+
 def iter_vertices_path_proportional_positions(
     vertices: Iterable[str], spans: int = 1
 ) -> Iterable[tuple[str, float]]:
@@ -837,37 +1542,10 @@ def iter_vertices_path_proportional_positions(
         positioned.
     """
     vertices = vertices if isinstance(vertices, tuple) else tuple(vertices)
-    edge_lengths: list[float] = []
-    previous_vertex: str = ""
-    vertex: str
-    edge_length: float
-    for vertex in vertices:
-        if previous_vertex:
-            try:
-                edge: str = cmds.polyListComponentConversion(
-                    previous_vertex,
-                    vertex,
-                    fromVertex=True,
-                    toEdge=True,
-                    internal=True,
-                )[0]
-            except IndexError as error:
-                raise InvalidSelectionError(vertices) from error
-            edge_length = cmds.arclen(edge)
-            if not edge_length:
-                raise ValueError(edge)
-            edge_lengths.append(
-                # The length of the preceding edge
-                edge_length
-            )
-        else:
-            edge_lengths.append(0)
-        previous_vertex = vertex
-    total_edge_length: float = sum(edge_lengths)
-    traversed_edge_length: float = 0.0
-    for vertex, edge_length in zip(vertices, edge_lengths):
-        traversed_edge_length += edge_length
-        yield vertex, spans * (traversed_edge_length / total_edge_length)
+    return zip(
+        vertices,
+        get_vertices_paths_positions((vertices,), spans, proportional=True),
+    )
 
 
 def iter_uvs_path_proportional_positions(
@@ -876,7 +1554,8 @@ def iter_uvs_path_proportional_positions(
     """
     Given two or more adjacent UVs, yield tuples with each UV and a
     number from 0 to `spans` indicating where on the path each UV should
-    be positioned for proportional distribution.
+    be positioned for proportional distribution. Proportions are based on
+    UV-space edge lengths.
 
     Parameters:
         uvs: Two or more UVs.
@@ -887,35 +1566,12 @@ def iter_uvs_path_proportional_positions(
         positioned.
     """
     uvs = uvs if isinstance(uvs, tuple) else tuple(uvs)
-    edge_lengths: list[float] = []
-    previous_uv: str = ""
-    uv: str
-    edge_length: float
-    for uv in uvs:
-        if previous_uv:
-            try:
-                edge: str = get_uvs_shared_edge(previous_uv, uv)
-            except IndexError as error:
-                raise InvalidSelectionError(uvs) from error
-            edge_length = cmds.arclen(edge)
-            if not edge_length:
-                raise ValueError(edge)
-            edge_lengths.append(
-                # The length of the preceding edge
-                edge_length
-            )
-        else:
-            edge_lengths.append(0)
-        previous_uv = uv
-    total_edge_length: float = sum(edge_lengths)
-    traversed_edge_length: float = 0.0
-    for uv, edge_length in zip(uvs, edge_lengths):
-        traversed_edge_length += edge_length
-        yield uv, spans * (traversed_edge_length / total_edge_length)
+    return zip(uvs, get_uvs_paths_positions((uvs,), spans, proportional=True))
 
 
 def iter_shortest_vertices_path_proportional_positions(
     selected_vertices: Iterable[str],
+    path_type: str = options.PathType.TOPOLOGICAL,
 ) -> Iterable[tuple[str, float]]:
     """
     Given two or more vertices, yield the vertices forming the shortest
@@ -924,6 +1580,7 @@ def iter_shortest_vertices_path_proportional_positions(
 
     Parameters:
         vertices: Two or more vertices.
+        path_type: TOPOLOGICAL | GEOMETRIC
 
     Yields:
         A tuple containing the vertex name and a number from 0-1 indicating
@@ -931,13 +1588,14 @@ def iter_shortest_vertices_path_proportional_positions(
     """
     selected_vertices = tuple(selected_vertices)
     yield from iter_vertices_path_proportional_positions(
-        iter_shortest_vertices_path(selected_vertices),
+        iter_shortest_vertices_path(selected_vertices, path_type),
         spans=len(selected_vertices) - 1,
     )
 
 
 def iter_shortest_uvs_path_proportional_positions(
     selected_uvs: Iterable[str],
+    path_type: str = options.PathType.TOPOLOGICAL,
 ) -> Iterable[tuple[str, float]]:
     """
     Given two or more UVs, yield the UVs forming the shortest
@@ -946,6 +1604,7 @@ def iter_shortest_uvs_path_proportional_positions(
 
     Parameters:
         uvs: Two or more UVs.
+        path_type: TOPOLOGICAL | GEOMETRIC
 
     Yields:
         A tuple containing the UV name and a number from 0-1 indicating
@@ -953,7 +1612,7 @@ def iter_shortest_uvs_path_proportional_positions(
     """
     selected_uvs = tuple(selected_uvs)
     yield from iter_uvs_path_proportional_positions(
-        iter_shortest_uvs_path(selected_uvs),
+        iter_shortest_uvs_path(selected_uvs, path_type),
         spans=len(selected_uvs) - 1,
     )
 
@@ -1010,6 +1669,7 @@ def iter_uvs_path_uniform_positions(
 
 def iter_shortest_vertices_path_uniform_positions(
     selected_vertices: Iterable[str],
+    path_type: str = options.PathType.TOPOLOGICAL,
 ) -> Iterable[tuple[str, float]]:
     """
     Given two or more vertices, yield the vertices forming the shortest
@@ -1018,6 +1678,7 @@ def iter_shortest_vertices_path_uniform_positions(
 
     Parameters:
         vertices: Two or more vertices.
+        path_type: TOPOLOGICAL | GEOMETRIC
 
     Yields:
         A tuple containing the vertex name and a number from 0-1 indicating
@@ -1025,13 +1686,14 @@ def iter_shortest_vertices_path_uniform_positions(
     """
     selected_vertices = tuple(selected_vertices)
     yield from iter_vertices_path_uniform_positions(
-        iter_shortest_vertices_path(selected_vertices),
+        iter_shortest_vertices_path(selected_vertices, path_type),
         spans=len(selected_vertices) - 1,
     )
 
 
 def iter_shortest_uvs_path_uniform_positions(
     selected_uvs: Iterable[str],
+    path_type: str = options.PathType.TOPOLOGICAL,
 ) -> Iterable[tuple[str, float]]:
     """
     Given two or more UVs, yield the UVs forming the shortest
@@ -1040,6 +1702,7 @@ def iter_shortest_uvs_path_uniform_positions(
 
     Parameters:
         uvs: Two or more UVs.
+        path_type: TOPOLOGICAL | GEOMETRIC
 
     Yields:
         A tuple containing the UV name and a number from 0-1 indicating
@@ -1047,7 +1710,7 @@ def iter_shortest_uvs_path_uniform_positions(
     """
     selected_uvs = tuple(selected_uvs)
     yield from iter_uvs_path_uniform_positions(
-        iter_shortest_uvs_path(selected_uvs),
+        iter_shortest_uvs_path(selected_uvs, path_type),
         spans=len(selected_uvs) - 1,
     )
 
@@ -1059,53 +1722,32 @@ def _get_contiguous_edges_terminal_vertices(
     Get the vertices at the start and end of the given sequence
     of contiguous edges.
     """
+    shape: str = get_components_shape(edges)
+
+    def get_edges_vertex_ids(*edges: str) -> set[int]:
+        return set(
+            convert_component_ids(
+                shape, map(get_component_id, edges), "e", "vtx"
+            )
+        )
+
     if len(edges) == 1:
         # Both edge vertices are ends
-        return tuple(
-            cmds.ls(
-                *cmds.polyListComponentConversion(
-                    *edges, fromEdge=True, toVertex=True
-                ),
-                flatten=True,
-            )[:2]
+        return _get_components_sequence(  # type: ignore
+            shape, "vtx", sorted(get_edges_vertex_ids(edges[0]))
         )
-    return (
-        (
-            set(
-                cmds.ls(
-                    *cmds.polyListComponentConversion(
-                        edges[0], fromEdge=True, toVertex=True
-                    ),
-                    flatten=True,
-                )
-            )
-            - set(
-                cmds.ls(
-                    *cmds.polyListComponentConversion(
-                        edges[1], fromEdge=True, toVertex=True
-                    ),
-                    flatten=True,
-                )
-            )
-        ).pop(),
+    return _get_components_sequence(  # type: ignore
+        shape,
+        "vtx",
         (
-            set(
-                cmds.ls(
-                    *cmds.polyListComponentConversion(
-                        edges[-1], fromEdge=True, toVertex=True
-                    ),
-                    flatten=True,
-                )
-            )
-            - set(
-                cmds.ls(
-                    *cmds.polyListComponentConversion(
-                        edges[-2], fromEdge=True, toVertex=True
-                    ),
-                    flatten=True,
-                )
-            )
-        ).pop(),
+            (
+                get_edges_vertex_ids(edges[0]) - get_edges_vertex_ids(edges[1])
+            ).pop(),
+            (
+                get_edges_vertex_ids(edges[-1])
+                - get_edges_vertex_ids(edges[-2])
+            ).pop(),
+        ),
     )
 
 
@@ -1222,34 +1864,30 @@ def _iter_align_closed_loop_contiguous_edges(
     origin_vertex: str = find_end_vertex(
         other_vertices, origin_vertex=vertex_loops[0][0]
     )
-    vertex_loop_sets: tuple[set[str], ...] = tuple(map(set, vertex_loops))
-    unused_loop_indices: set[int] = set(range(len(vertex_loops)))
     # Now we will find the closest vertex to the origin on each other loop,
     # and align the vertex loops so that each begins/ends with that vertex
-    vertices: set[str] = {origin_vertex}
-    sorted_vertex_loops: list[tuple[str, ...]] = []
-    while unused_loop_indices:
-        index: int
-        for index in tuple(unused_loop_indices):
-            matched_vertices: set[str] = vertices & vertex_loop_sets[index]
-            if matched_vertices:
-                sorted_vertex_loops.append(
-                    _get_rotated_vertex_loop(
-                        vertex_loops[index], matched_vertices.pop()
-                    )
-                )
-                unused_loop_indices.remove(index)
-                break
-        if unused_loop_indices:
-            shared_edge_vertices: set = get_shared_edge_vertices(vertices)
-            if not shared_edge_vertices:
-                # If there are loops unconsumed, but we can't grow the
-                # vertex selection any further, the mesh is likely not
-                # contiguous
-                raise NonContiguousMeshSelectionError(edge_loops)
-            vertices |= shared_edge_vertices
+    distances: dict[str, int] = get_hop_distances(
+        origin_vertex, chain(*vertex_loops)
+    )
+    nearest_vertices: list[tuple[int, int, str]] = []
+    index: int
+    vertex: str
+    for index, vertex_loop in enumerate(vertex_loops):
+        loop_distances: list[tuple[int, int, str]] = [
+            (distances[vertex], index, vertex)
+            for vertex in vertex_loop
+            if vertex in distances
+        ]
+        if not loop_distances:
+            # If a loop can't be reached from the origin, the mesh is
+            # likely not contiguous
+            raise NonContiguousMeshSelectionError(edge_loops)
+        nearest_vertices.append(min(loop_distances))
     for vertex_loop in _iter_directionally_aligned_vertex_loops(
-        sorted_vertex_loops
+        [
+            _get_rotated_vertex_loop(vertex_loops[index], vertex)
+            for _, index, vertex in sorted(nearest_vertices)
+        ]
     ):
         yield tuple(iter_vertices_edges(vertex_loop))
 
@@ -1274,32 +1912,27 @@ def _iter_align_closed_loop_contiguous_uvs(
     # but we can marginaslly reduce overhead by use a known endpoint and
     # excluding the UVs in that end points looop
     origin_uv: str = find_end_uv(other_uvs, origin_uv=uv_loops[0][0])
-    uv_loop_sets: tuple[set[str], ...] = tuple(map(set, uv_loops))
-    unused_loop_indices: set[int] = set(range(len(uv_loops)))
     # Now we will find the closest UV to the origin on each other loop,
     # and align the UV loops so that each begins/ends with that UV
-    uvs: set[str] = {origin_uv}
-    sorted_uv_loops: list[tuple[str, ...]] = []
-    while unused_loop_indices:
-        index: int
-        for index in tuple(unused_loop_indices):
-            matched_uvs: set[str] = uvs & uv_loop_sets[index]
-            if matched_uvs:
-                sorted_uv_loops.append(
-                    _get_rotated_uv_loop(uv_loops[index], matched_uvs.pop())
-                )
-                unused_loop_indices.remove(index)
-                break
-        if unused_loop_indices:
-            shared_edge_uvs: set = get_shared_face_edge_uvs(uvs)
-            if not shared_edge_uvs:
-                # If there are loops unconsumed, but we can't grow the
-                # UV selection any further, the mesh is likely not
-                # contiguous
-                raise NonContiguousMeshSelectionError(uv_loops)
-            uvs |= shared_edge_uvs
-    for uv_loop in _iter_directionally_aligned_uv_loops(sorted_uv_loops):
-        yield uv_loop
+    distances: dict[str, int] = get_hop_distances(origin_uv, chain(*uv_loops))
+    nearest_uvs: list[tuple[int, int, str]] = []
+    index: int
+    uv: str
+    for index, uv_loop in enumerate(uv_loops):
+        loop_distances: list[tuple[int, int, str]] = [
+            (distances[uv], index, uv) for uv in uv_loop if uv in distances
+        ]
+        if not loop_distances:
+            # If a loop can't be reached from the origin, the mesh is
+            # likely not contiguous
+            raise NonContiguousMeshSelectionError(uv_loops)
+        nearest_uvs.append(min(loop_distances))
+    yield from _iter_directionally_aligned_uv_loops(
+        [
+            _get_rotated_uv_loop(uv_loops[index], uv)
+            for _, index, uv in sorted(nearest_uvs)
+        ]
+    )
 
 
 def is_closed_edge_loop(edges: tuple[str, ...]) -> bool:
@@ -1307,31 +1940,22 @@ def is_closed_edge_loop(edges: tuple[str, ...]) -> bool:
     Given a tuple of (sorted) edges, return `True` if they form
     a closed loop, otherwise return `False`
     """
+    shape: str = get_components_shape(edges)
     return bool(
         set(
-            cmds.ls(
-                *cmds.polyListComponentConversion(
-                    edges[0],
-                    toVertex=True,
-                    fromEdge=True,
-                ),
-                flatten=True,
+            convert_component_ids(
+                shape, (get_component_id(edges[0]),), "e", "vtx"
             )
         )
         & set(
-            cmds.ls(
-                *cmds.polyListComponentConversion(
-                    edges[-1],
-                    toVertex=True,
-                    fromEdge=True,
-                ),
-                flatten=True,
+            convert_component_ids(
+                shape, (get_component_id(edges[-1]),), "e", "vtx"
             )
         )
     )
 
 
-def iter_aligned_contiguous_edges(  # noqa: C901
+def iter_aligned_contiguous_edges(
     *selected_edges: str,
 ) -> Iterable[tuple[str, ...]]:
     """
@@ -1383,53 +2007,41 @@ def iter_aligned_contiguous_edges(  # noqa: C901
     # Since it's now unused, we will re-populate `edge_loop_segments`
     # with sorted edge loops
     edge_loop_segments.clear()
-    edge_loop_ids: list[set[int]] = []
     # Sort the edge loops
     start_vertex: str
     for start_vertex in iter_sorted_vertices(start_vertices_edges.keys()):
-        edge_loop_segment: tuple[str, ...] = start_vertices_edges[start_vertex]
-        edge_loop_segments.append(edge_loop_segment)
-        edge_loop_ids.append(set(map(get_component_id, edge_loop_segment)))
+        edge_loop_segments.append(start_vertices_edges[start_vertex])
     # Trim edges which don't have a corresponding edge (one on the same ring)
     # on all other segments
-    shape: str = get_components_shape(chain(*edge_loop_segments))
-    length: int = len(edge_loop_segments)
-    for index, edge_loop_segment in enumerate(edge_loop_segments):
+    edge_index: EdgeIndex = get_mesh_edge_index(
+        get_components_shape(chain(*edge_loop_segments))
+    )
+    segments_ring_ids: list[list[int]] = [
+        [
+            edge_index.ring_ids[get_component_id(edge)]
+            for edge in edge_loop_segment
+        ]
+        for edge_loop_segment in edge_loop_segments
+    ]
+    # Rings which pass through every segment
+    shared_ring_ids: set[int] = set(segments_ring_ids[0]).intersection(
+        *segments_ring_ids[1:]
+    )
+    segment_ring_ids: list[int]
+    for edge_loop_segment, segment_ring_ids in zip(
+        edge_loop_segments, segments_ring_ids
+    ):
         start_index: int = 0
         stop_index: int | None = None
-        segment_length: int = len(edge_loop_segment)
         segment_index: int
-        edge: str
-        ring_edge_ids: set[int]
-        matched: bool
-        other_index: int
-        for segment_index, edge in enumerate(edge_loop_segment):
-            ring_edge_ids = set(
-                cmds.polySelect(shape, edgeRing=get_component_id(edge))
-            )
-            matched = True
-            for other_index in range(length):
-                if other_index == index:
-                    continue
-                if not ring_edge_ids & edge_loop_ids[other_index]:
-                    matched = False
-                    break
-            if matched:
+        ring_id: int
+        for segment_index, ring_id in enumerate(segment_ring_ids):
+            if ring_id in shared_ring_ids:
                 start_index = segment_index
                 break
-        for segment_index, edge in enumerate(reversed(edge_loop_segment)):
-            ring_edge_ids = set(
-                cmds.polySelect(shape, edgeRing=get_component_id(edge))
-            )
-            matched = True
-            for other_index in range(length):
-                if other_index == index:
-                    continue
-                if not ring_edge_ids & edge_loop_ids[other_index]:
-                    matched = False
-                    break
-            if matched:
-                stop_index = segment_length - segment_index
+        for segment_index, ring_id in enumerate(reversed(segment_ring_ids)):
+            if ring_id in shared_ring_ids:
+                stop_index = len(segment_ring_ids) - segment_index
                 break
         yield edge_loop_segment[start_index:stop_index]
 
@@ -1537,7 +2149,170 @@ def iter_aligned_contiguous_uvs(
         yield uv_loop_segment[start_index:stop_index]
 
 
-def iter_contiguous_edges(  # noqa: C901
+def _get_branch_segments(  # noqa: C901
+    component_ids: Sequence[int],
+    adjacent_ids: dict[int, tuple[int, ...]],
+) -> list[list[int]]:
+    """
+    Split a contiguous group of components which branches into chains.
+
+    Each chain starts at the lowest unvisited component having at most one
+    unvisited neighbor (or, if there is none, at the lowest unvisited
+    component), and continues to the lowest unvisited neighbor of the last
+    component until none remains.
+
+    Parameters:
+        component_ids: The IDs of the components in the group, sorted.
+        adjacent_ids: The IDs of each component's neighbors in the group.
+    """
+    component_id: int
+    # The number of unvisited neighbors of each component
+    counts: dict[int, int] = {
+        component_id: len(adjacent_ids[component_id])
+        for component_id in component_ids
+    }
+    # Components with at most one unvisited neighbor, which may be
+    # visited already (the list is sorted, so it is already a heap)
+    end_ids: list[int] = [
+        component_id
+        for component_id in component_ids
+        if counts[component_id] < 2
+    ]
+    visited: set[int] = set()
+    # The index of the lowest component which may not have been visited
+    index: int = 0
+
+    def get_start_id() -> int:
+        nonlocal index
+        start_id: int
+        while end_ids:
+            start_id = heappop(end_ids)
+            if start_id not in visited:
+                return start_id
+        while component_ids[index] in visited:
+            index += 1
+        return component_ids[index]
+
+    segments: list[list[int]] = []
+    segment: list[int]
+    adjacent_id: int
+    next_id: int
+    while len(visited) < len(component_ids):
+        component_id = get_start_id()
+        segment = []
+        while component_id >= 0:
+            segment.append(component_id)
+            visited.add(component_id)
+            next_id = -1
+            for adjacent_id in adjacent_ids[component_id]:
+                if adjacent_id in visited:
+                    continue
+                counts[adjacent_id] -= 1
+                if counts[adjacent_id] == 1:
+                    heappush(end_ids, adjacent_id)
+                if next_id < 0 or adjacent_id < next_id:
+                    next_id = adjacent_id
+            component_id = next_id
+        segments.append(segment)
+    return segments
+
+
+def _get_contiguous_segments(  # noqa: C901
+    component_ids: Iterable[int],
+    get_adjacent_ids: Callable[[int], Iterable[int]],
+) -> list[list[int]]:
+    """
+    Group components into contiguous segments (chains or closed loops),
+    using a disjoint-set forest, and order each segment by walking it.
+
+    Segments are returned in order of their lowest component ID. Each
+    segment is oriented such that its lowest component ID is preceded by
+    the lower of that component's neighbors' IDs, and closed loops start
+    with their highest component ID. Groups which branch are split into
+    chains by `_get_branch_segments`, which are returned in the order they
+    are walked.
+
+    Parameters:
+        component_ids: The IDs of the components to group.
+        get_adjacent_ids: A function which returns the IDs of components
+            adjacent to the component with the given ID.
+    """
+    component_ids = sorted(set(component_ids))
+    members: set[int] = set(component_ids)
+    component_id: int
+    adjacent_id: int
+    adjacent_ids: dict[int, tuple[int, ...]] = {
+        component_id: tuple(
+            dict.fromkeys(
+                adjacent_id
+                for adjacent_id in get_adjacent_ids(component_id)
+                if adjacent_id in members and adjacent_id != component_id
+            )
+        )
+        for component_id in component_ids
+    }
+    parents: dict[int, int] = {
+        component_id: component_id for component_id in component_ids
+    }
+
+    def get_root(component_id: int) -> int:
+        while parents[component_id] != component_id:
+            # Path halving
+            parents[component_id] = parents[parents[component_id]]
+            component_id = parents[component_id]
+        return component_id
+
+    root: int
+    adjacent_root: int
+    for component_id in component_ids:
+        for adjacent_id in adjacent_ids[component_id]:
+            root = get_root(component_id)
+            adjacent_root = get_root(adjacent_id)
+            if root != adjacent_root:
+                # The lowest ID in each set is its root
+                parents[max(root, adjacent_root)] = min(root, adjacent_root)
+    groups: dict[int, list[int]] = {}
+    for component_id in component_ids:
+        groups.setdefault(get_root(component_id), []).append(component_id)
+    segments: list[list[int]] = []
+    segment: list[int] | None
+    lowest_id: int
+    index: int
+    for lowest_id, group in groups.items():
+        segment = _get_chain(group, adjacent_ids.__getitem__)
+        if segment is None:
+            segments.extend(_get_branch_segments(group, adjacent_ids))
+            continue
+        if len(segment) > 1:
+            if len(adjacent_ids[segment[0]]) > 1:
+                # This is a closed loop, so start with the highest ID
+                index = segment.index(group[-1])
+                segment = segment[index:] + segment[:index]
+                index = segment.index(lowest_id)
+                if segment[index - 1] != min(adjacent_ids[lowest_id]):
+                    segment[1:] = reversed(segment[1:])
+            else:
+                index = segment.index(lowest_id)
+                if (not index) or segment[index - 1] != min(
+                    adjacent_ids[lowest_id]
+                ):
+                    segment.reverse()
+        segments.append(segment)
+    return segments
+
+
+def _iter_edge_uv_edge_ids(
+    topology: MeshTopology, edge_id: int
+) -> Iterable[int]:
+    """
+    Yield the IDs of all edges sharing a UV with an edge.
+    """
+    uv_id: int
+    for uv_id in topology.get_edge_uv_ids(edge_id):
+        yield from topology.get_uv_edge_ids(uv_id)
+
+
+def iter_contiguous_edges(
     *selected_edges: str,
 ) -> Iterable[tuple[str, ...]]:
     """
@@ -1548,64 +2323,18 @@ def iter_contiguous_edges(  # noqa: C901
             numbers edges each, with ends alignged along perpendicular
             edge loops forming a rectangular section of a mesh.
     """
-    edges: set[str] = set(selected_edges)
-    edge_loop_segments: list[list[str]] = []
-    edge_loop_segment: list[str]
-    # Organize edges into contiguous segments
-    while edges:
-        edge: str = edges.pop()
-        adjacent_edges: set[str] = set(get_shared_vertex_edges({edge}))
-        # This is a list of edge loop segment indices where the edge could be
-        # appended. Since two segments could be matched for the same edge,
-        # we need to retain this as a list.
-        found: int | None = None
-        index: int
-        for index, edge_loop_segment in enumerate(edge_loop_segments):
-            if not edge_loop_segment:
-                continue
-            if edge_loop_segment[0] in adjacent_edges:
-                # This edge is adjacent to the first edge in the segment
-                if found is None:
-                    edge_loop_segment.insert(0, edge)
-                    found = index
-                    # Keep looking to see if there is a second match
-                    continue
-                else:
-                    if edge == edge_loop_segments[found][-1]:
-                        edge_loop_segments[found].extend(edge_loop_segment)
-                    else:
-                        edge_loop_segments[found] = (
-                            list(reversed(edge_loop_segment))
-                            + edge_loop_segments[found]
-                        )
-                    edge_loop_segment.clear()
-                    break
-            if edge_loop_segment[-1] in adjacent_edges:
-                # This edge is adjacent to the last edge in the segment
-                if found is None:
-                    edge_loop_segment.append(edge)
-                    found = index
-                    # Keep looking to see if there is a second match
-                    continue
-                else:
-                    if edge == edge_loop_segments[found][-1]:
-                        edge_loop_segments[found].extend(
-                            reversed(edge_loop_segment)
-                        )
-                    else:
-                        edge_loop_segments[found] = (
-                            list(edge_loop_segment) + edge_loop_segments[found]
-                        )
-                    edge_loop_segment.clear()
-                    break
-        if found is None:
-            # This edge is not adjacent to any segments started thus far
-            edge_loop_segments.append([edge])
-    # Remove the cleared segments (they've been joined with another)
-    yield from map(tuple, filter(None, edge_loop_segments))
+    if not selected_edges:
+        return
+    topology: MeshTopology = _get_topology(selected_edges)
+    edges: ComponentSet = ComponentSet.from_components(selected_edges, "e")
+    edge_loop_segment: list[int]
+    for edge_loop_segment in _get_contiguous_segments(
+        edges, partial(_iter_edge_edge_ids, topology)
+    ):
+        yield tuple(map(edges.get_component, edge_loop_segment))
 
 
-def iter_contiguous_uv_edges(  # noqa: C901
+def iter_contiguous_uv_edges(
     *selected_edges: str,
 ) -> Iterable[tuple[str, ...]]:
     """
@@ -1616,64 +2345,18 @@ def iter_contiguous_uv_edges(  # noqa: C901
             numbers edges each, with ends alignged along perpendicular
             edge loops forming a rectangular section of a mesh.
     """
-    edges: set[str] = set(selected_edges)
-    edge_loop_segments: list[list[str]] = []
-    edge_loop_segment: list[str]
-    # Organize edges into contiguous segments
-    while edges:
-        edge: str = edges.pop()
-        adjacent_edges: set[str] = set(get_shared_uv_edges({edge}))
-        # This is a list of edge loop segment indices where the edge could be
-        # appended. Since two segments could be matched for the same edge,
-        # we need to retain this as a list.
-        found: int | None = None
-        index: int
-        for index, edge_loop_segment in enumerate(edge_loop_segments):
-            if not edge_loop_segment:
-                continue
-            if edge_loop_segment[0] in adjacent_edges:
-                # This edge is adjacent to the first edge in the segment
-                if found is None:
-                    edge_loop_segment.insert(0, edge)
-                    found = index
-                    # Keep looking to see if there is a second match
-                    continue
-                else:
-                    if edge == edge_loop_segments[found][-1]:
-                        edge_loop_segments[found].extend(edge_loop_segment)
-                    else:
-                        edge_loop_segments[found] = (
-                            list(reversed(edge_loop_segment))
-                            + edge_loop_segments[found]
-                        )
-                    edge_loop_segment.clear()
-                    break
-            if edge_loop_segment[-1] in adjacent_edges:
-                # This edge is adjacent to the last edge in the segment
-                if found is None:
-                    edge_loop_segment.append(edge)
-                    found = index
-                    # Keep looking to see if there is a second match
-                    continue
-                else:
-                    if edge == edge_loop_segments[found][-1]:
-                        edge_loop_segments[found].extend(
-                            reversed(edge_loop_segment)
-                        )
-                    else:
-                        edge_loop_segments[found] = (
-                            list(edge_loop_segment) + edge_loop_segments[found]
-                        )
-                    edge_loop_segment.clear()
-                    break
-        if found is None:
-            # This edge is not adjacent to any segments started thus far
-            edge_loop_segments.append([edge])
-    # Remove the cleared segments (they've been joined with another)
-    yield from map(tuple, filter(None, edge_loop_segments))
+    if not selected_edges:
+        return
+    topology: MeshTopology = _get_topology(selected_edges)
+    edges: ComponentSet = ComponentSet.from_components(selected_edges, "e")
+    edge_loop_segment: list[int]
+    for edge_loop_segment in _get_contiguous_segments(
+        edges, partial(_iter_edge_uv_edge_ids, topology)
+    ):
+        yield tuple(map(edges.get_component, edge_loop_segment))
 
 
-def iter_contiguous_uvs(  # noqa: C901
+def iter_contiguous_uvs(
     *selected_uvs: str,
 ) -> Iterable[tuple[str, ...]]:
     """
@@ -1685,91 +2368,31 @@ def iter_contiguous_uvs(  # noqa: C901
             numbers of UVs each, with ends alignged along perpendicular
             edge loops forming a rectangular section of a UV mesh.
     """
-    uvs: set[str] = set(selected_uvs)
-    uv_loop_segments: list[list[str]] = []
-    uv_loop_segment: list[str]
-    # This list stores one UV ID per/loop, in order to subsequently determine
-    # if any don't share a UV shell
-    representative_uv_ids: list[int | None] = []
-    # Organize edges into contiguous segments
-    while uvs:
-        uv: str = uvs.pop()
-        adjacent_uvs: set[str] = get_shared_face_edge_uvs({uv})
-        # This is a list of UV loop segment indices where the UV could be
-        # appended. Since two segments could be matched for the same UV,
-        # we need to retain this as a list.
-        found: int | None = None
-        index: int
-        for index, uv_loop_segment in enumerate(uv_loop_segments):
-            if not uv_loop_segment:
-                continue
-            if uv_loop_segment[0] in adjacent_uvs:
-                # This edge is adjacent to the first edge in the segment
-                if found is None:
-                    uv_loop_segment.insert(0, uv)
-                    found = index
-                    # Keep looking to see if there is a second match
-                    continue
-                else:
-                    if uv == uv_loop_segments[found][-1]:
-                        uv_loop_segments[found].extend(uv_loop_segment)
-                    else:
-                        uv_loop_segments[found] = (
-                            list(reversed(uv_loop_segment))
-                            + uv_loop_segments[found]
-                        )
-                    uv_loop_segment.clear()
-                    representative_uv_ids[index] = None
-                    break
-            if uv_loop_segment[-1] in adjacent_uvs:
-                # This UV is adjacent to the last UV in the segment
-                if found is None:
-                    uv_loop_segment.append(uv)
-                    found = index
-                    # Keep looking to see if there is a second match
-                    continue
-                else:
-                    if uv == uv_loop_segments[found][-1]:
-                        uv_loop_segments[found].extend(
-                            reversed(uv_loop_segment)
-                        )
-                    else:
-                        uv_loop_segments[found] = (
-                            list(uv_loop_segment) + uv_loop_segments[found]
-                        )
-                    uv_loop_segment.clear()
-                    representative_uv_ids[index] = None
-                    break
-        if found is None:
-            # This UV is not adjacent to any segments started thus far
-            uv_loop_segments.append([uv])
-            representative_uv_ids.append(get_component_id(uv))
+    if not selected_uvs:
+        return
+    topology: MeshTopology = _get_topology(selected_uvs)
+    uvs: ComponentSet = ComponentSet.from_components(selected_uvs, "map")
+    uv_loop_segments: list[list[int]] = _get_contiguous_segments(
+        uvs, topology.get_uv_uv_ids
+    )
+    uv_loop_segment: list[int]
     # If there are more than 2 UV loop segments, check to see if one is an
     # orphan, and abandon any orphans
     if len(uv_loop_segments) > 2:  # noqa: PLR2004
-        shape: str = get_components_shape(selected_uvs)
+        shell_ids: array = get_mesh_uv_shell_ids(uvs.shape)
+        # Count the segments on each shell (each segment is contiguous, so
+        # all of its UVs are on the same shell)
+        shell_segment_counts: Counter[int] = Counter(
+            shell_ids[uv_loop_segment[0]]
+            for uv_loop_segment in uv_loop_segments
+        )
         # Clear UV loops which aren't on the same shell as the rest
-        uv_id: int | None
-        other_index: int
-        other_uv_id: int | None
-        for index, uv_id in enumerate(representative_uv_ids):
-            if uv_id is None:
-                continue
-            found_path: bool = False
-            for other_index, other_uv_id in enumerate(representative_uv_ids):
-                if other_uv_id is None:
-                    continue
-                if index == other_index:
-                    continue
-                if cmds.polySelect(
-                    shape, shortestEdgePathUV=(uv_id, other_uv_id), query=True
-                ):
-                    found_path = True
-                    break
-            if not found_path:
-                uv_loop_segments[index].clear()
-    # Remove the cleared segments (they've been joined with another)
-    yield from map(tuple, filter(None, uv_loop_segments))
+        for uv_loop_segment in uv_loop_segments:
+            if shell_segment_counts[shell_ids[uv_loop_segment[0]]] == 1:
+                uv_loop_segment.clear()
+    # Remove the cleared segments (they've been orphaned)
+    for uv_loop_segment in filter(None, uv_loop_segments):
+        yield tuple(map(uvs.get_component, uv_loop_segment))
 
 
 def get_polymesh_shape_uvs_positions(
@@ -1779,13 +2402,12 @@ def get_polymesh_shape_uvs_positions(
     Intended for testing, this function returns a mapping of UV IDs
     to the UV-space coordinates
     """
-    uvs_positions: dict[int, tuple[float, float]] = {}
-    uv: str
-    for uv in cmds.ls(f"{shape}.map[*]", flatten=True):
-        uvs_positions[get_component_id(uv)] = tuple(
-            cmds.polyEditUV(uv, query=True)
-        )
-    return uvs_positions
+    positions: Sequence[float] = get_mesh_uv_positions(shape)
+    uv_id: int
+    return {
+        uv_id: tuple(map(float, positions[uv_id * 2 : uv_id * 2 + 2]))
+        for uv_id in range(len(positions) // 2)
+    }
 
 
 def get_polymesh_shape_vertices_positions(
@@ -1795,13 +2417,14 @@ def get_polymesh_shape_vertices_positions(
     Intended for testing, this function returns a mapping of vertex IDs
     to their 3d translation coordinates
     """
-    vertices_positions: dict[int, tuple[float, float, float]] = {}
-    vertex: str
-    for vertex in cmds.ls(f"{shape}.vtx[*]", flatten=True):
-        vertices_positions[get_component_id(vertex)] = tuple(
-            cmds.pointPosition(vertex)
+    positions: Sequence[float] = get_mesh_vertex_positions(shape)
+    vertex_id: int
+    return {
+        vertex_id: tuple(
+            map(float, positions[vertex_id * 3 : vertex_id * 3 + 3])
         )
-    return vertices_positions
+        for vertex_id in range(len(positions) // 3)
+    }
 
 
 def get_polymesh_shape_changed_vertices_positions(
@@ -1812,16 +2435,15 @@ def get_polymesh_shape_changed_vertices_positions(
     to their 3d translation coordinates for vertices which differ
     from those in the input `vertices_positions`.
     """
-    changed_vertices_positions: dict[int, tuple[float, float, float]] = {}
-    vertex: str
-    for vertex in cmds.ls(f"{shape}.vtx[*]", flatten=True):
-        vertex_id: int = get_component_id(vertex)
-        point_position: tuple[float, float, float] = tuple(
-            cmds.pointPosition(vertex)
+    vertex_id: int
+    point_position: tuple[float, float, float]
+    return {
+        vertex_id: point_position
+        for vertex_id, point_position in (
+            get_polymesh_shape_vertices_positions(shape).items()
         )
-        if point_position != vertices_positions.get(vertex_id):
-            changed_vertices_positions[vertex_id] = point_position
-    return changed_vertices_positions
+        if point_position != vertices_positions.get(vertex_id)
+    }
 
 
 def get_polymesh_shape_changed_uvs_positions(
@@ -1832,13 +2454,12 @@ def get_polymesh_shape_changed_uvs_positions(
     to their UV space coordinates for UVs which differ
     from those in the input `uvs_positions`.
     """
-    changed_uvs_positions: dict[int, tuple[float, float]] = {}
-    uv: str
-    for uv in cmds.ls(f"{shape}.map[*]", flatten=True):
-        uv_id: int = get_component_id(uv)
-        point_position: tuple[float, float] = tuple(
-            cmds.polyEditUV(uv, query=True)
+    uv_id: int
+    point_position: tuple[float, float]
+    return {
+        uv_id: point_position
+        for uv_id, point_position in (
+            get_polymesh_shape_uvs_positions(shape).items()
         )
-        if point_position != uvs_positions.get(uv_id):
-            changed_uvs_positions[uv_id] = point_position
-    return changed_uvs_positions
+        if point_position != uvs_positions.get(uv_id)
+    }
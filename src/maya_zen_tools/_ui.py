@@ -1,9 +1,15 @@
 from __future__ import annotations
 
 import sys
+import time
+from contextlib import contextmanager, suppress
+from typing import Iterator
 
 from maya import cmds  # type: ignore
 
+from maya_zen_tools import options
+from maya_zen_tools.errors import OperationCancelledError
+
 WINDOW: str = "zenToolsWindow"
 CONFIRMATION_WINDOW: str = "zenToolsConfirmationWindow"
 
@@ -70,6 +76,46 @@ def show_confirmation_dialogue(
     cmds.showWindow(CONFIRMATION_WINDOW)
 
 
+def show_path_type_options(tool: str, parent: str) -> None:
+    """
+    Show radio buttons for choosing the "path_type" option of a tool, in
+    an options window.
+
+    Parameters:
+        tool: The name of the tool the option is saved for.
+        parent: The layout to which the radio buttons should be added.
+    """
+    selected: int = 1
+    with suppress(ValueError):
+        selected = ("TOPOLOGICAL", "GEOMETRIC").index(
+            options.get_tool_option(  # type: ignore
+                tool, "path_type", options.PathType.TOPOLOGICAL
+            )
+        ) + 1
+    cmds.radioButtonGrp(
+        label="Path Type:",
+        parent=parent,
+        numberOfRadioButtons=2,
+        label1="Fewest Edges",
+        label2="Shortest Length",
+        columnAlign=(1, "left"),
+        changeCommand1=(
+            "from maya_zen_tools import options\n"
+            "options.set_tool_option("
+            f"{tool!r}, 'path_type', "
+            "'TOPOLOGICAL')"
+        ),
+        changeCommand2=(
+            "from maya_zen_tools import options\n"
+            "options.set_tool_option("
+            f"{tool!r}, 'path_type', "
+            "'GEOMETRIC')"
+        ),
+        select=selected,
+        height=30,
+    )
+
+
 IS_WINDOWS: bool = sys.platform.startswith("win")
 
 
@@ -89,3 +135,128 @@ def set_wait_cursor_state(state: bool) -> None:  # noqa: FBT001
     else:
         while cmds.waitCursor(query=True, state=True):
             cmds.waitCursor(state=False)
+
+
+# The number of units of work (typically component expansions) between
+# progress updates and cancellation checks
+DEFAULT_PROGRESS_INTERVAL: int = 10000
+
+
+class _Progress:
+    """
+    The state of an active progress context.
+    """
+
+    __slots__ = (
+        "count",
+        "deadline",
+        "interval",
+        "next_count",
+        "show_window",
+        "status",
+    )
+
+    def __init__(
+        self,
+        status: str,
+        deadline: float | None,
+        interval: int,
+        show_window: bool,
+    ) -> None:
+        self.status: str = status
+        self.deadline: float | None = deadline
+        self.interval: int = interval
+        self.show_window: bool = show_window
+        self.count: int = 0
+        self.next_count: int = interval
+
+
+_progress: _Progress | None = None
+
+
+@contextmanager
+def progress(
+    status: str = "",
+    budget: float | None = None,
+    interval: int = DEFAULT_PROGRESS_INTERVAL,
+) -> Iterator[None]:
+    """
+    Within this context, traversals report their progress in an
+    interruptable progress window (when Maya's UI is available), and raise
+    an `OperationCancelledError` if the user presses "Esc", or if the time
+    budget is exceeded. Operations should not modify the scene until
+    their traversals are complete, so that cancellation leaves the scene
+    unchanged.
+
+    Parameters:
+        status: The status message to display in the progress window.
+        budget: The maximum number of seconds to spend before cancelling.
+            If not provided, the "time_budget" option for "general" is
+            used, which can be set in the "About ZenTools" window, or with
+            `options.set_tool_option("general", "time_budget", seconds)`.
+            A budget of 0 (the default) means there is no limit.
+        interval: The number of units of work between progress updates and
+            cancellation checks.
+    """
+    global _progress
+    if _progress is not None:
+        # An enclosing context is already reporting progress
+        yield
+        return
+    if budget is None:
+        budget = float(
+            options.get_tool_option("general", "time_budget", 0)  # type: ignore
+        )
+    show_window: bool = not cmds.about(batch=True)
+    if show_window:
+        cmds.progressWindow(
+            title="ZenTools",
+            status=status,
+            progress=0,
+            maxValue=100,
+            isInterruptable=True,
+        )
+    _progress = _Progress(
+        status,
+        (time.monotonic() + budget) if budget else None,
+        interval,
+        show_window,
+    )
+    try:
+        yield
+    finally:
+        _progress = None
+        if show_window:
+            cmds.progressWindow(endProgress=True)
+
+
+def check_progress(count: int = 1) -> None:
+    """
+    Record units of work (typically component expansions) performed within
+    the active progress context, update the progress window periodically,
+    and raise an `OperationCancelledError` if the operation has been
+    cancelled. Outside of a progress context, this does nothing.
+
+    Parameters:
+        count: The number of units of work performed since the last check.
+    """
+    if _progress is None:
+        return
+    _progress.count += count
+    if _progress.count < _progress.next_count:
+        return
+    _progress.next_count = _progress.count + _progress.interval
+    if _progress.show_window:
+        if cmds.progressWindow(query=True, isCancelled=True):
+            raise OperationCancelledError(_progress.status)
+        # The amount of work is not known in advance, so the progress bar
+        # cycles, and the status shows the amount of work done
+        cmds.progressWindow(
+            edit=True,
+            progress=(_progress.count // _progress.interval) % 100,
+            status=f"{_progress.status} ({_progress.count:,})",
+        )
+    if _progress.deadline is not None and time.monotonic() > (
+        _progress.deadline
+    ):
+        raise OperationCancelledError(_progress.status)
@@ -21,6 +21,13 @@ class InvalidSelectionError(Exception):
     pass
 
 
+class OperationCancelledError(ZenToolsError):
+    """
+    Raised when a long-running operation is cancelled by the user, or
+    exceeds its time budget.
+    """
+
+
 class EdgesNotOnSameRingError(InvalidSelectionError):
     def __init__(self, shape: str, edge_ids: tuple[int, int]) -> None:
         self.shape: str = shape
@@ -1,108 +1,354 @@
 from __future__ import annotations
 
-from typing import Iterable
+from array import array
+from itertools import chain
+from typing import Any, Callable, Iterable
 
 from maya import cmds  # type: ignore
 
+from maya_zen_tools._components import ComponentSet
+from maya_zen_tools._topology import (
+    MeshTopology,
+    get_mesh_topology,
+    get_mesh_topology_data,
+)
 from maya_zen_tools._traverse import (
-    add_shared_face_edge_uvs,
     get_components_shape,
-    get_shared_edge_vertices,
     iter_selected_components,
 )
-from maya_zen_tools._ui import set_wait_cursor_state
+from maya_zen_tools._ui import (
+    check_progress,
+    progress,
+    set_wait_cursor_state,
+)
 
 
-def _iter_flood_select_vertices(
-    selected_vertices: Iterable[str], selected_edges: Iterable[str]
-) -> Iterable[str]:
-    if not selected_vertices:
-        return
-    border_vertices: set[str] = (
-        set(
-            cmds.ls(
-                *cmds.polyListComponentConversion(
-                    *selected_edges, fromEdge=True, toVertex=True
-                ),
-                flatten=True,
-            )
-        )
-        if selected_edges
-        else set()
+def _get_regions(
+    component_count: int,
+    border_mask: bytearray,
+    get_adjacent_ids: Callable[[int], Iterable[int]],
+) -> tuple[array, list[array]]:
+    """
+    Label the connected regions of components which are separated from one
+    another by border components, in a single pass.
+
+    Parameters:
+        component_count: The number of components of this type in the
+            shape.
+        border_mask: A mask with one byte per component ID, which is 1 for
+            border components.
+        get_adjacent_ids: A function returning the IDs of the components
+            adjacent to a component.
+
+    Returns:
+        A tuple containing an array with the region ID of each component
+        (-1 for border components), and a list of arrays (one per region)
+        containing the IDs of the components in each region.
+    """
+    region_ids: array = array("i", (-1,)) * component_count
+    regions: list[array] = []
+    region_id: int
+    region: array
+    index: int
+    component_id: int
+    adjacent_id: int
+    for component_id in range(component_count):
+        if border_mask[component_id] or region_ids[component_id] >= 0:
+            continue
+        region_id = len(regions)
+        region_ids[component_id] = region_id
+        # The region doubles as the queue for a breadth-first search, with
+        # everything from `index` onward being the frontier
+        region = array("i", (component_id,))
+        index = 0
+        while index < len(region):
+            check_progress()
+            for adjacent_id in get_adjacent_ids(region[index]):
+                if (
+                    region_ids[adjacent_id] < 0
+                    and not border_mask[adjacent_id]
+                ):
+                    region_ids[adjacent_id] = region_id
+                    region.append(adjacent_id)
+            index += 1
+        regions.append(region)
+    return region_ids, regions
+
+
+class FloodSegmentation:
+    """
+    A labeling of the regions of a polygon mesh which are enclosed by a set
+    of border edges, from which any number of flood selections can be
+    answered without traversing the mesh again.
+
+    Border vertices (and UVs) are not part of any region: they are included
+    in every flood, and a flood seeded from a border vertex fills every
+    region adjacent to that vertex. Face regions are labeled on the face
+    adjacency (dual) graph, in which border edges act as walls, so every
+    face belongs to exactly one region.
+
+    Attributes:
+        topology: The topology snapshot the segmentation was built from.
+        border_edge_bits: An integer bitset of the border edge IDs.
+        border_vertex_bits: An integer bitset of the border vertex IDs.
+        vertex_region_ids: The region ID of each vertex, or -1 for border
+            vertices.
+        vertex_regions: The IDs of the vertices in each vertex region.
+        border_uv_bits: An integer bitset of the border UV IDs.
+        uv_region_ids: The region ID of each UV, or -1 for border UVs.
+        uv_regions: The IDs of the UVs in each UV region.
+        face_region_ids: The region ID of each face.
+        face_regions: The IDs of the faces in each face region.
+    """
+
+    __slots__ = (
+        "border_edge_bits",
+        "border_uv_bits",
+        "border_vertex_bits",
+        "face_region_ids",
+        "face_regions",
+        "topology",
+        "uv_region_ids",
+        "uv_regions",
+        "vertex_region_ids",
+        "vertex_regions",
     )
-    vertices: set[str] = set(selected_vertices)
-    add_vertices: set[str] = set(selected_vertices)
-    # Expand the vertex selection until no new vertices are added
-    while add_vertices:
-        yield from add_vertices
-        # By removing border vertices, we ensure that our traversal will stop
-        # at the border, and once everything inside the border has been
-        # added/yielded, `add_vertices` will be empty, thereby halting the
-        # loop
-        add_vertices = get_shared_edge_vertices(vertices) - border_vertices
-        vertices |= add_vertices
-    yield from border_vertices
-
-
-def _iter_flood_select_faces(
-    selected_faces: Iterable[str], selected_edges: Iterable[str]
-) -> Iterable[str]:
-    if not selected_faces:
-        return
-    yield from set(
-        cmds.ls(
-            *cmds.polyListComponentConversion(
-                *_iter_flood_select_vertices(
-                    set(
-                        cmds.ls(
-                            *cmds.polyListComponentConversion(
-                                *selected_faces,
-                                fromFace=True,
-                                toVertex=True,
-                            ),
-                            flatten=True,
-                        )
-                    ),
-                    selected_edges,
-                ),
-                fromVertex=True,
-                toFace=True,
-                internal=True,
+
+    def __init__(self, topology: MeshTopology, border_edge_bits: int) -> None:
+        """
+        Parameters:
+            topology: A topology snapshot of the shape.
+            border_edge_bits: An integer bitset of the border edge IDs.
+        """
+        self.topology: MeshTopology = topology
+        self.border_edge_bits: int = border_edge_bits
+        edge_id: int
+        border_edges: ComponentSet = ComponentSet.from_bits(
+            topology.shape, "e", border_edge_bits
+        )
+        border_vertices: ComponentSet = ComponentSet(
+            topology.shape,
+            "vtx",
+            chain.from_iterable(
+                map(topology.get_edge_vertex_ids, border_edges)
             ),
-            flatten=True,
         )
-    )
+        self.border_vertex_bits: int = border_vertices.bits
+        self.vertex_region_ids: array
+        self.vertex_regions: list[array]
+        self.vertex_region_ids, self.vertex_regions = _get_regions(
+            topology.vertex_count,
+            border_vertices.get_mask(topology.vertex_count),
+            topology.iter_vertex_vertex_ids,
+        )
+        border_uvs: ComponentSet = ComponentSet(
+            topology.shape,
+            "map",
+            chain.from_iterable(map(topology.get_edge_uv_ids, border_edges)),
+        )
+        self.border_uv_bits: int = border_uvs.bits
+        self.uv_region_ids: array
+        self.uv_regions: list[array]
+        self.uv_region_ids, self.uv_regions = _get_regions(
+            topology.uv_count,
+            border_uvs.get_mask(topology.uv_count),
+            topology.get_uv_uv_ids,
+        )
+        border_edge_mask: bytearray = border_edges.get_mask(
+            topology.edge_count
+        )
 
+        def iter_face_face_ids(face_id: int) -> Iterable[int]:
+            # Faces sharing an edge which is not a border edge (this
+            # includes all faces on a non-manifold edge)
+            edge_id: int
+            other_face_id: int
+            for edge_id in topology.get_face_edge_ids(face_id):
+                if edge_id < 0 or border_edge_mask[edge_id]:
+                    continue
+                for other_face_id in topology.get_edge_face_ids(edge_id):
+                    if other_face_id != face_id:
+                        yield other_face_id
 
-def _iter_flood_select_uvs(
-    selected_uvs: Iterable[str], selected_edges: Iterable[str]
-) -> Iterable[str]:
-    if not selected_uvs:
-        return
-    border_uvs: set[str] = (
-        set(
-            cmds.ls(
-                *cmds.polyListComponentConversion(
-                    *selected_edges, fromEdge=True, toVertex=True
+        self.face_region_ids: array
+        self.face_regions: list[array]
+        self.face_region_ids, self.face_regions = _get_regions(
+            topology.face_count,
+            bytearray(topology.face_count),
+            iter_face_face_ids,
+        )
+
+    @property
+    def size(self) -> int:
+        """
+        The approximate memory footprint of the segmentation's arrays, in
+        bytes.
+        """
+        region: array
+        return sum(
+            len(region) * region.itemsize
+            for region in chain(
+                (
+                    self.vertex_region_ids,
+                    self.uv_region_ids,
+                    self.face_region_ids,
                 ),
-                flatten=True,
+                self.vertex_regions,
+                self.uv_regions,
+                self.face_regions,
             )
         )
-        if selected_edges
-        else set()
+
+    @staticmethod
+    def _get_region_ids(
+        component_ids: Iterable[int],
+        region_ids: array,
+        get_adjacent_ids: Callable[[int], Iterable[int]],
+    ) -> set[int]:
+        seed_region_ids: set[int] = set()
+        component_id: int
+        region_id: int
+        for component_id in component_ids:
+            region_id = region_ids[component_id]
+            if region_id >= 0:
+                seed_region_ids.add(region_id)
+            else:
+                # Border components belong to every adjacent region
+                seed_region_ids.update(
+                    region_ids[adjacent_id]
+                    for adjacent_id in get_adjacent_ids(component_id)
+                    if region_ids[adjacent_id] >= 0
+                )
+        return seed_region_ids
+
+    def get_vertex_region_ids(self, vertex_ids: Iterable[int]) -> set[int]:
+        """
+        Get the IDs of the regions containing the given vertices (or, for
+        border vertices, the regions adjacent to them).
+        """
+        return self._get_region_ids(
+            vertex_ids,
+            self.vertex_region_ids,
+            self.topology.iter_vertex_vertex_ids,
+        )
+
+    def get_uv_region_ids(self, uv_ids: Iterable[int]) -> set[int]:
+        """
+        Get the IDs of the regions containing the given UVs (or, for border
+        UVs, the regions adjacent to them).
+        """
+        return self._get_region_ids(
+            uv_ids, self.uv_region_ids, self.topology.get_uv_uv_ids
+        )
+
+    def get_face_region_ids(self, face_ids: Iterable[int]) -> set[int]:
+        """
+        Get the IDs of the regions containing the given faces.
+        """
+        face_id: int
+        return {self.face_region_ids[face_id] for face_id in face_ids}
+
+    def get_flood_vertices(self, vertices: ComponentSet) -> ComponentSet:
+        """
+        Get the vertices filling the regions containing the given vertices,
+        along with all border vertices.
+        """
+        region_id: int
+        return ComponentSet.from_bits(
+            vertices.shape, "vtx", self.border_vertex_bits
+        ) | chain.from_iterable(
+            self.vertex_regions[region_id]
+            for region_id in self.get_vertex_region_ids(vertices)
+        )
+
+    def get_flood_uvs(self, uvs: ComponentSet) -> ComponentSet:
+        """
+        Get the UVs filling the regions containing the given UVs, along with
+        all border UVs.
+        """
+        region_id: int
+        return ComponentSet.from_bits(
+            uvs.shape, "map", self.border_uv_bits
+        ) | chain.from_iterable(
+            self.uv_regions[region_id]
+            for region_id in self.get_uv_region_ids(uvs)
+        )
+
+    def get_flood_faces(self, faces: ComponentSet) -> ComponentSet:
+        """
+        Get the faces filling the regions containing the given faces.
+        """
+        region_id: int
+        return ComponentSet(
+            faces.shape,
+            "f",
+            chain.from_iterable(
+                self.face_regions[region_id]
+                for region_id in self.get_face_region_ids(faces)
+            ),
+        )
+
+
+def get_flood_segmentation(
+    shape: str, border_edges: Iterable[str] = ()
+) -> FloodSegmentation:
+    """
+    Get a segmentation of a polygon mesh into the regions enclosed by a set
+    of border edges. The most recent segmentation for each shape is cached
+    until the shape's topology changes, so repeated floods within the same
+    border edges do not need to traverse the mesh again.
+
+    Parameters:
+        shape: A polygon mesh shape, or the transform parenting it.
+        border_edges: Edges (belonging to `shape`) enclosing the regions.
+    """
+    border_edge_bits: int = ComponentSet.from_components(
+        border_edges, "e"
+    ).bits
+    data: dict[str, Any] = get_mesh_topology_data(shape)
+    segmentation: FloodSegmentation | None = data.get("flood_segmentation")
+    if (
+        segmentation is None
+        or segmentation.border_edge_bits != border_edge_bits
+    ):
+        segmentation = FloodSegmentation(
+            get_mesh_topology(shape), border_edge_bits
+        )
+        data["flood_segmentation"] = segmentation
+    return segmentation
+
+
+def _get_flood_select_vertices(
+    selected_vertices: Iterable[str], selected_edges: Iterable[str]
+) -> ComponentSet:
+    vertices: ComponentSet = ComponentSet.from_components(
+        selected_vertices, "vtx"
+    )
+    if not vertices:
+        return vertices
+    return get_flood_segmentation(
+        vertices.shape, selected_edges
+    ).get_flood_vertices(vertices)
+
+
+def _get_flood_select_faces(
+    selected_faces: Iterable[str], selected_edges: Iterable[str]
+) -> ComponentSet:
+    faces: ComponentSet = ComponentSet.from_components(selected_faces, "f")
+    if not faces:
+        return faces
+    return get_flood_segmentation(faces.shape, selected_edges).get_flood_faces(
+        faces
     )
-    uvs: set[str] = set(selected_uvs)
-    add_uvs: set[str] = set(selected_uvs)
-    # Expand the vertex selection until no new uvs are added
-    while add_uvs:
-        yield from add_uvs
-        # By removing border uvs, we ensure that our traversal will stop
-        # at the border, and once everything inside the border has been
-        # added/yielded, `add_uvs` will be empty, thereby halting the
-        # loop
-        add_uvs = add_shared_face_edge_uvs(uvs) - border_uvs
-        uvs |= add_uvs
-    yield from border_uvs
+
+
+def _get_flood_select_uvs(
+    selected_uvs: Iterable[str], selected_edges: Iterable[str]
+) -> ComponentSet:
+    uvs: ComponentSet = ComponentSet.from_components(selected_uvs, "map")
+    if not uvs:
+        return uvs
+    return get_flood_segmentation(uvs.shape, selected_edges).get_flood_uvs(uvs)
 
 
 def flood_select(*selection: str) -> tuple[str, ...]:
@@ -133,18 +379,32 @@ def flood_select(*selection: str) -> tuple[str, ...]:
         )
         # Raise an error if selected vertices span more than one mesh
         get_components_shape(selected_faces + selected_vertices + selected_uvs)
-        selected_components: tuple[str, ...] = (
-            tuple(
-                _iter_flood_select_vertices(selected_vertices, selected_edges)
+        # The selection is only changed once flooding is complete, so
+        # cancelling leaves the selection as it was
+        with progress("Flood Select"):
+            component_sets: tuple[ComponentSet, ...] = (
+                _get_flood_select_vertices(selected_vertices, selected_edges),
+                _get_flood_select_uvs(selected_uvs, selected_edges),
+                _get_flood_select_faces(selected_faces, selected_edges),
             )
-            + tuple(_iter_flood_select_uvs(selected_uvs, selected_edges))
-            + tuple(_iter_flood_select_faces(selected_faces, selected_edges))
-        )
+        component_set: ComponentSet
         cmds.select(
             *selection,
             deselect=True,
         )
-        cmds.select(*selected_components, add=True)
+        cmds.select(
+            *chain.from_iterable(
+                component_set.get_compact_components()
+                for component_set in component_sets
+            ),
+            add=True,
+        )
+        selected_components: tuple[str, ...] = tuple(
+            chain.from_iterable(
+                component_set.iter_components()
+                for component_set in component_sets
+            )
+        )
     finally:
         set_wait_cursor_state(False)
     return selected_components
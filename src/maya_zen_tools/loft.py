@@ -2,33 +2,36 @@ from __future__ import annotations
 
 import contextlib
 from functools import partial
-from itertools import chain
+from itertools import chain, repeat
 from math import ceil
-from typing import Callable, Iterable
+from typing import Callable, Iterable, Sequence
 
 from maya import cmds  # type: ignore
 
 from maya_zen_tools import options
+from maya_zen_tools._conversion import convert_components
 from maya_zen_tools._create import (
-    create_edges_rebuild_curve,
+    create_edges_curve,
     create_node,
     create_uvs_rebuild_curve,
 )
+from maya_zen_tools._nurbs import get_surface_points
+from maya_zen_tools._plugin import set_uvs_positions, set_vertices_positions
+from maya_zen_tools._topology import EdgeIndex, get_mesh_edge_index
 from maya_zen_tools._transform import center_pivot
 from maya_zen_tools._traverse import (
+    breadth_first_search_cache,
     get_component_id,
     get_components_shape,
+    get_uvs_paths_positions,
+    get_vertices_paths_positions,
     iter_aligned_contiguous_edges,
     iter_aligned_contiguous_uvs,
     iter_edges_vertices,
     iter_selected_components,
     iter_shortest_uvs_path,
-    iter_uvs_path_proportional_positions,
-    iter_uvs_path_uniform_positions,
-    iter_vertices_path_proportional_positions,
-    iter_vertices_path_uniform_positions,
 )
-from maya_zen_tools._ui import WINDOW, set_wait_cursor_state
+from maya_zen_tools._ui import WINDOW, progress, set_wait_cursor_state
 from maya_zen_tools.errors import EdgesNotOnSameRingError
 from maya_zen_tools.menu import (
     LOFT_DISTRIBUTE_UVS_BETWEEN_EDGES_OR_UVS_LABEL,
@@ -52,39 +55,38 @@ def _surface_distribute_vertices_between_edges(
     vertex_rings: tuple[tuple[str, ...], ...] = tuple(
         zip(*map(tuple, map(iter_edges_vertices, edges_ring)))
     )
-    point_on_surface_info: str = create_node("pointOnSurfaceInfo")
-    cmds.connectAttr(
-        surface_attribute,
-        f"{point_on_surface_info}.inputSurface",
+    # The parameter grid is computed for all rings at once: U is the
+    # position along each ring, and V is the index of the ring
+    u_positions: Sequence[float] = get_vertices_paths_positions(
+        vertex_rings,
+        spans=len(edge_loops) - 1,
+        proportional=(
+            distribution_type == options.DistributionType.PROPORTIONAL
+        ),
+    )
+    v_position: int
+    vertex_ring: tuple[str, ...]
+    vertices_parameters: dict[str, tuple[float, float]] = dict(
+        zip(
+            chain.from_iterable(vertex_rings),
+            zip(
+                u_positions,
+                chain.from_iterable(
+                    repeat(v_position, len(vertex_ring))
+                    for v_position, vertex_ring in enumerate(vertex_rings)
+                ),
+            ),
+        )
     )
-    progress_window: str = cmds.progressWindow(
-        maxValue=len(vertex_rings),
+    # The positions are all retrieved before moving any vertices in order to
+    # avoid having changes to the mesh affect changes to the surface in
+    # cases where the surface being used is created from polymesh edge
+    # curves
+    positions: list[tuple[float, float, float]] = get_surface_points(
+        surface_attribute, vertices_parameters.values()
     )
-    v_position: float
-    position: tuple[float, float, float]
-    spans: int = len(edge_loops) - 1
-    vertices_positions: dict[str, tuple[float, float, float]] = {}
-    for v_position, vertex_ring in enumerate(vertex_rings):
-        cmds.setAttr(f"{point_on_surface_info}.parameterV", v_position)
-        u_position: float
-        vertex: str
-        for vertex, u_position in (
-            iter_vertices_path_proportional_positions(vertex_ring, spans=spans)
-            if distribution_type == options.DistributionType.PROPORTIONAL
-            else iter_vertices_path_uniform_positions(vertex_ring, spans=spans)
-        ):
-            cmds.setAttr(f"{point_on_surface_info}.parameterU", u_position)
-            position = cmds.getAttr(f"{point_on_surface_info}.position")[0]
-            # The positions are stored for subsequent moving rather than
-            # moved here in order to avoid having changes to the mesh
-            # affect changes to the surface in cases where the surface
-            # being used is created from polymesh edge curves
-            vertices_positions[vertex] = position
-        cmds.progressWindow(progress_window, progress=v_position)
-    cmds.progressWindow(progress_window, endProgress=True)
-    for vertex, position in vertices_positions.items():
-        cmds.move(*position, vertex, absolute=True, worldSpace=True)
-    return set(vertices_positions.keys())
+    set_vertices_positions(zip(vertices_parameters.keys(), positions))
+    return set(vertices_parameters.keys())
 
 
 def _surface_distribute_uvs(
@@ -106,41 +108,38 @@ def _surface_distribute_uvs(
             ),
         )
     )
-    point_on_surface_info: str = create_node("pointOnSurfaceInfo")
-    cmds.connectAttr(
-        surface_attribute,
-        f"{point_on_surface_info}.inputSurface",
-    )
-    progress_window: str = cmds.progressWindow(
-        maxValue=len(uv_rings),
+    # The parameter grid is computed for all rings at once: U is the
+    # position along each ring, and V is the index of the ring
+    u_positions: Sequence[float] = get_uvs_paths_positions(
+        uv_rings,
+        spans=len(uv_loops) - 1,
+        proportional=(
+            distribution_type == options.DistributionType.PROPORTIONAL
+        ),
     )
-    v_position: float
-    position: tuple[float, float, float]
-    spans: int = len(uv_loops) - 1
-    uvs_positions: dict[str, tuple[float, float, float]] = {}
-    for v_position, uv_ring in enumerate(uv_rings):
-        cmds.setAttr(f"{point_on_surface_info}.parameterV", v_position)
-        u_position: float
-        uv: str
-        for uv, u_position in (
-            iter_uvs_path_proportional_positions(uv_ring, spans=spans)
-            if distribution_type == options.DistributionType.PROPORTIONAL
-            else iter_uvs_path_uniform_positions(uv_ring, spans=spans)
-        ):
-            cmds.setAttr(f"{point_on_surface_info}.parameterU", u_position)
-            position = cmds.getAttr(f"{point_on_surface_info}.position")[0][:2]
-            # The positions are stored for subsequent moving rather than
-            # moved here in order to avoid having changes to the mesh
-            # affect changes to the surface in cases where the surface
-            # being used is created from polymesh edge curves
-            uvs_positions[uv] = position
-        cmds.progressWindow(progress_window, progress=v_position)
-    cmds.progressWindow(progress_window, endProgress=True)
-    for uv, position in uvs_positions.items():
-        cmds.polyEditUV(
-            uv, uValue=position[0], vValue=position[1], relative=False
+    v_position: int
+    uv_ring: tuple[str, ...]
+    uvs_parameters: dict[str, tuple[float, float]] = dict(
+        zip(
+            chain.from_iterable(uv_rings),
+            zip(
+                u_positions,
+                chain.from_iterable(
+                    repeat(v_position, len(uv_ring))
+                    for v_position, uv_ring in enumerate(uv_rings)
+                ),
+            ),
         )
-    return set(uvs_positions.keys())
+    )
+    # The positions are all retrieved before moving any UVs in order to
+    # avoid having changes to the mesh affect changes to the surface in
+    # cases where the surface being used is created from polymesh edge
+    # curves
+    positions: list[tuple[float, float, float]] = get_surface_points(
+        surface_attribute, uvs_parameters.values()
+    )
+    set_uvs_positions(zip(uvs_parameters.keys(), positions))
+    return set(uvs_parameters.keys())
 
 
 def _iter_edges_ring(
@@ -151,6 +150,7 @@ def _iter_edges_ring(
     yield a ring of edge loops including those sandwiched between, in order.
     """
     shape: str = get_components_shape(chain(*selected_edge_loops))
+    edge_index: EdgeIndex = get_mesh_edge_index(shape)
     edge_rings: list[list[str]] = []
     selected_edge_ring: tuple[str, ...]
     for selected_edge_ring in zip(*selected_edge_loops):
@@ -160,18 +160,13 @@ def _iter_edges_ring(
         for edge in selected_edge_ring[1:]:
             edge_id: int = get_component_id(edge)
             segment_edge_id: int
-            segment_edge_ids: tuple[int, ...] = tuple(
-                cmds.polySelect(
-                    shape, query=True, edgeRingPath=(previous_edge_id, edge_id)
-                )
-                or ()
+            segment_edge_ids: tuple[int, ...] | None = (
+                edge_index.get_ring_path(previous_edge_id, edge_id)
             )
-            if not segment_edge_ids:
+            if segment_edge_ids is None:
                 raise EdgesNotOnSameRingError(
                     shape, (previous_edge_id, edge_id)
                 )
-            if previous_edge_id != segment_edge_ids[0]:
-                segment_edge_ids = tuple(reversed(segment_edge_ids))
             for segment_edge_id in segment_edge_ids[1:]:
                 edge_ring.append(  # noqa: PERF401
                     f"{shape}.e[{segment_edge_id}]"
@@ -216,50 +211,32 @@ def loft_distribute_vertices_between_edges(
     another on a polygon mesh, distribute the vertices sandwiched between
     along a loft.
     """
-    cleanup_items: list[str] = []
     selected_edges = selected_edges or tuple(iter_selected_components("e"))
-    selected_edge_loops: tuple[tuple[str, ...], ...] = tuple(
-        iter_aligned_contiguous_edges(*selected_edges)
-    )
+    with breadth_first_search_cache(), progress("Loft"):
+        selected_edge_loops: tuple[tuple[str, ...], ...] = tuple(
+            iter_aligned_contiguous_edges(*selected_edges)
+        )
     set_wait_cursor_state(True)
     try:
         index: int
         edge_loop: tuple[str, ...]
         curve_transforms: list[str] = []
-        curve_shapes: list[str] = []
         loft: str = create_node("loft", name="loft#")
         for index, edge_loop in enumerate(selected_edge_loops):
-            rebuild_curve: str = create_edges_rebuild_curve(edge_loop)
-            if create_deformer:
-                curve_transform: str = create_node(
-                    "transform", name="loftCurve#", skip_select=True
-                )
-                curve_shape: str = create_node(
-                    "nurbsCurve",
-                    name="loftCurveShape#",
-                    parent=curve_transform,
-                    skip_select=True,
-                )
-                cmds.connectAttr(
-                    f"{rebuild_curve}.outputCurve", f"{curve_shape}.create"
-                )
-                center_pivot(curve_transform)
-                cmds.connectAttr(
-                    f"{curve_shape}.worldSpace[0]",
-                    f"{loft}.inputCurve[{index}]",
-                )
-                curve_transforms.append(curve_transform)
-                curve_shapes.append(curve_shape)
-            else:
-                cmds.connectAttr(
-                    f"{rebuild_curve}.outputCurve",
-                    f"{loft}.inputCurve[{index}]",
-                )
-            cleanup_items.append(rebuild_curve)
+            curve_transform: str
+            curve_shape: str
+            curve_transform, curve_shape = create_edges_curve(
+                edge_loop, name="loftCurve#"
+            )
+            center_pivot(curve_transform)
+            cmds.connectAttr(
+                f"{curve_shape}.worldSpace[0]",
+                f"{loft}.inputCurve[{index}]",
+            )
+            curve_transforms.append(curve_transform)
         rebuild_surface: str = create_node(
             "rebuildSurface", name="loftBetweenEdgesRebuildSurface#"
         )
-        cleanup_items.append(rebuild_surface)
         cmds.connectAttr(
             f"{loft}.outputSurface",
             f"{rebuild_surface}.inputSurface",
@@ -274,64 +251,57 @@ def loft_distribute_vertices_between_edges(
             edge_loops=selected_edge_loops,
             distribution_type=distribution_type,
         )
-        faces: tuple[str, ...] = tuple(
-            cmds.ls(
-                *cmds.polyListComponentConversion(
-                    *vertices, fromVertex=True, toFace=True, internal=True
-                ),
-                flatten=True,
-            )
+        faces: tuple[str, ...] = convert_components(
+            vertices, "f", internal=True
         )
-        if create_deformer:
-            surface_transform: str = create_node(
-                "transform", name="loftBetweenEdges#"
-            )
-            surface_shape: str = create_node(
-                "nurbsSurface",
-                name=f"{surface_transform}Shape",
-                parent=surface_transform,
-            )
-            cmds.connectAttr(
-                f"{loft}.outputSurface",
-                f"{surface_shape}.create",
-            )
-            cmds.connectAttr(
+        if not create_deformer:
+            cmds.delete(rebuild_surface, loft, *curve_transforms)
+            cmds.select(*faces)
+            return faces
+        surface_transform: str = create_node(
+            "transform", name="loftBetweenEdges#"
+        )
+        surface_shape: str = create_node(
+            "nurbsSurface",
+            name=f"{surface_transform}Shape",
+            parent=surface_transform,
+        )
+        cmds.connectAttr(
+            f"{loft}.outputSurface",
+            f"{surface_shape}.create",
+        )
+        cmds.connectAttr(
+            f"{rebuild_surface}.outputSurface",
+            f"{surface_shape}.create",
+            force=True,
+        )
+        cmds.setAttr(f"{surface_shape}.intermediateObject", 1)
+        cmds.parent(*curve_transforms, surface_transform)
+        wrap: str = _create_wrap_deformer(
+            f"{rebuild_surface}.outputSurface",
+            f"{surface_shape}.local",
+            vertices,
+        )
+
+        def cleanup() -> None:
+            """
+            Disconnect the rebuilt surface from the base, so that changes
+            aren't negated by having a base transform in concert with the
+            driver
+            """
+            cmds.disconnectAttr(
                 f"{rebuild_surface}.outputSurface",
                 f"{surface_shape}.create",
-                force=True,
-            )
-            cmds.setAttr(f"{surface_shape}.intermediateObject", 1)
-            cmds.parent(*curve_transforms, surface_transform)
-            wrap: str = _create_wrap_deformer(
-                f"{rebuild_surface}.outputSurface",
-                f"{surface_shape}.local",
-                vertices,
             )
 
-            def cleanup() -> None:
-                """
-                Disconnect the curves from the mesh, and the rebuilt surface
-                from the base, so that changes aren't negated by having a base
-                transform in concert with the driver
-                """
-                cmds.delete(*curve_shapes, constructionHistory=True)
-                cmds.disconnectAttr(
-                    f"{rebuild_surface}.outputSurface",
-                    f"{surface_shape}.create",
-                )
-
-            cmds.evalDeferred(cleanup)
-            # Go into object selection mode, in order to manipulate locators
-            cmds.selectMode(object=True)
-            # Select the middle locator
-            cmds.select(curve_transforms[ceil(len(curve_transforms) / 2) - 1])
-            set_wait_cursor_state(False)
-            return (faces, surface_shape, surface_transform, wrap)
-        cmds.delete(*cleanup_items)
-        cmds.select(*faces)
+        cmds.evalDeferred(cleanup)
+        # Go into object selection mode, in order to manipulate locators
+        cmds.selectMode(object=True)
+        # Select the middle locator
+        cmds.select(curve_transforms[ceil(len(curve_transforms) / 2) - 1])
     finally:
         set_wait_cursor_state(False)
-    return faces
+    return (faces, surface_shape, surface_transform, wrap)
 
 
 def loft_distribute_uvs_between_edges_or_uvs(
@@ -352,19 +322,11 @@ def loft_distribute_uvs_between_edges_or_uvs(
         iter_selected_components("e", selection=selection)
     )
     if selected_edges:
-        selected_uvs |= set(
-            cmds.ls(
-                *cmds.polyListComponentConversion(
-                    *selected_edges,
-                    fromEdge=True,
-                    toUV=True,
-                ),
-                flatten=True,
-            )
+        selected_uvs |= set(convert_components(selected_edges, "map"))
+    with breadth_first_search_cache(), progress("Loft"):
+        selected_uv_loops: tuple[tuple[str, ...], ...] = tuple(
+            iter_aligned_contiguous_uvs(*selected_uvs)
         )
-    selected_uv_loops: tuple[tuple[str, ...], ...] = tuple(
-        iter_aligned_contiguous_uvs(*selected_uvs)
-    )
     set_wait_cursor_state(True)
     try:
         index: int
@@ -399,14 +361,7 @@ def loft_distribute_uvs_between_edges_or_uvs(
             uv_loops=selected_uv_loops,
             distribution_type=distribution_type,
         )
-        faces: tuple[str, ...] = tuple(
-            cmds.ls(
-                *cmds.polyListComponentConversion(
-                    *uvs, fromUV=True, toFace=True, internal=True
-                ),
-                flatten=True,
-            )
-        )
+        faces: tuple[str, ...] = convert_components(uvs, "f", internal=True)
         cmds.delete(*cleanup)
         cmds.select(*faces)
     finally:
@@ -2,6 +2,7 @@ from __future__ import annotations
 
 import contextlib
 from functools import partial
+from itertools import chain
 from math import ceil
 from operator import itemgetter
 from typing import Callable, Iterable, Sequence
@@ -10,12 +11,21 @@ from maya import cmds  # type: ignore
 
 from maya_zen_tools import options
 from maya_zen_tools._create import (
-    create_edges_rebuild_curve,
+    create_edges_curve,
+    create_edit_point_curve,
     create_locator,
     create_node,
     create_uv_edges_rebuild_curve,
 )
+from maya_zen_tools._nurbs import get_curve_points
+from maya_zen_tools._plugin import set_uvs_positions, set_vertices_positions
+from maya_zen_tools._topology import (
+    MeshTopology,
+    get_mesh_edge_lengths,
+    get_mesh_topology,
+)
 from maya_zen_tools._traverse import (
+    get_component_id,
     get_components_shape,
     iter_contiguous_edges,
     iter_contiguous_uv_edges,
@@ -29,9 +39,16 @@ from maya_zen_tools._traverse import (
     iter_sorted_uvs,
     iter_sorted_vertices,
     iter_uvs_edges,
+    iter_uvs_positions,
     iter_vertices_edges,
+    iter_vertices_positions,
+)
+from maya_zen_tools._ui import (
+    WINDOW,
+    progress,
+    set_wait_cursor_state,
+    show_path_type_options,
 )
-from maya_zen_tools._ui import WINDOW, set_wait_cursor_state
 from maya_zen_tools._utilities import as_tuple
 from maya_zen_tools.menu import (
     CLOSE_CHECKBOX,
@@ -53,10 +70,21 @@ def _get_vertices_locator_scale(vertices: Sequence[str]) -> float:
     bounding_box: tuple[float, float, float, float, float, float] = tuple(
         cmds.exactWorldBoundingBox(*vertices)
     )
-    edges: tuple[str] = cmds.ls(
-        *cmds.polyListComponentConversion(*vertices, toEdge=True), flatten=True
+    shape: str = get_components_shape(vertices)
+    topology: MeshTopology = get_mesh_topology(shape)
+    edge_lengths: Sequence[float] = get_mesh_edge_lengths(shape)
+    edge_ids: set[int] = set(
+        chain.from_iterable(
+            map(
+                topology.get_vertex_edge_ids,
+                map(get_component_id, vertices),
+            )
+        )
     )
-    average_edge_length: float = sum(map(cmds.arclen, edges)) / len(edges)
+    edge_id: int
+    average_edge_length: float = sum(
+        edge_lengths[edge_id] for edge_id in edge_ids
+    ) / len(edge_ids)
     return max(
         average_edge_length / 3,
         max(
@@ -79,14 +107,20 @@ def _create_curve_from_vertices(
     passing between the vertices.
 
     The curve type will be an *arc* if 3 vertices are selected, otherwise the
-    curve will emulate an "edit point" (EP) curve by creating a curve from
-    a 0-width loft.
+    curve will be an "edit point" (EP) curve. If locators are created, the EP
+    curve is emulated by creating a curve from a 0-width loft, so that it
+    follows the locators, otherwise it is created directly.
 
     Parameters:
         vertices: A list of vertices to create the curve from.
         create_locators: If `True`, create locators for manipulating the curve.
         close: If `True`, the curve will form a closed loop.
     """
+    is_arc: bool = len(vertices) == 3 and not close  # noqa: PLR2004
+    if not (create_locators or is_arc):
+        return create_edit_point_curve(
+            iter_vertices_positions(vertices), close=close, name="wire#"
+        )
     curve_transform: str = create_node(
         "transform", name="wire#", skip_select=True
     )
@@ -100,12 +134,11 @@ def _create_curve_from_vertices(
     index: int
     translation: tuple[float, float, float]
     locators: list[str] = []
-    if len(vertices) == 3 and not close:  # noqa: PLR2004
+    if is_arc:
         arc: str = create_node("makeThreePointCircularArc")
-        for index, vertex in enumerate(vertices, 1):
-            translation = cmds.xform(
-                vertex, query=True, worldSpace=True, translation=True
-            )
+        for index, translation in enumerate(
+            iter_vertices_positions(vertices), 1
+        ):
             if create_locators:
                 locators.append(
                     create_locator(
@@ -128,10 +161,7 @@ def _create_curve_from_vertices(
         cmds.setAttr(f"{loft}.uniform", 0)
         if close:
             cmds.setAttr(f"{loft}.close", 1)
-        for index, vertex in enumerate(vertices, 0):
-            translation = cmds.xform(
-                vertex, query=True, worldSpace=True, translation=True
-            )
+        for index, translation in enumerate(iter_vertices_positions(vertices)):
             point_matrix_mult: str = create_node("pointMatrixMult")
             if create_locators:
                 locators.append(
@@ -198,13 +228,16 @@ def _create_curve_from_uvs(
     passing between the UVs.
 
     The curve type will be an *arc* if 3 UVs are selected, otherwise the
-    curve will emulate an "edit point" (EP) curve by creating a curve from
-    a 0-width loft.
+    curve will be an "edit point" (EP) curve.
 
     Parameters:
         uvs: A list of UVs to create the curve from.
         close: If `True`, the curve will form a closed loop.
     """
+    if close or len(uvs) != 3:  # noqa: PLR2004
+        return create_edit_point_curve(
+            iter_uvs_positions(uvs), close=close, name="zenLoopCurve#"
+        )
     transform: str = create_node(
         "transform", name="zenLoopCurve#", skip_select=True
     )
@@ -215,69 +248,11 @@ def _create_curve_from_uvs(
         skip_select=True,
     )
     index: int
-    translation: tuple[float, float, float]
-    if len(uvs) == 3 and not close:  # noqa: PLR2004
-        arc: str = create_node("makeThreePointCircularArc")
-        for index, uv in enumerate(uvs, 1):
-            translation = (*cmds.polyEditUV(uv, query=True), 0)
-            cmds.setAttr(
-                f"{arc}.point{index}",
-                *translation,
-            )
-        cmds.connectAttr(f"{arc}.outputCurve", f"{shape}.create")
-    else:
-        loft: str = create_node("loft")
-        curve_from_surface_iso: str = create_node("curveFromSurfaceIso")
-        cmds.setAttr(f"{curve_from_surface_iso}.isoparmDirection", 0)
-        cmds.setAttr(f"{loft}.uniform", 0)
-        if close:
-            cmds.setAttr(f"{loft}.close", 1)
-        for index, uv in enumerate(uvs, 0):
-            translation = (*cmds.polyEditUV(uv, query=True), 0)
-            point_matrix_mult: str = create_node("pointMatrixMult")
-            cmds.setAttr(f"{point_matrix_mult}.inPoint", *translation)
-            # Create a 0-length curve to use as an edit point in a loft
-            # curve, parent that curve under our output curve transform
-            # node, and delete the loft curve's original transform node
-            loft_curve_transform: str = cmds.curve(
-                objectSpace=True,
-                degree=1,
-                point=((0, 0, 0), (0, 0, 0)),
-            )
-            loft_curve_shape: str = cmds.listRelatives(
-                loft_curve_transform, shapes=True, noIntermediate=True
-            )[0]
-            cmds.parent(
-                loft_curve_shape, transform, addObject=True, shape=True
-            )
-            cmds.delete(loft_curve_transform)
-            # Connect the inverse matrix from our transform node to the
-            # in-matrix of the point matrix multipliers
-            cmds.connectAttr(
-                f"{transform}.worldInverseMatrix",
-                f"{point_matrix_mult}.inMatrix",
-            )
-            # Connect the point matrix multiplier to the loft curve control
-            # points
-            cmds.connectAttr(
-                f"{point_matrix_mult}.output",
-                f"{loft_curve_shape}.controlPoints[0]",
-            )
-            cmds.connectAttr(
-                f"{point_matrix_mult}.output",
-                f"{loft_curve_shape}.controlPoints[1]",
-            )
-            # Connect the loft to the output curve shape
-            cmds.connectAttr(
-                f"{loft_curve_shape}.worldSpace[0]",
-                f"{loft}.inputCurve[{index}]",
-            )
-        cmds.connectAttr(
-            f"{loft}.outputSurface", f"{curve_from_surface_iso}.inputSurface"
-        )
-        cmds.connectAttr(
-            f"{curve_from_surface_iso}.outputCurve", f"{shape}.create"
-        )
+    uv_position: tuple[float, float]
+    arc: str = create_node("makeThreePointCircularArc")
+    for index, uv_position in enumerate(iter_uvs_positions(uvs), 1):
+        cmds.setAttr(f"{arc}.point{index}", *uv_position, 0)
+    cmds.connectAttr(f"{arc}.outputCurve", f"{shape}.create")
     return (transform, shape)
 
 
@@ -302,12 +277,53 @@ def _create_wire_deformer(
     return wire
 
 
+def _get_vertices_loop_positions(
+    selected_vertices: Sequence[str],
+    *,
+    distribution_type: str = options.DistributionType.UNIFORM,
+    path_type: str = options.PathType.TOPOLOGICAL,
+) -> tuple[tuple[str, float], ...]:
+    """
+    Get the vertices forming an edge loop between selected vertices, with
+    the curve parameter at which each is to be positioned (where the
+    curve has a parameter range of 0 to `len(selected_vertices) - 1`).
+    """
+    return tuple(
+        iter_shortest_vertices_path_proportional_positions(
+            selected_vertices, path_type
+        )
+        if distribution_type == options.DistributionType.PROPORTIONAL
+        else iter_shortest_vertices_path_uniform_positions(
+            selected_vertices, path_type
+        )
+    )
+
+
+def _get_uvs_loop_positions(
+    selected_uvs: Sequence[str],
+    *,
+    distribution_type: str = options.DistributionType.UNIFORM,
+    path_type: str = options.PathType.TOPOLOGICAL,
+) -> tuple[tuple[str, float], ...]:
+    """
+    Get the UVs forming an edge loop between selected UVs, with the curve
+    parameter at which each is to be positioned (where the curve has a
+    parameter range of 0 to `len(selected_uvs) - 1`).
+    """
+    return tuple(
+        iter_shortest_uvs_path_proportional_positions(selected_uvs, path_type)
+        if distribution_type == options.DistributionType.PROPORTIONAL
+        else iter_shortest_uvs_path_uniform_positions(selected_uvs, path_type)
+    )
+
+
 def _distribute_vertices_loop_along_curve(
     selected_vertices: Sequence[str],
     curve_shape: str,
     curve_transform: str,
     *,
     distribution_type: str = options.DistributionType.UNIFORM,
+    path_type: str = options.PathType.TOPOLOGICAL,
     create_deformer: bool = False,
 ) -> tuple[str, tuple[str, ...]]:
     """
@@ -323,6 +339,11 @@ def _distribute_vertices_loop_along_curve(
             PROPORTIONAL: Distribute vertices such that edge lengths are
                 proportional to their original lengths in relation the sum
                 of all edge lengths.
+        path_type:
+            TOPOLOGICAL: Distribute the vertices along the path traversing
+                the fewest edges.
+            GEOMETRIC: Distribute the vertices along the path with the
+                shortest total edge length.
         sampling: Curve sampling
 
     Returns:
@@ -331,10 +352,12 @@ def _distribute_vertices_loop_along_curve(
             the same as the the input curve shape.
         -   A tuple of the vertices distributed, in order
     """
-    vertices_positions: tuple[tuple[str, float], ...] = tuple(
-        iter_shortest_vertices_path_proportional_positions(selected_vertices)
-        if distribution_type == options.DistributionType.PROPORTIONAL
-        else iter_shortest_vertices_path_uniform_positions(selected_vertices)
+    vertices_positions: tuple[tuple[str, float], ...] = (
+        _get_vertices_loop_positions(
+            selected_vertices,
+            distribution_type=distribution_type,
+            path_type=path_type,
+        )
     )
     # Rebuild the curve
     rebuild_curve: str = create_node("rebuildCurve")
@@ -349,33 +372,17 @@ def _distribute_vertices_loop_along_curve(
     cmds.setAttr(f"{rebuild_curve}.keepTangents", 1)
     cmds.setAttr(f"{rebuild_curve}.keepEndPoints", 1)
     cmds.setAttr(f"{rebuild_curve}.keepRange", 2)
-    # This point-on-curve info node will slide along the curve to get
-    # transform values for the vertices
-    point_on_curve_info: str = create_node("pointOnCurveInfo")
-    point_matrix_mult: str = create_node("pointMatrixMult")
-    cmds.connectAttr(
-        f"{rebuild_curve}.outputCurve", f"{point_on_curve_info}.inputCurve"
-    )
-    cmds.connectAttr(
-        f"{curve_shape}.worldMatrix[0]", f"{point_matrix_mult}.inMatrix"
+    # The rebuilt curve is evaluated for all vertices at once
+    set_vertices_positions(
+        zip(
+            map(itemgetter(0), vertices_positions),
+            get_curve_points(
+                f"{rebuild_curve}.outputCurve",
+                map(itemgetter(1), vertices_positions),
+                f"{curve_shape}.worldMatrix[0]",
+            ),
+        )
     )
-    cmds.connectAttr(
-        f"{point_on_curve_info}.position", f"{point_matrix_mult}.inPoint"
-    )
-    vertex: str
-    curve_position: float
-    for vertex, curve_position in vertices_positions:
-        cmds.setAttr(f"{point_on_curve_info}.parameter", curve_position)
-        coordinates: tuple[str, str, str] = cmds.getAttr(
-            f"{point_matrix_mult}.output"
-        )[0]
-        cmds.move(*coordinates, vertex, absolute=True, worldSpace=True)
-    # Disconnect and delete temporary nodes
-    cmds.disconnectAttr(
-        f"{rebuild_curve}.outputCurve", f"{point_on_curve_info}.inputCurve"
-    )
-    cmds.delete(point_on_curve_info)
-    cmds.delete(point_matrix_mult)
     if create_deformer:
         rebuilt_curve: str = create_node(
             "nurbsCurve",
@@ -412,6 +419,7 @@ def _distribute_uvs_loop_along_curve(
     curve_shape: str,
     *,
     distribution_type: str = options.DistributionType.UNIFORM,
+    path_type: str = options.PathType.TOPOLOGICAL,
 ) -> tuple[str, ...]:
     """
     Distribute UVs along a curve.
@@ -426,6 +434,11 @@ def _distribute_uvs_loop_along_curve(
             PROPORTIONAL: Distribute UVs such that edge lengths are
                 proportional to their original lengths in relation the sum
                 of all edge lengths.
+        path_type:
+            TOPOLOGICAL: Distribute the UVs along the path traversing the
+                fewest edges.
+            GEOMETRIC: Distribute the UVs along the path with the shortest
+                total edge length.
         sampling: Curve sampling
 
     Returns:
@@ -434,10 +447,8 @@ def _distribute_uvs_loop_along_curve(
             the same as the the input curve shape.
         -   A tuple of the UVs distributed, in order
     """
-    uvs_positions: tuple[tuple[str, float], ...] = tuple(
-        iter_shortest_uvs_path_proportional_positions(selected_uvs)
-        if distribution_type == options.DistributionType.PROPORTIONAL
-        else iter_shortest_uvs_path_uniform_positions(selected_uvs)
+    uvs_positions: tuple[tuple[str, float], ...] = _get_uvs_loop_positions(
+        selected_uvs, distribution_type=distribution_type, path_type=path_type
     )
     # Rebuild the curve
     rebuild_curve: str = create_node("rebuildCurve")
@@ -450,35 +461,17 @@ def _distribute_uvs_loop_along_curve(
     cmds.setAttr(f"{rebuild_curve}.keepTangents", 1)
     cmds.setAttr(f"{rebuild_curve}.keepEndPoints", 1)
     cmds.setAttr(f"{rebuild_curve}.keepRange", 2)
-    # This point-on-curve info node will slide along the curve to get
-    # transform values for the UVs
-    point_on_curve_info: str = create_node("pointOnCurveInfo")
-    point_matrix_mult: str = create_node("pointMatrixMult")
-    cmds.connectAttr(
-        f"{rebuild_curve}.outputCurve", f"{point_on_curve_info}.inputCurve"
-    )
-    cmds.connectAttr(
-        f"{curve_shape}.worldMatrix[0]", f"{point_matrix_mult}.inMatrix"
-    )
-    cmds.connectAttr(
-        f"{point_on_curve_info}.position", f"{point_matrix_mult}.inPoint"
-    )
-    uv: str
-    curve_position: float
-    for uv, curve_position in uvs_positions:
-        cmds.setAttr(f"{point_on_curve_info}.parameter", curve_position)
-        position: tuple[str, str, str] = cmds.getAttr(
-            f"{point_matrix_mult}.output"
-        )[0]
-        cmds.polyEditUV(
-            uv, uValue=position[0], vValue=position[1], relative=False
+    # The rebuilt curve is evaluated for all UVs at once
+    set_uvs_positions(
+        zip(
+            map(itemgetter(0), uvs_positions),
+            get_curve_points(
+                f"{rebuild_curve}.outputCurve",
+                map(itemgetter(1), uvs_positions),
+                f"{curve_shape}.worldMatrix[0]",
+            ),
         )
-    # Disconnect and delete temporary nodes
-    cmds.disconnectAttr(
-        f"{rebuild_curve}.outputCurve", f"{point_on_curve_info}.inputCurve"
     )
-    cmds.delete(point_on_curve_info)
-    cmds.delete(point_matrix_mult)
     cmds.delete(rebuild_curve)
     return tuple(map(itemgetter(0), uvs_positions))
 
@@ -487,6 +480,7 @@ def select_edges_between_vertices(
     *selected_vertices: str,
     use_selection_order: bool = False,
     close: bool = False,
+    path_type: str = options.PathType.TOPOLOGICAL,
 ) -> tuple[str, ...]:
     """
     Add the edges forming the shortest path between selected vertices to
@@ -497,6 +491,9 @@ def select_edges_between_vertices(
             order, if two or more vertices are selected.
         close: If `True`, the vertices between the last and first selected
             vertex will be included.
+        path_type:
+            TOPOLOGICAL: Select the path traversing the fewest edges.
+            GEOMETRIC: Select the path with the shortest total edge length.
 
     Returns:
         A tuple of the selected edges.
@@ -516,19 +513,28 @@ def select_edges_between_vertices(
         selected_vertices = selected_vertices or tuple(
             iter_selected_components("vtx")
         )
-        if not use_selection_order:
-            # If we have opted not to use selection order, or are unable to
-            # because it is not being tracked, we fall back to auomatic sorting
-            selected_vertices = tuple(iter_sorted_vertices(selected_vertices))
-        edges: tuple[str, ...] = tuple(
-            iter_vertices_edges(
-                iter_shortest_vertices_path(
-                    (*selected_vertices, selected_vertices[0])
-                    if close
-                    else selected_vertices
+        # The selection is only changed once the path is found, so
+        # cancelling leaves the selection as it was
+        with progress("Select Edges Between Vertices"):
+            if not use_selection_order:
+                # If we have opted not to use selection order, or are unable
+                # to because it is not being tracked, we fall back to
+                # auomatic sorting
+                selected_vertices = tuple(
+                    iter_sorted_vertices(selected_vertices)
+                )
+            edges: tuple[str, ...] = tuple(
+                iter_vertices_edges(
+                    iter_shortest_vertices_path(
+                        (
+                            (*selected_vertices, selected_vertices[0])
+                            if close
+                            else selected_vertices
+                        ),
+                        path_type,
+                    )
                 )
             )
-        )
         # Select edges
         cmds.select(*edges, add=True)
         # Deselect vertices
@@ -542,6 +548,7 @@ def select_edges_between_uvs(
     *selected_uvs: str,
     use_selection_order: bool = False,
     close: bool = False,
+    path_type: str = options.PathType.TOPOLOGICAL,
 ) -> tuple[str, ...]:
     """
     Add the edges forming the shortest path between selected UVs to
@@ -552,6 +559,9 @@ def select_edges_between_uvs(
             order, if two or more UVs are selected.
         close: If `True`, the UVs between the last and first selected
             UV will be included.
+        path_type:
+            TOPOLOGICAL: Select the path traversing the fewest edges.
+            GEOMETRIC: Select the path with the shortest total edge length.
 
     Returns:
         A tuple of the selected edges.
@@ -569,17 +579,26 @@ def select_edges_between_uvs(
         # If UVs are not explicitly passed, we get them by
         # flattening the current selection of UVs
         selected_uvs = selected_uvs or tuple(iter_selected_components("map"))
-        if not use_selection_order:
-            # If we have opted not to use selection order, or are unable to
-            # because it is not being tracked, we fall back to auomatic sorting
-            selected_uvs = tuple(iter_sorted_uvs(selected_uvs))
-        edges: tuple[str, ...] = tuple(
-            iter_uvs_edges(
-                iter_shortest_uvs_path(
-                    (*selected_uvs, selected_uvs[0]) if close else selected_uvs
+        # The selection is only changed once the path is found, so
+        # cancelling leaves the selection as it was
+        with progress("Select Edges Between UVs"):
+            if not use_selection_order:
+                # If we have opted not to use selection order, or are unable
+                # to because it is not being tracked, we fall back to
+                # auomatic sorting
+                selected_uvs = tuple(iter_sorted_uvs(selected_uvs))
+            edges: tuple[str, ...] = tuple(
+                iter_uvs_edges(
+                    iter_shortest_uvs_path(
+                        (
+                            (*selected_uvs, selected_uvs[0])
+                            if close
+                            else selected_uvs
+                        ),
+                        path_type,
+                    )
                 )
             )
-        )
         # Select edges
         cmds.select(*edges, add=True)
         # Deselect UVs
@@ -593,6 +612,7 @@ def select_between_uvs(
     *selected_uvs: str,
     use_selection_order: bool = False,
     close: bool = False,
+    path_type: str = options.PathType.TOPOLOGICAL,
 ) -> tuple[str, ...]:
     """
     Add the UVs forming the shortest path between selected UVs to
@@ -603,6 +623,9 @@ def select_between_uvs(
             order, if two or more UVs are selected.
         close: If `True`, the UVs between the last and first selected
             UV will be included.
+        path_type:
+            TOPOLOGICAL: Select the path traversing the fewest edges.
+            GEOMETRIC: Select the path with the shortest total edge length.
 
     Returns:
         A tuple of the selected UVs.
@@ -620,15 +643,22 @@ def select_between_uvs(
         # If UVs are not explicitly passed, we get them by
         # flattening the current selection of UVs
         selected_uvs = selected_uvs or tuple(iter_selected_components("map"))
-        if not use_selection_order:
-            # If we have opted not to use selection order, or are unable to
-            # because it is not being tracked, we fall back to auomatic sorting
-            selected_uvs = tuple(iter_sorted_uvs(selected_uvs))
-        uvs: tuple[str, ...] = tuple(
-            iter_shortest_uvs_path(
-                (*selected_uvs, selected_uvs[0]) if close else selected_uvs
+        # The selection is only changed once the path is found, so
+        # cancelling leaves the selection as it was
+        with progress("Select Between UVs"):
+            if not use_selection_order:
+                # If we have opted not to use selection order, or are unable
+                # to because it is not being tracked, we fall back to
+                # auomatic sorting
+                selected_uvs = tuple(iter_sorted_uvs(selected_uvs))
+            uvs: tuple[str, ...] = tuple(
+                iter_shortest_uvs_path(
+                    (*selected_uvs, selected_uvs[0])
+                    if close
+                    else selected_uvs,
+                    path_type,
+                )
             )
-        )
         # Select edges
         cmds.select(*uvs, add=True)
     finally:
@@ -639,6 +669,7 @@ def select_between_uvs(
 def curve_distribute_vertices(
     *selected_vertices: str,
     distribution_type: str = options.DistributionType.UNIFORM,
+    path_type: str = options.PathType.TOPOLOGICAL,
     create_deformer: bool = False,
     use_selection_order: bool = False,
     close: bool = False,
@@ -658,6 +689,9 @@ def curve_distribute_vertices(
             PROPORTIONAL: Distribute vertices such that edge lengths are
                 proportional to their original lengths in relation the sum
                 of all edge lengths.
+        path_type: Which path between selected vertices to distribute.
+            TOPOLOGICAL: The path traversing the fewest edges.
+            GEOMETRIC: The path with the shortest total edge length.
         create_deformer: If `True`, create a deformer.
         use_selection_order: If `True`, the curve will be created in selection
             order, otherwise, it will be automatically sorted.
@@ -709,6 +743,7 @@ def curve_distribute_vertices(
             curve_shape,
             curve_transform,
             distribution_type=distribution_type,
+            path_type=path_type,
             create_deformer=create_deformer,
         )
         edges: tuple[str, ...] = tuple(iter_vertices_edges(vertices))
@@ -736,6 +771,7 @@ def curve_distribute_vertices(
 def curve_distribute_uvs(
     *selected_uvs: str,
     distribution_type: str = options.DistributionType.UNIFORM,
+    path_type: str = options.PathType.TOPOLOGICAL,
     use_selection_order: bool = False,
     close: bool = False,
 ) -> tuple[str, ...]:
@@ -754,6 +790,9 @@ def curve_distribute_uvs(
             PROPORTIONAL: Distribute UVs such that edge lengths are
                 proportional to their original lengths in relation the sum
                 of all edge lengths.
+        path_type: Which path between selected UVs to distribute.
+            TOPOLOGICAL: The path traversing the fewest edges.
+            GEOMETRIC: The path with the shortest total edge length.
         use_selection_order: If `True`, the curve will be created in selection
             order, otherwise, it will be automatically sorted.
         close: If `True`, the curve distribution will form a closed loop, with
@@ -794,6 +833,7 @@ def curve_distribute_uvs(
             ((*selected_uvs, selected_uvs[0]) if close else selected_uvs),
             curve_shape,
             distribution_type=distribution_type,
+            path_type=path_type,
         )
         edges: tuple[str, ...] = tuple(iter_uvs_edges(uvs))
         # Cleanup the curve and history
@@ -811,17 +851,7 @@ def create_curve_from_edges(*selected_edges: str) -> Iterable[str]:
     edges: tuple[str, ...]
     selected_edges = selected_edges or tuple(iter_selected_components("e"))
     for edges in iter_contiguous_edges(*selected_edges):
-        rebuild_curve: str = create_edges_rebuild_curve(edges)
-        curve_transform: str = create_node("transform", name="curveFromEdges#")
-        curve_shape: str = create_node(
-            "nurbsCurve",
-            parent=curve_transform,
-            name=f"{curve_transform}Shape",
-        )
-        cmds.connectAttr(
-            f"{rebuild_curve}.outputCurve", f"{curve_shape}.create"
-        )
-        yield curve_shape
+        yield create_edges_curve(edges, name="curveFromEdges#")[1]
 
 
 @as_tuple
@@ -850,7 +880,7 @@ def show_curve_distribute_vertices_options() -> None:
     cmds.window(
         WINDOW,
         width=425,
-        height=165,
+        height=195,
         title=f"ZenTools: {CURVE_DISTRIBUTE_BETWEEN_VERTICES_LABEL} Options",
         resizeToFitChildren=True,
         sizeable=False,
@@ -891,6 +921,8 @@ def show_curve_distribute_vertices_options() -> None:
         height=30,
     )
     cmds.separator(parent=column_layout)
+    show_path_type_options("curve_distribute_vertices", column_layout)
+    cmds.separator(parent=column_layout)
     use_selection_order: bool = get_option(  # type: ignore
         "use_selection_order", False
     )
@@ -1002,7 +1034,7 @@ def show_curve_distribute_uvs_options() -> None:
     cmds.window(
         WINDOW,
         width=390,
-        height=130,
+        height=160,
         title=f"ZenTools: {CURVE_DISTRIBUTE_BETWEEN_UVS_LABEL} Options",
         resizeToFitChildren=True,
         sizeable=False,
@@ -1043,6 +1075,8 @@ def show_curve_distribute_uvs_options() -> None:
         height=30,
     )
     cmds.separator(parent=column_layout)
+    show_path_type_options("curve_distribute_uvs", column_layout)
+    cmds.separator(parent=column_layout)
     use_selection_order: bool = get_option(  # type: ignore
         "use_selection_order", False
     )
@@ -1135,7 +1169,7 @@ def show_select_edges_between_vertices_options() -> None:
     cmds.window(
         WINDOW,
         width=400,
-        height=100,
+        height=130,
         title=f"ZenTools: {SELECT_EDGES_BETWEEN_VERTICES_LABEL} Options",
         resizeToFitChildren=True,
         sizeable=False,
@@ -1146,6 +1180,8 @@ def show_select_edges_between_vertices_options() -> None:
         columnAlign="left",
         columnOffset=("both", 10),
     )
+    show_path_type_options("select_edges_between_vertices", column_layout)
+    cmds.separator(parent=column_layout)
     use_selection_order: bool = get_option(  # type: ignore
         "use_selection_order", False
     )
@@ -1238,7 +1274,7 @@ def show_select_edges_between_uvs_options() -> None:
     cmds.window(
         WINDOW,
         width=400,
-        height=100,
+        height=130,
         title=f"ZenTools: {SELECT_EDGES_BETWEEN_UVS_LABEL} Options",
         resizeToFitChildren=True,
         sizeable=False,
@@ -1249,6 +1285,8 @@ def show_select_edges_between_uvs_options() -> None:
         columnAlign="left",
         columnOffset=("both", 10),
     )
+    show_path_type_options("select_edges_between_uvs", column_layout)
+    cmds.separator(parent=column_layout)
     use_selection_order: bool = get_option(  # type: ignore
         "use_selection_order", False
     )
@@ -1335,7 +1373,7 @@ def show_select_between_uvs_options() -> None:
     cmds.window(
         WINDOW,
         width=380,
-        height=100,
+        height=130,
         title=f"ZenTools: {SELECT_UVS_BETWEEN_UVS_LABEL} Options",
         resizeToFitChildren=True,
         sizeable=False,
@@ -1346,6 +1384,8 @@ def show_select_between_uvs_options() -> None:
         columnAlign="left",
         columnOffset=("both", 10),
     )
+    show_path_type_options("select_between_uvs", column_layout)
+    cmds.separator(parent=column_layout)
     use_selection_order: bool = get_option(  # type: ignore
         "use_selection_order", False
     )
@@ -34,6 +34,7 @@ CREATE_CURVE_FROM_EDGES_LABEL: str = "Create Curve from Edges"
 CREATE_UV_CURVE_FROM_EDGES_LABEL: str = "Create Curve from Edges in UV Space"
 ABOUT_WINDOW: str = "zenToolsAboutWindow"
 CLOSE_CHECKBOX: str = "zenToolsCloseCheckBox"
+TIME_BUDGET_FIELD: str = "zenToolsTimeBudgetField"
 
 
 def show_about() -> None:
@@ -100,6 +101,34 @@ def show_about() -> None:
                 ),
                 height=30,
             )
+    # Long-running operations are cancelled after this many seconds
+    # (0 means there is no limit)
+    time_budget_layout: str = cmds.rowLayout(
+        parent=column_layout,
+        numberOfColumns=2,
+    )
+    cmds.text(
+        label="Time Budget (Seconds):",
+        parent=time_budget_layout,
+    )
+    cmds.floatField(
+        TIME_BUDGET_FIELD,
+        parent=time_budget_layout,
+        minValue=0,
+        precision=1,
+        value=get_tool_option("general", "time_budget", 0),  # type: ignore
+        changeCommand=(
+            "from maya import cmds\n"
+            "from maya_zen_tools import options\n"
+            "options.set_tool_option("
+            "'general', 'time_budget', "
+            f"cmds.floatField('{TIME_BUDGET_FIELD}', query=True, value=True))"
+        ),
+        annotation=(
+            "Cancel long-running operations after this many seconds "
+            "(0 for no limit)."
+        ),
+    )
     row_layout = cmds.rowLayout(
         parent=column_layout,
         numberOfColumns=2,
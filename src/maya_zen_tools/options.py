@@ -22,6 +22,22 @@ class DistributionType:
     PROPORTIONAL: str = "PROPORTIONAL"
 
 
+class PathType:
+    """
+    An enumeration of the different criteria which can be used to find
+    the shortest path between two vertices or UVs.
+
+    Attributes:
+        TOPOLOGICAL: Find the path traversing the fewest edges, using
+            geometry only to choose between paths with the same number of
+            edges.
+        GEOMETRIC: Find the path with the shortest total edge length.
+    """
+
+    TOPOLOGICAL: str = "TOPOLOGICAL"
+    GEOMETRIC: str = "GEOMETRIC"
+
+
 OPTIONS_PATH: Path = Path(cmds.internalVar(userPrefDir=True)) / "ZenTools.json"
 
 
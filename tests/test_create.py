@@ -1,8 +1,20 @@
 from __future__ import annotations
 
+from itertools import chain
+
 import pytest
+from maya import cmds  # type: ignore
+from maya.api import OpenMaya  # type: ignore
 
-from maya_zen_tools._create import create_node
+from maya_zen_tools._create import create_edges_curve, create_node
+from maya_zen_tools._nurbs import get_curve_function_set
+from maya_zen_tools._traverse import (
+    get_component_id,
+    get_components_shape,
+    iter_contiguous_edges,
+    iter_edges_vertices,
+    iter_vertices_positions,
+)
 from maya_zen_tools.errors import CreateNodeError
 
 
@@ -18,5 +30,121 @@ def test_create_node_error() -> None:
     assert create_node_error is not None
 
 
+def _create_edges_rebuild_curve(edges: tuple[str, ...]) -> str:
+    """
+    Create the curveFromMeshEdge, attachCurve and rebuildCurve network
+    formerly used to create a curve from contiguous edges, and return the
+    rebuildCurve node.
+    """
+    polymesh_shape: str = get_components_shape(edges)
+    point_on_curve_info: str = cmds.createNode("pointOnCurveInfo")
+    cmds.setAttr(f"{point_on_curve_info}.turnOnPercentage", 1)
+    curve_node: str = ""
+    reverse_previous: bool = True
+    start: tuple[float, float, float]
+    edge: str
+    for start, edge in zip(
+        iter_vertices_positions(iter_edges_vertices(edges)), edges
+    ):
+        curve_from_mesh_edge: str = cmds.createNode("curveFromMeshEdge")
+        cmds.connectAttr(
+            f"{polymesh_shape}.worldMesh[0]",
+            f"{curve_from_mesh_edge}.inputMesh",
+        )
+        cmds.setAttr(
+            f"{curve_from_mesh_edge}.edgeIndex[0]", get_component_id(edge)
+        )
+        cmds.connectAttr(
+            f"{curve_from_mesh_edge}.outputCurve",
+            f"{point_on_curve_info}.inputCurve",
+            force=True,
+        )
+        reverse: bool = cmds.getAttr(f"{point_on_curve_info}.position")[
+            0
+        ] != pytest.approx(start, abs=1e-6)
+        if not curve_node:
+            curve_node = curve_from_mesh_edge
+            reverse_previous = reverse
+            continue
+        attach_curve: str = cmds.createNode("attachCurve")
+        cmds.connectAttr(
+            f"{curve_node}.outputCurve", f"{attach_curve}.inputCurve1"
+        )
+        cmds.connectAttr(
+            f"{curve_from_mesh_edge}.outputCurve",
+            f"{attach_curve}.inputCurve2",
+        )
+        cmds.setAttr(f"{attach_curve}.reverse1", reverse_previous)
+        cmds.setAttr(f"{attach_curve}.reverse2", reverse)
+        reverse_previous = False
+        curve_node = attach_curve
+    rebuild_curve: str = cmds.createNode("rebuildCurve")
+    cmds.connectAttr(
+        f"{curve_node}.outputCurve", f"{rebuild_curve}.inputCurve"
+    )
+    cmds.setAttr(f"{rebuild_curve}.keepControlPoints", 1)
+    cmds.setAttr(f"{rebuild_curve}.degree", 1)
+    cmds.setAttr(f"{rebuild_curve}.rebuildType", 0)
+    cmds.setAttr(f"{rebuild_curve}.spans", len(edges))
+    cmds.setAttr(f"{rebuild_curve}.endKnots", 1)
+    cmds.setAttr(f"{rebuild_curve}.keepRange", 2)
+    return rebuild_curve
+
+
+def _get_curve_data(
+    curve_attribute: str,
+) -> tuple[int, tuple[float, float], tuple[float, ...]]:
+    """
+    Get the degree, parameter range and control point positions of a curve
+    attribute.
+    """
+    curve: OpenMaya.MFnNurbsCurve = get_curve_function_set(curve_attribute)
+    point: OpenMaya.MPoint
+    return (
+        curve.degree,
+        tuple(curve.knotDomain),
+        tuple(
+            chain.from_iterable(
+                (point.x, point.y, point.z) for point in curve.cvPositions()
+            )
+        ),
+    )
+
+
+def test_create_edges_curve(poly_sphere: str) -> None:
+    """
+    Verify that a curve created from edges has the same degree, parameter
+    range and control points as the curve produced by the
+    curveFromMeshEdge, attachCurve and rebuildCurve network it replaced,
+    in either direction and with the mesh transformed.
+    """
+    cmds.xform(poly_sphere, translation=(1, 2, 3), rotation=(10, 20, 30))
+    index: int
+    edges: tuple[str, ...] = next(
+        iter(
+            iter_contiguous_edges(
+                *(f"{poly_sphere}.e[{index}]" for index in range(293, 300))
+            )
+        )
+    )
+    ordered_edges: tuple[str, ...]
+    for ordered_edges in (edges, edges[::-1]):
+        expected: tuple[int, tuple[float, float], tuple[float, ...]] = (
+            _get_curve_data(
+                f"{_create_edges_rebuild_curve(ordered_edges)}.outputCurve"
+            )
+        )
+        curve_shape: str = create_edges_curve(ordered_edges)[1]
+        degree: int
+        domain: tuple[float, float]
+        points: tuple[float, ...]
+        degree, domain, points = _get_curve_data(
+            f"{curve_shape}.worldSpace[0]"
+        )
+        assert degree == expected[0] == 1
+        assert domain == pytest.approx(expected[1])
+        assert points == pytest.approx(expected[2], abs=1e-6)
+
+
 if __name__ == "__main__":
     pytest.main(["-s", "-vv", __file__])
@@ -7,7 +7,12 @@ maya.standalone.initialize(name="python")
 from maya import cmds  # type: ignore  # noqa: E402
 
 from maya_zen_tools import startup  # noqa
-from maya_zen_tools.flood import flood_select  # noqa: E402
+from maya_zen_tools._components import ComponentSet  # noqa: E402
+from maya_zen_tools.flood import (  # noqa: E402
+    FloodSegmentation,
+    flood_select,
+    get_flood_segmentation,
+)
 
 
 def test_flood_select(poly_cylinder: str) -> None:
@@ -243,5 +248,133 @@ def test_flood_select(poly_cylinder: str) -> None:
     }
 
 
+def test_flood_segmentation(poly_cylinder: str) -> None:
+    """
+    Test that a flood segmentation is reused for the same border edges, and
+    that floods from it match `flood_select`.
+    """
+    border_edges: tuple[str, ...] = (f"{poly_cylinder}.e[240:259]",)
+    segmentation: FloodSegmentation = get_flood_segmentation(
+        poly_cylinder, border_edges
+    )
+    assert get_flood_segmentation(poly_cylinder, border_edges) is segmentation
+    # Seeds on either side of the border are in different regions
+    assert len(segmentation.get_vertex_region_ids((0, 399))) == 2
+    flooded_vertices: ComponentSet = segmentation.get_flood_vertices(
+        ComponentSet(poly_cylinder, "vtx", (399,))
+    )
+    flood_select(*border_edges, f"{poly_cylinder}.vtx[399]")
+    assert set(cmds.ls(selection=True, flatten=True)) == (
+        flooded_vertices.get_components()
+    )
+
+
+def _get_edges_between(
+    shape: str, x: float, minimum_z: float = -1.0, maximum_z: float = 1.0
+) -> tuple[str, ...]:
+    """
+    Get the edges of a shape lying along the line at `x`, between
+    `minimum_z` and `maximum_z`.
+    """
+    edges: list[str] = []
+    edge: str
+    for edge in cmds.ls(f"{shape}.e[*]", flatten=True):
+        positions: list[float] = cmds.xform(
+            edge, query=True, worldSpace=True, translation=True
+        )
+        if all(
+            abs(position - x) < 1e-6 for position in positions[0::3]
+        ) and all(
+            minimum_z - 1e-6 <= position <= maximum_z + 1e-6
+            for position in positions[2::3]
+        ):
+            edges.append(edge)
+    return tuple(edges)
+
+
+def _get_faces_center_x(shape: str) -> dict[str, float]:
+    """
+    Get the mean X coordinate of each face's vertices.
+    """
+    faces_center_x: dict[str, float] = {}
+    face: str
+    for face in cmds.ls(f"{shape}.f[*]", flatten=True):
+        positions: list[float] = cmds.xform(
+            face, query=True, worldSpace=True, translation=True
+        )
+        faces_center_x[face] = sum(positions[0::3]) / (len(positions) // 3)
+    return faces_center_x
+
+
+def test_flood_select_faces_open_border(poly_plane: str) -> None:
+    """
+    Test flooding faces within border edges which, together with the open
+    border of the mesh, enclose a region, and within border edges which do
+    not.
+    """
+    faces_center_x: dict[str, float] = _get_faces_center_x(poly_plane)
+    left_faces: set[str] = {
+        face for face, center_x in faces_center_x.items() if center_x < -0.2
+    }
+    right_faces: set[str] = set(faces_center_x) - left_faces
+    # The border edges cross the mesh from one open border to the other
+    border_edges: tuple[str, ...] = _get_edges_between(poly_plane, -0.2)
+    assert len(border_edges) == 10
+    faces: set[str]
+    for faces in (left_faces, right_faces):
+        flood_select(*border_edges, min(faces))
+        assert set(cmds.ls(selection=True, flatten=True)) == faces
+        cmds.select(clear=True)
+    # The border edges stop short of the open border, so do not enclose
+    # a region
+    flood_select(
+        *_get_edges_between(poly_plane, -0.2, maximum_z=0.2), min(left_faces)
+    )
+    assert set(cmds.ls(selection=True, flatten=True)) == set(faces_center_x)
+
+
+def test_flood_select_faces_non_manifold(poly_plane: str) -> None:
+    """
+    Test flooding faces across, and bounded by, a non-manifold edge shared
+    by three faces.
+    """
+    faces_center_x: dict[str, float] = _get_faces_center_x(poly_plane)
+    right_faces: set[str] = {
+        face for face, center_x in faces_center_x.items() if center_x > -0.2
+    }
+    non_manifold_edge: str = _get_edges_between(poly_plane, 0.2, 0.0, 0.1)[0]
+    cmds.polyExtrudeEdge(non_manifold_edge, translateY=0.2)
+    extruded_face: str = f"{poly_plane}.f[{len(faces_center_x)}]"
+    assert (
+        len(
+            cmds.ls(
+                *cmds.polyListComponentConversion(
+                    non_manifold_edge, fromEdge=True, toFace=True
+                ),
+                flatten=True,
+            )
+        )
+        == 3
+    )
+    border_edges: tuple[str, ...] = _get_edges_between(poly_plane, -0.2)
+    # All three faces on the non-manifold edge are in the same region
+    flood_select(*border_edges, extruded_face)
+    assert set(cmds.ls(selection=True, flatten=True)) == (
+        right_faces | {extruded_face}
+    )
+    cmds.select(clear=True)
+    flood_select(*border_edges, min(right_faces))
+    assert set(cmds.ls(selection=True, flatten=True)) == (
+        right_faces | {extruded_face}
+    )
+    cmds.select(clear=True)
+    # As a border edge, the non-manifold edge separates all three faces
+    flood_select(*border_edges, non_manifold_edge, extruded_face)
+    assert set(cmds.ls(selection=True, flatten=True)) == {extruded_face}
+    cmds.select(clear=True)
+    flood_select(*border_edges, non_manifold_edge, min(right_faces))
+    assert set(cmds.ls(selection=True, flatten=True)) == right_faces
+
+
 if __name__ == "__main__":
     pytest.main(["-s", "-vv", __file__])
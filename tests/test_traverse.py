@@ -1,6 +1,59 @@
+from __future__ import annotations
+
+from itertools import chain, permutations
+from random import Random
+from typing import Any, Callable, Iterable, Sequence
+
 import pytest
+from maya import cmds  # type: ignore
+from maya.api import OpenMaya  # type: ignore
 
-from maya_zen_tools._traverse import get_distance_between
+from maya_zen_tools import _traverse, options
+from maya_zen_tools._components import ComponentSet
+from maya_zen_tools._conversion import convert_components
+from maya_zen_tools._geometry import (
+    get_least_deviant_id,
+    get_path_parameters,
+    get_polyline_lengths,
+    get_projections,
+)
+from maya_zen_tools._nurbs import get_curve_points, get_surface_points
+from maya_zen_tools._plugin import set_uvs_positions, set_vertices_positions
+from maya_zen_tools._topology import (
+    EdgeIndex,
+    MeshTopology,
+    clear_topology_cache,
+    get_mesh_edge_index,
+    get_mesh_edge_lengths,
+    get_mesh_function_set,
+    get_mesh_topology,
+    get_mesh_uv_edge_lengths,
+    get_mesh_uv_shell_ids,
+    get_topology_cache_statistics,
+)
+from maya_zen_tools._traverse import (
+    _get_contiguous_segments,
+    add_shared_edge_vertices,
+    add_shared_face_edge_uvs,
+    add_shared_vertex_edges,
+    breadth_first_search_cache,
+    get_component_id,
+    get_distance_between,
+    get_hop_distances,
+    get_uv_position,
+    iter_edges_vertices,
+    iter_shortest_vertex_path,
+    iter_sorted_contiguous_edges,
+    iter_sorted_contiguous_vertices,
+    iter_uvs_positions,
+    iter_vertices_edges,
+    iter_vertices_positions,
+)
+from maya_zen_tools._ui import progress
+from maya_zen_tools.errors import (
+    NonLinearSelectionError,
+    OperationCancelledError,
+)
 
 
 def test_get_distance_between() -> None:
@@ -12,5 +65,963 @@ def test_get_distance_between() -> None:
     )
 
 
+def test_get_least_deviant_id() -> None:
+    positions: tuple[float, ...] = (0, 0, 0, 1, 1, 0, 1, 0.1, 0, 2, 0, 0)
+    assert (
+        get_least_deviant_id(positions, 3, (1, 2), (0, 0, 0), (2, 0, 0)) == 2
+    )
+    assert tuple(
+        get_projections(positions, 3, (1, 2, 3), (0, 0, 0), (2, 0, 0))
+    ) == pytest.approx((0.5, 0.5, 1.0))
+    assert tuple(
+        get_polyline_lengths(positions, 3, (0, 3, 1))
+    ) == pytest.approx((2.0, 1.4142135623730951))
+    assert tuple(
+        get_path_parameters((1, 1, 2, 3, 1, 5), (3, 2, 1), 2)
+    ) == pytest.approx((0, 0.5, 1, 2, 0, 1.5, 2, 0, 2))
+
+
+def test_curve_points() -> None:
+    """
+    Verify that sampling a rebuilt curve with `get_curve_points` matches the
+    `pointOnCurveInfo` and `pointMatrixMult` network it replaced.
+    """
+    curve_transform: str = cmds.curve(
+        point=((0, 0, 0), (1, 2, 0), (3, 3, 1), (4, 0, 0), (6, 1, 2)),
+        degree=3,
+    )
+    cmds.xform(curve_transform, translation=(1, -2, 3), rotation=(30, 45, 0))
+    curve_shape: str = cmds.listRelatives(curve_transform, shapes=True)[0]
+    rebuild_curve_node: str = cmds.createNode("rebuildCurve")
+    cmds.connectAttr(
+        f"{curve_shape}.worldSpace[0]", f"{rebuild_curve_node}.inputCurve"
+    )
+    cmds.setAttr(f"{rebuild_curve_node}.spans", 7)
+    cmds.setAttr(f"{rebuild_curve_node}.keepRange", 2)
+    point_on_curve_info: str = cmds.createNode("pointOnCurveInfo")
+    point_matrix_mult: str = cmds.createNode("pointMatrixMult")
+    cmds.connectAttr(
+        f"{rebuild_curve_node}.outputCurve",
+        f"{point_on_curve_info}.inputCurve",
+    )
+    cmds.connectAttr(
+        f"{curve_shape}.worldMatrix[0]", f"{point_matrix_mult}.inMatrix"
+    )
+    cmds.connectAttr(
+        f"{point_on_curve_info}.position", f"{point_matrix_mult}.inPoint"
+    )
+    parameters: tuple[float, ...] = tuple(
+        index * 7 / 20 for index in range(21)
+    )
+    expected: list[float] = []
+    parameter: float
+    for parameter in parameters:
+        cmds.setAttr(f"{point_on_curve_info}.parameter", parameter)
+        expected.extend(cmds.getAttr(f"{point_matrix_mult}.output")[0])
+    assert tuple(
+        chain.from_iterable(
+            get_curve_points(
+                f"{rebuild_curve_node}.outputCurve",
+                parameters,
+                f"{curve_shape}.worldMatrix[0]",
+            )
+        )
+    ) == pytest.approx(expected, abs=1e-6)
+
+
+def test_surface_points() -> None:
+    """
+    Verify that sampling a lofted and rebuilt surface with
+    `get_surface_points` matches a `pointOnSurfaceInfo` node.
+    """
+    loft: str = cmds.createNode("loft")
+    index: int
+    z: float
+    for index, z in enumerate((0, 1, 3, 4)):
+        curve_shape: str = cmds.listRelatives(
+            cmds.curve(
+                point=((0, 0, z), (1, z / 2, z), (2, 0.5, z), (3, 0, z)),
+                degree=1,
+            ),
+            shapes=True,
+        )[0]
+        cmds.connectAttr(
+            f"{curve_shape}.worldSpace[0]", f"{loft}.inputCurve[{index}]"
+        )
+    rebuild_surface: str = cmds.createNode("rebuildSurface")
+    cmds.connectAttr(
+        f"{loft}.outputSurface", f"{rebuild_surface}.inputSurface"
+    )
+    cmds.setAttr(f"{rebuild_surface}.spansU", 3)
+    cmds.setAttr(f"{rebuild_surface}.spansV", 3)
+    cmds.setAttr(f"{rebuild_surface}.keepRange", 2)
+    cmds.setAttr(f"{rebuild_surface}.endKnots", 1)
+    cmds.setAttr(f"{rebuild_surface}.direction", 0)
+    point_on_surface_info: str = cmds.createNode("pointOnSurfaceInfo")
+    cmds.connectAttr(
+        f"{rebuild_surface}.outputSurface",
+        f"{point_on_surface_info}.inputSurface",
+    )
+    parameters: tuple[tuple[float, float], ...] = tuple(
+        (u * 3 / 8, v * 3 / 6) for u in range(9) for v in range(7)
+    )
+    expected: list[float] = []
+    u: float
+    v: float
+    for u, v in parameters:
+        cmds.setAttr(f"{point_on_surface_info}.parameterU", u)
+        cmds.setAttr(f"{point_on_surface_info}.parameterV", v)
+        expected.extend(cmds.getAttr(f"{point_on_surface_info}.position")[0])
+    assert tuple(
+        chain.from_iterable(
+            get_surface_points(f"{rebuild_surface}.outputSurface", parameters)
+        )
+    ) == pytest.approx(expected, abs=1e-6)
+
+
+def _convert(components: set[str], **kwargs: bool) -> set[str]:
+    return set(
+        cmds.ls(
+            *cmds.polyListComponentConversion(*components, **kwargs),
+            flatten=True,
+        )
+    )
+
+
+def test_mesh_topology(poly_plane: str) -> None:
+    """
+    Verify that adjacency determined from a `MeshTopology` snapshot matches
+    adjacency determined by querying `maya.cmds`.
+    """
+    topology: MeshTopology = MeshTopology.from_shape(poly_plane)
+    # The edge table, read in one pass, matches per-edge queries
+    mesh: OpenMaya.MFnMesh = get_mesh_function_set(poly_plane)
+    edge_id: int
+    assert all(
+        topology.get_edge_vertex_ids(edge_id)
+        == tuple(mesh.getEdgeVertices(edge_id))
+        for edge_id in range(mesh.numEdges)
+    )
+    vertices: set[str] = {f"{poly_plane}.vtx[20]", f"{poly_plane}.vtx[58]"}
+    assert add_shared_edge_vertices(vertices, topology) == _convert(
+        _convert(vertices, fromVertex=True, toEdge=True),
+        fromEdge=True,
+        toVertex=True,
+    )
+    edges: set[str] = {f"{poly_plane}.e[36]", f"{poly_plane}.e[194]"}
+    assert add_shared_vertex_edges(edges, topology) == _convert(
+        _convert(edges, fromEdge=True, toVertex=True),
+        fromVertex=True,
+        toEdge=True,
+    )
+    uvs: set[str] = {f"{poly_plane}.map[20]", f"{poly_plane}.map[58]"}
+    assert add_shared_face_edge_uvs(uvs, topology) == _convert(
+        _convert(uvs, fromUV=True, toEdge=True), fromEdge=True, toUV=True
+    ) & _convert(
+        _convert(uvs, fromUV=True, toFace=True), fromFace=True, toUV=True
+    )
+    assert tuple(
+        iter_edges_vertices(
+            (
+                f"{poly_plane}.e[101]",
+                f"{poly_plane}.e[103]",
+                f"{poly_plane}.e[105]",
+            ),
+            topology,
+        )
+    ) == tuple(f"{poly_plane}.vtx[{vertex_id}]" for vertex_id in range(54, 58))
+
+
+def test_topology_cache(poly_plane: str) -> None:
+    """
+    Verify that cached topology snapshots are re-used, and are invalidated
+    when the mesh topology changes.
+    """
+    clear_topology_cache()
+    topology: MeshTopology = get_mesh_topology(poly_plane)
+    assert get_mesh_topology(poly_plane).vertex_count == topology.vertex_count
+    statistics: dict[str, int] = get_topology_cache_statistics()
+    assert statistics["misses"] >= 1
+    assert statistics["hits"] >= 1
+    assert statistics["entries"] == 1
+    cmds.polySubdivideFacet(poly_plane, divisions=1)
+    assert get_mesh_topology(poly_plane).vertex_count > topology.vertex_count
+    clear_topology_cache()
+    assert get_topology_cache_statistics()["entries"] == 0
+
+
+def test_topology_cache_uvs(poly_plane: str) -> None:
+    """
+    Verify that cached topology snapshots are invalidated when UVs are cut
+    or sewn, or the current UV set changes, without changing the number of
+    UVs.
+    """
+    clear_topology_cache()
+    topology: MeshTopology = get_mesh_topology(poly_plane)
+    # Interior edges with one vertex on the border split one UV when cut
+    border_vertex_ids: set[int] = {
+        vertex_id
+        for edge_id in range(topology.edge_count)
+        if len(topology.get_edge_face_ids(edge_id)) == 1
+        for vertex_id in topology.get_edge_vertex_ids(edge_id)
+    }
+    edge_id: int
+    vertex_id: int
+    edges: list[str] = [
+        f"{poly_plane}.e[{edge_id}]"
+        for edge_id in range(topology.edge_count)
+        if len(topology.get_edge_face_ids(edge_id)) == 2
+        and len(
+            border_vertex_ids.intersection(
+                topology.get_edge_vertex_ids(edge_id)
+            )
+        )
+        == 1
+    ]
+    cmds.polyUVSet(poly_plane, copy=True, uvSet="map1", newUVSet="other")
+    cmds.polyMapCut(edges[0])
+    cmds.polyUVSet(poly_plane, currentUVSet=True, uvSet="other")
+    cmds.polyMapCut(edges[-1])
+    cmds.polyUVSet(poly_plane, currentUVSet=True, uvSet="map1")
+    topology = get_mesh_topology(poly_plane)
+
+    def assert_current() -> None:
+        current: MeshTopology = get_mesh_topology(poly_plane)
+        assert (
+            current.face_uv_ids
+            == MeshTopology.from_shape(poly_plane).face_uv_ids
+            != topology.face_uv_ids
+        )
+
+    # Switching to a UV set with the same number of UVs
+    cmds.polyUVSet(poly_plane, currentUVSet=True, uvSet="other")
+    assert get_mesh_topology(poly_plane).uv_count == topology.uv_count
+    assert_current()
+    # Sewing and cutting
+    cmds.polyUVSet(poly_plane, currentUVSet=True, uvSet="map1")
+    assert get_mesh_topology(poly_plane).face_uv_ids == topology.face_uv_ids
+    cmds.polyMapSew(edges[0])
+    cmds.polyMapCut(edges[-1])
+    assert_current()
+
+
+def test_component_set() -> None:
+    """
+    Test `maya_zen_tools._components.ComponentSet` set operations and
+    component name formatting.
+    """
+    vertices: ComponentSet = ComponentSet("pPlane1", "vtx", (0, 1, 2, 5, 9))
+    other_vertices: ComponentSet = ComponentSet.from_components(
+        ("pPlane1.vtx[2:6]", "pPlane1.vtx[12]")
+    )
+    assert len(vertices) == 5
+    assert "pPlane1.vtx[9]" in vertices
+    assert "pPlane1.vtx[9]" not in other_vertices
+    assert list(vertices & other_vertices) == [2, 5]
+    assert list(vertices - other_vertices) == [0, 1, 9]
+    assert (vertices | other_vertices).get_compact_components() == (
+        "pPlane1.vtx[0:6]",
+        "pPlane1.vtx[9]",
+        "pPlane1.vtx[12]",
+    )
+    assert set(vertices.iter_components()) == {
+        "pPlane1.vtx[0]",
+        "pPlane1.vtx[1]",
+        "pPlane1.vtx[2]",
+        "pPlane1.vtx[5]",
+        "pPlane1.vtx[9]",
+    }
+
+
+def test_geometric_shortest_vertex_path(poly_sphere: str) -> None:
+    """
+    Verify that a geometric shortest path is connected, and is no longer than
+    the topological shortest path between the same vertices.
+    """
+
+    def get_path_length(vertices: tuple[str, ...]) -> float:
+        return get_distance_between(
+            *(cmds.pointPosition(vertex, world=True) for vertex in vertices)
+        )
+
+    start_vertex: str = f"{poly_sphere}.vtx[0]"
+    end_vertex: str = f"{poly_sphere}.vtx[215]"
+    topological_path: tuple[str, ...] = tuple(
+        iter_shortest_vertex_path(start_vertex, end_vertex)
+    )
+    geometric_path: tuple[str, ...] = tuple(
+        iter_shortest_vertex_path(
+            start_vertex, end_vertex, path_type=options.PathType.GEOMETRIC
+        )
+    )
+    assert geometric_path[0] == start_vertex
+    assert geometric_path[-1] == end_vertex
+    assert len(set(geometric_path)) == len(geometric_path)
+    index: int
+    for index in range(1, len(geometric_path)):
+        assert geometric_path[index - 1] in _convert(
+            _convert({geometric_path[index]}, fromVertex=True, toEdge=True),
+            fromEdge=True,
+            toVertex=True,
+        )
+    assert get_path_length(geometric_path) <= (
+        get_path_length(topological_path) + 1e-6
+    )
+
+
+def test_shortest_vertex_path(poly_plane: str) -> None:
+    """
+    Verify the shortest vertex path along an edge loop, and along a diagonal
+    (for which several paths share the fewest edges).
+    """
+    assert tuple(
+        iter_shortest_vertex_path(
+            f"{poly_plane}.vtx[53]", f"{poly_plane}.vtx[63]"
+        )
+    ) == tuple(f"{poly_plane}.vtx[{vertex_id}]" for vertex_id in range(53, 64))
+    assert (
+        len(
+            tuple(
+                iter_shortest_vertex_path(
+                    f"{poly_plane}.vtx[53]", f"{poly_plane}.vtx[77]"
+                )
+            )
+        )
+        == 5
+    )
+
+
+def test_shortest_vertex_path_ring(poly_cylinder: str) -> None:
+    """
+    Verify that the shortest path between opposite vertices on a ring of a
+    cylinder, for which two paths share the fewest edges, goes around the
+    ring.
+    """
+    start_vertex: str = f"{poly_cylinder}.vtx[200]"
+    start_position: tuple[float, ...] = tuple(cmds.pointPosition(start_vertex))
+    vertex: str
+    # Find the vertex opposite the start vertex, on the same ring
+    end_vertex: str = min(
+        cmds.ls(f"{poly_cylinder}.vtx[*]", flatten=True),
+        key=lambda vertex: get_distance_between(
+            (-start_position[0], start_position[1], -start_position[2]),
+            cmds.pointPosition(vertex),
+        ),
+    )
+    vertices: tuple[str, ...] = tuple(
+        iter_shortest_vertex_path(start_vertex, end_vertex)
+    )
+    assert vertices[0] == start_vertex
+    assert vertices[-1] == end_vertex
+    assert len(vertices) == 11
+    # The path must go around the ring, in either direction
+    assert {
+        round(cmds.pointPosition(vertex)[1], 6) for vertex in vertices
+    } == {round(start_position[1], 6)}
+    assert tuple(
+        iter_shortest_vertex_path(start_vertex, f"{poly_cylinder}.vtx[203]")
+    ) == tuple(
+        f"{poly_cylinder}.vtx[{vertex_id}]" for vertex_id in range(200, 204)
+    )
+
+
+def _iter_one_directional_shortest_vertex_path(
+    start_vertex: str, end_vertex: str
+) -> Iterable[str]:
+    """
+    Yield the vertices along the shortest path between two vertices as the
+    original one-directional breadth-first search did: growing rings of
+    vertices from each end in turn, then intersecting them.
+    """
+    start_vertex_rings: list[set[str]] = [{start_vertex}]
+    end_vertex_rings: list[set[str]] = [{end_vertex}]
+    vertices: set[str] = {start_vertex}
+    expanded_vertices: set[str]
+    while end_vertex not in vertices:
+        expanded_vertices = add_shared_edge_vertices(vertices)
+        start_vertex_rings.append(expanded_vertices - vertices)
+        vertices = expanded_vertices
+    vertices = {end_vertex}
+    while start_vertex not in vertices:
+        expanded_vertices = add_shared_edge_vertices(vertices)
+        end_vertex_rings.append(expanded_vertices - vertices)
+        vertices = expanded_vertices
+    start_position: tuple[float, ...] = tuple(cmds.pointPosition(start_vertex))
+    end_position: tuple[float, ...] = tuple(cmds.pointPosition(end_vertex))
+    start_vertex_ring: set[str]
+    end_vertex_ring: set[str]
+    vertex: str = ""
+    for start_vertex_ring, end_vertex_ring in zip(
+        start_vertex_rings, reversed(end_vertex_rings)
+    ):
+        ring_intersection: set[str] = start_vertex_ring & end_vertex_ring
+        if vertex and len(ring_intersection) > 1:
+            ring_intersection &= add_shared_edge_vertices({vertex})
+        # Equally deviant vertices are resolved in ID order
+        candidates: list[str] = sorted(ring_intersection, key=get_component_id)
+        deviations: list[float] = [
+            get_distance_between(
+                start_position, cmds.pointPosition(candidate), end_position
+            )
+            for candidate in candidates
+        ]
+        vertex = candidates[
+            next(
+                index
+                for index, deviation in enumerate(deviations)
+                if deviation <= min(deviations) + 1e-9
+            )
+        ]
+        yield vertex
+
+
+def test_bidirectional_shortest_vertex_path(poly_plane: str) -> None:
+    """
+    Verify that the bidirectional breadth-first search chooses the same
+    path as the original one-directional search, including diagonal paths
+    where many paths of equal length exist.
+    """
+    vertex_count: int = cmds.polyEvaluate(poly_plane, vertex=True)
+    start_vertex_id: int
+    end_vertex_id: int
+    for start_vertex_id, end_vertex_id in (
+        (53, 77),
+        (0, vertex_count - 1),
+        (9, vertex_count - 11),
+        (22, 86),
+        (2, 50),
+        (60, 13),
+    ):
+        start_vertex: str = f"{poly_plane}.vtx[{start_vertex_id}]"
+        end_vertex: str = f"{poly_plane}.vtx[{end_vertex_id}]"
+        assert tuple(iter_shortest_vertex_path(start_vertex, end_vertex)) == (
+            tuple(
+                _iter_one_directional_shortest_vertex_path(
+                    start_vertex, end_vertex
+                )
+            )
+        ), (start_vertex, end_vertex)
+
+
+def test_get_hop_distances(poly_plane: str) -> None:
+    """
+    Verify that hop distances are measured correctly, whether or not
+    breadth-first searches are being cached.
+    """
+    vertices: tuple[str, ...] = (
+        f"{poly_plane}.vtx[54]",
+        f"{poly_plane}.vtx[63]",
+        f"{poly_plane}.vtx[77]",
+    )
+    expected_distances: dict[str, int] = dict(zip(vertices, (1, 10, 4)))
+    assert (
+        get_hop_distances(f"{poly_plane}.vtx[53]", vertices)
+        == expected_distances
+    )
+    with breadth_first_search_cache():
+        assert get_hop_distances(f"{poly_plane}.vtx[53]", vertices[:1]) == {
+            vertices[0]: 1
+        }
+        # The cached search is resumed to find more distant vertices
+        assert (
+            get_hop_distances(f"{poly_plane}.vtx[53]", vertices)
+            == expected_distances
+        )
+        # The same search is used for any name of the same shape
+        shape: str = cmds.listRelatives(
+            poly_plane, shapes=True, fullPath=True
+        )[0]
+        assert get_hop_distances(
+            f"{shape}.vtx[53]", (f"{shape}.vtx[54]",)
+        ) == {f"{shape}.vtx[54]": 1}
+        assert len(_traverse._breadth_first_searches or ()) == 1
+        # A new search is performed once the topology has changed
+        cmds.polyTriangulate(poly_plane)
+        get_hop_distances(f"{poly_plane}.vtx[53]", vertices)
+        assert len(_traverse._breadth_first_searches or ()) == 2
+
+
+def _get_incrementally_merged_segments(  # noqa: C901
+    component_ids: Iterable[int],
+    get_adjacent_ids: Callable[[int], Iterable[int]],
+) -> list[list[int]]:
+    """
+    Organize components into contiguous segments as `iter_contiguous_edges`
+    originally did: taking components in the order given (originally,
+    `set.pop()` order), and adding each to the end of any segment it is
+    adjacent to, joining segments where a component is adjacent to two.
+    """
+    segments: list[list[int]] = []
+    segment: list[int]
+    component_id: int
+    for component_id in dict.fromkeys(component_ids):
+        adjacent_ids: set[int] = set(get_adjacent_ids(component_id))
+        adjacent_ids.discard(component_id)
+        found: int | None = None
+        index: int
+        for index, segment in enumerate(segments):
+            if not segment:
+                continue
+            if segment[0] in adjacent_ids:
+                if found is None:
+                    segment.insert(0, component_id)
+                    found = index
+                    continue
+                if component_id == segments[found][-1]:
+                    segments[found].extend(segment)
+                else:
+                    segments[found] = list(reversed(segment)) + segments[found]
+                segment.clear()
+                break
+            if segment[-1] in adjacent_ids:
+                if found is None:
+                    segment.append(component_id)
+                    found = index
+                    continue
+                if component_id == segments[found][-1]:
+                    segments[found].extend(reversed(segment))
+                else:
+                    segments[found] = list(segment) + segments[found]
+                segment.clear()
+                break
+        if found is None:
+            segments.append([component_id])
+    return list(filter(None, segments))
+
+
+def _get_canonical_segments(
+    segments: Iterable[Sequence[int]],
+    get_adjacent_ids: Callable[[int], Iterable[int]],
+) -> list[tuple[int, ...]]:
+    """
+    Get a form of the given segments which does not depend on the order in
+    which segments are listed, the direction in which each is ordered, or
+    (for closed loops) which component each starts with.
+    """
+    canonical_segments: list[tuple[int, ...]] = []
+    segment: Sequence[int]
+    for segment in segments:
+        orderings: list[tuple[int, ...]] = [
+            tuple(segment),
+            tuple(reversed(segment)),
+        ]
+        if len(segment) > 2 and segment[0] in get_adjacent_ids(segment[-1]):
+            # This is a closed loop
+            orderings = [
+                ordering[index:] + ordering[:index]
+                for ordering in orderings
+                for index in range(len(ordering))
+            ]
+        canonical_segments.append(min(orderings))
+    return sorted(canonical_segments)
+
+
+# Edges of a 6 x 6 vertex grid: 30 horizontal edges (0-29), each connecting
+# vertex `n` to `n + 1`, followed by 30 vertical edges (30-59), each
+# connecting vertex `n` to `n + 6`
+_GRID_EDGES_VERTEX_IDS: tuple[tuple[int, int], ...] = (
+    *(
+        (row * 6 + column, row * 6 + column + 1)
+        for row in range(6)
+        for column in range(5)
+    ),
+    *((vertex_id, vertex_id + 6) for vertex_id in range(30)),
+)
+_GRID_VERTEX_EDGE_IDS: dict[int, tuple[int, ...]] = {
+    vertex_id: tuple(
+        edge_id
+        for edge_id, vertex_ids in enumerate(_GRID_EDGES_VERTEX_IDS)
+        if vertex_id in vertex_ids
+    )
+    for vertex_id in range(36)
+}
+
+
+def _get_grid_adjacent_edge_ids(edge_id: int) -> Iterable[int]:
+    """
+    Get the IDs of grid edges sharing a vertex with an edge (including the
+    edge itself).
+    """
+    return chain.from_iterable(
+        map(_GRID_VERTEX_EDGE_IDS.__getitem__, _GRID_EDGES_VERTEX_IDS[edge_id])
+    )
+
+
+def _is_branching(edge_ids: Sequence[int]) -> bool:
+    """
+    Determine whether any of the given grid edges is adjacent to more than
+    two of the others.
+    """
+    edge_id: int
+    return any(
+        len(set(_get_grid_adjacent_edge_ids(edge_id)) & set(edge_ids)) > 3
+        for edge_id in edge_ids
+    )
+
+
+def test_contiguous_segments() -> None:
+    """
+    Verify that grouping edges into segments using a disjoint-set forest
+    yields the same chains and closed loops as the original incremental
+    merge, regardless of the order in which it took the edges.
+    """
+    random: Random = Random(0)
+
+    def assert_merged(edge_ids: Sequence[int]) -> None:
+        segments: list[tuple[int, ...]] = _get_canonical_segments(
+            _get_contiguous_segments(edge_ids, _get_grid_adjacent_edge_ids),
+            _get_grid_adjacent_edge_ids,
+        )
+        shuffled_edge_ids: list[int] = list(edge_ids)
+        for _ in range(4):
+            random.shuffle(shuffled_edge_ids)
+            assert segments == _get_canonical_segments(
+                _get_incrementally_merged_segments(
+                    shuffled_edge_ids, _get_grid_adjacent_edge_ids
+                ),
+                _get_grid_adjacent_edge_ids,
+            ), shuffled_edge_ids
+
+    edge_ids: tuple[int, ...]
+    for edge_ids in (
+        # A chain
+        (6, 7, 8),
+        # Chains touching at a single vertex, end to end (an "L")
+        (5, 6, 38, 44),
+        # A closed loop
+        (6, 11, 37, 38),
+        # Disjoint chains
+        (0, 1, 3, 4, 42, 48),
+    ):
+        assert not _is_branching(edge_ids)
+        assert_merged(edge_ids)
+    for _ in range(2000):
+        edge_ids = tuple(random.sample(range(60), random.randint(1, 24)))
+        if not _is_branching(edge_ids):
+            assert_merged(edge_ids)
+
+
+def test_contiguous_branching_segments() -> None:
+    """
+    Verify that groups of edges which branch are split into contiguous
+    chains, the same way regardless of the order in which edges are given.
+    """
+    random: Random = Random(0)
+    edge_ids: tuple[int, ...]
+    expected_segments: list[list[int]]
+    for edge_ids, expected_segments in (
+        # Chains touching at a single vertex, crossing (a "+")
+        ((11, 12, 38, 44), [[11, 12, 38, 44]]),
+        # A chain touching another at a single vertex, mid-way (a "T")
+        ((10, 11, 12, 13, 38), [[10, 11, 12, 13], [38]]),
+        # A closed loop with a tail
+        ((6, 11, 37, 38, 44, 50), [[50, 44, 11, 37, 6, 38]]),
+    ):
+        assert _is_branching(edge_ids)
+        for _ in range(4):
+            assert (
+                _get_contiguous_segments(
+                    random.sample(edge_ids, len(edge_ids)),
+                    _get_grid_adjacent_edge_ids,
+                )
+                == expected_segments
+            ), edge_ids
+    segments: list[list[int]]
+    segment: list[int]
+    edge_id: int
+    next_edge_id: int
+    for _ in range(2000):
+        edge_ids = tuple(random.sample(range(60), random.randint(1, 24)))
+        if not _is_branching(edge_ids):
+            continue
+        segments = _get_contiguous_segments(
+            edge_ids, _get_grid_adjacent_edge_ids
+        )
+        # Every edge is in exactly one segment
+        assert sorted(chain.from_iterable(segments)) == sorted(edge_ids)
+        for segment in segments:
+            for edge_id, next_edge_id in zip(segment, segment[1:]):
+                assert next_edge_id in set(
+                    _get_grid_adjacent_edge_ids(edge_id)
+                ), edge_ids
+
+
+def test_iter_sorted_contiguous_components(poly_plane: str) -> None:
+    """
+    Verify that contiguous vertices and edges are sorted from one end to the
+    other, and that branching vertices raise an error.
+    """
+    vertices: tuple[str, ...] = tuple(
+        f"{poly_plane}.vtx[{vertex_id}]" for vertex_id in range(53, 64)
+    )
+    sorted_vertices: tuple[str, ...] = tuple(
+        iter_sorted_contiguous_vertices(sorted(vertices, reverse=True))
+    )
+    assert sorted_vertices in (vertices, tuple(reversed(vertices)))
+    edges: tuple[str, ...] = tuple(iter_vertices_edges(vertices))
+    sorted_edges: tuple[str, ...] = tuple(
+        iter_sorted_contiguous_edges(sorted(edges))
+    )
+    assert sorted_edges in (edges, tuple(reversed(edges)))
+    # A vertex adjacent to the middle of the chain creates a branch
+    with pytest.raises(NonLinearSelectionError):
+        tuple(
+            iter_sorted_contiguous_vertices(
+                (*vertices, f"{poly_plane}.vtx[69]")
+            )
+        )
+
+
+def test_mesh_edge_index(poly_plane: str) -> None:
+    """
+    Verify that the edge ring and edge loop index agrees with Maya's own
+    ring and loop queries.
+    """
+    edge_index: EdgeIndex = get_mesh_edge_index(poly_plane)
+    edge_count: int = cmds.polyEvaluate(poly_plane, edge=True)
+    edge_id: int
+    for edge_id in range(0, edge_count, 7):
+        assert set(edge_index.rings[edge_index.ring_ids[edge_id]]) == set(
+            cmds.polySelect(poly_plane, edgeRing=edge_id, query=True)
+        )
+        assert set(edge_index.loops[edge_index.loop_ids[edge_id]]) == set(
+            cmds.polySelect(poly_plane, edgeLoop=edge_id, query=True)
+        )
+    ring: tuple[int, ...] = tuple(edge_index.rings[edge_index.ring_ids[0]])
+    assert edge_index.get_ring_path(ring[-1], ring[1]) == tuple(
+        reversed(ring[1:])
+    )
+    assert (
+        edge_index.get_loop_path(
+            0, edge_index.loops[edge_index.loop_ids[0]][0]
+        )
+        is not None
+    )
+
+
+def test_mesh_uv_shell_ids(poly_plane: str) -> None:
+    """
+    Verify that UV shell labels agree with Maya's, after cutting the plane's
+    UVs in two along a row of edges spanning its width.
+    """
+    cmds.polyMapCut(
+        *iter_vertices_edges(
+            f"{poly_plane}.vtx[{vertex_id}]" for vertex_id in range(53, 64)
+        ),
+        constructionHistory=False,
+    )
+    shell_ids: tuple[int, ...] = tuple(get_mesh_uv_shell_ids(poly_plane))
+    assert set(shell_ids) == {0, 1}
+    maya_shell_ids: tuple[int, ...] = tuple(
+        get_mesh_function_set(poly_plane).getUvShellsIds()[1]
+    )
+    # Shells may be numbered differently, but must group the same UVs
+    assert len(set(zip(shell_ids, maya_shell_ids))) == 2
+
+
+def test_progress_time_budget(poly_plane: str) -> None:
+    """
+    Verify that a traversal is cancelled when its time budget is exceeded.
+    """
+    with pytest.raises(OperationCancelledError), progress(
+        "Test", budget=1e-9, interval=1
+    ):
+        get_hop_distances(f"{poly_plane}.vtx[0]", (f"{poly_plane}.vtx[100]",))
+    # Outside of a progress context, traversals are never cancelled
+    assert get_hop_distances(
+        f"{poly_plane}.vtx[0]", (f"{poly_plane}.vtx[100]",)
+    )
+
+
+def test_progress_cancellation(
+    poly_plane: str, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """
+    Verify that a traversal is cancelled when the user cancels the progress
+    window, and that the progress window is closed afterward.
+    """
+    progress_window_calls: list[dict[str, Any]] = []
+
+    def progress_window(**kwargs: Any) -> bool:
+        progress_window_calls.append(kwargs)
+        # The user has pressed "Esc"
+        return bool(kwargs.get("query") and kwargs.get("isCancelled"))
+
+    about: Callable[..., Any] = cmds.about
+    # Simulate Maya's UI being available
+    monkeypatch.setattr(
+        cmds,
+        "about",
+        lambda **kwargs: False if kwargs.get("batch") else about(**kwargs),
+    )
+    monkeypatch.setattr(cmds, "progressWindow", progress_window)
+    with pytest.raises(OperationCancelledError), progress(
+        "Test", budget=0, interval=1
+    ):
+        get_hop_distances(f"{poly_plane}.vtx[0]", (f"{poly_plane}.vtx[100]",))
+    assert progress_window_calls[0]["isInterruptable"]
+    assert {"query": True, "isCancelled": True} in progress_window_calls
+    assert progress_window_calls[-1] == {"endProgress": True}
+
+
+def test_bulk_positions(poly_sphere: str) -> None:
+    """
+    Verify that positions read in bulk match those queried per component,
+    in world and object space.
+    """
+    cmds.move(1, 2, 3, poly_sphere, relative=True)
+    vertices: tuple[str, ...] = tuple(
+        f"{poly_sphere}.vtx[{vertex_id}]" for vertex_id in range(0, 382, 20)
+    )
+    vertex: str
+    assert tuple(
+        chain.from_iterable(iter_vertices_positions(vertices))
+    ) == pytest.approx(
+        tuple(chain.from_iterable(map(cmds.pointPosition, vertices)))
+    )
+    assert tuple(
+        chain.from_iterable(
+            iter_vertices_positions(vertices, world_space=False)
+        )
+    ) == pytest.approx(
+        tuple(
+            chain.from_iterable(
+                cmds.pointPosition(vertex, local=True) for vertex in vertices
+            )
+        )
+    )
+    uv: str
+    uvs: tuple[str, ...] = tuple(
+        f"{poly_sphere}.map[{uv_id}]" for uv_id in range(0, 439, 20)
+    )
+    assert tuple(chain.from_iterable(iter_uvs_positions(uvs))) == (
+        pytest.approx(
+            tuple(
+                chain.from_iterable(
+                    cmds.polyEditUV(uv, query=True) for uv in uvs
+                )
+            )
+        )
+    )
+
+
+def test_set_positions(poly_sphere: str) -> None:
+    """
+    Verify that vertex and UV positions are written in one undoable
+    operation, and restored on undo.
+    """
+    cmds.delete(poly_sphere, constructionHistory=True)
+    vertices: tuple[str, ...] = tuple(
+        f"{poly_sphere}.vtx[{vertex_id}]" for vertex_id in range(0, 382, 20)
+    )
+    uvs: tuple[str, ...] = tuple(
+        f"{poly_sphere}.map[{uv_id}]" for uv_id in range(0, 439, 20)
+    )
+    original_vertices_positions: tuple[float, ...] = tuple(
+        chain.from_iterable(map(cmds.pointPosition, vertices))
+    )
+    original_uvs_positions: tuple[float, ...] = tuple(
+        chain.from_iterable(map(get_uv_position, uvs))
+    )
+    index: int
+    cmds.undoInfo(state=True)
+    set_vertices_positions(
+        (vertex, (index, index, index))
+        for index, vertex in enumerate(vertices)
+    )
+    set_uvs_positions(
+        (uv, (index / 100, index / 100)) for index, uv in enumerate(uvs)
+    )
+    assert tuple(
+        chain.from_iterable(map(cmds.pointPosition, vertices))
+    ) == pytest.approx(
+        tuple(
+            chain.from_iterable((index,) * 3 for index in range(len(vertices)))
+        )
+    )
+    assert tuple(
+        chain.from_iterable(cmds.polyEditUV(uv, query=True) for uv in uvs)
+    ) == pytest.approx(
+        tuple(
+            chain.from_iterable(
+                (index / 100,) * 2 for index in range(len(uvs))
+            )
+        )
+    )
+    cmds.undo()
+    cmds.undo()
+    assert tuple(
+        chain.from_iterable(map(cmds.pointPosition, vertices))
+    ) == pytest.approx(original_vertices_positions)
+    assert tuple(
+        chain.from_iterable(cmds.polyEditUV(uv, query=True) for uv in uvs)
+    ) == pytest.approx(original_uvs_positions)
+
+
+def test_mesh_edge_lengths(poly_sphere: str) -> None:
+    """
+    Verify that edge lengths computed from bulk positions match those
+    measured per edge, and that UV edge lengths are measured in UV space.
+    """
+    edge_ids: range = range(0, 780, 40)
+    edge_id: int
+    assert tuple(
+        get_mesh_edge_lengths(poly_sphere)[edge_id] for edge_id in edge_ids
+    ) == pytest.approx(
+        tuple(
+            cmds.arclen(f"{poly_sphere}.e[{edge_id}]") for edge_id in edge_ids
+        )
+    )
+    topology: MeshTopology = get_mesh_topology(poly_sphere)
+    uv_edge_lengths: Sequence[float] = get_mesh_uv_edge_lengths(poly_sphere)
+    uv_id: int = 21
+    other_uv_id: int
+    index: int
+    for index, other_uv_id in enumerate(
+        topology.get_uv_uv_ids(uv_id), topology.uv_uv_offsets[uv_id]
+    ):
+        assert uv_edge_lengths[index] == pytest.approx(
+            get_distance_between(
+                get_uv_position(f"{poly_sphere}.map[{uv_id}]"),
+                get_uv_position(f"{poly_sphere}.map[{other_uv_id}]"),
+            )
+        )
+
+
+def test_convert_components(poly_plane: str) -> None:
+    """
+    Verify that components converted from topology arrays match those
+    converted by `cmds.polyListComponentConversion`.
+    """
+    components: dict[str, set[str]] = {
+        "vtx": {f"{poly_plane}.vtx[{index}]" for index in (20, 21, 31, 32)},
+        "e": {f"{poly_plane}.e[{index}]" for index in (36, 37, 56, 194)},
+        "f": {f"{poly_plane}.f[{index}]" for index in (10, 11, 20, 21)},
+        "map": {f"{poly_plane}.map[{index}]" for index in (20, 21, 31, 32)},
+    }
+    flags: dict[str, str] = {
+        "vtx": "Vertex",
+        "e": "Edge",
+        "f": "Face",
+        "map": "UV",
+    }
+    from_type: str
+    to_type: str
+    for from_type, to_type in permutations(components, 2):
+        for internal in (False, True):
+            assert set(
+                convert_components(
+                    components[from_type], to_type, internal=internal
+                )
+            ) == _convert(
+                components[from_type],
+                **{
+                    f"from{flags[from_type]}": True,
+                    f"to{flags[to_type]}": True,
+                    "internal": internal,
+                },
+            ), (from_type, to_type, internal)
+
+
 if __name__ == "__main__":
     pytest.main(["-s", "-vv", __file__])